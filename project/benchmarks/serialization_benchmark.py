@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark the API's fast JSON path against FastAPI's default encoder
+
+Run from the project root:
+    python benchmarks/serialization_benchmark.py
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.encoders import jsonable_encoder
+
+from src.api.serialization import dumps
+from src.data.question_bank import QUESTION_BANK
+from src.models.compact_session import CompactSession
+from src.models.interview_models import Answer, InterviewSession
+from src.utils.feedback_generator import FeedbackGenerator
+
+def build_results_payload(question_count: int) -> dict:
+    """Build a /results-shaped payload for a finished session"""
+    questions = (QUESTION_BANK * (question_count // len(QUESTION_BANK) + 1))[:question_count]
+    session = InterviewSession(
+        id="session_benchmark",
+        job_role="Software Engineer",
+        difficulty="intermediate",
+        type="mixed",
+        questions=questions
+    )
+    for question in questions:
+        answer = Answer(
+            question_id=question.id,
+            text="In my last project I implemented a caching layer and improved latency. " * 5,
+            time_spent=150,
+            confidence=70
+        )
+        answer.feedback = FeedbackGenerator.generate_feedback(answer, question)
+        session.record_answer(answer, question)
+
+    full_session = CompactSession.from_session(session).to_session()
+    return {
+        "session": full_session,
+        "overall_score": full_session.aggregates.average,
+        "summary": full_session.aggregates.summary(),
+        "detailed_feedback": [
+            {"question": full_session.get_question(a.question_id), "answer": a, "feedback": a.feedback}
+            for a in full_session.answers
+        ]
+    }
+
+def main():
+    for question_count in (5, 20, 100):
+        payload = build_results_payload(question_count)
+        assert json.loads(dumps(payload)) == json.loads(json.dumps(jsonable_encoder(payload)))
+
+        runs = max(20, 2000 // question_count)
+        default = timeit.timeit(lambda: json.dumps(jsonable_encoder(payload)).encode(), number=runs)
+        fast = timeit.timeit(lambda: dumps(payload), number=runs)
+        print(
+            f"{question_count:>4} answers: default {default / runs * 1e6:9.1f} us  "
+            f"fast {fast / runs * 1e6:8.1f} us  speedup {default / fast:5.1f}x"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Check that the Python and TypeScript feedback generators agree on the shared rules
+
+Scores a deterministic set of answers with FeedbackGenerator and with
+src/utils/feedbackGenerator.ts (bundled with esbuild and run with node)
+and reports any case
+where the two disagree. Exits non-zero on a mismatch.
+
+Some cases answer bank questions that have reference answers and key
+points. Reference coverage is scored on the server only, so for those the
+TypeScript result is compared with the Python score before the reference
+adjustment, and the adjustment is reported separately.
+
+Run from the project root (after ``npm ci``, which provides esbuild); the
+test suite runs the same check in tests/test_feedback_parity.py:
+    python scripts/check_feedback_parity.py [--cases 500]
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.question_bank import current_snapshot
+from src.models.interview_models import Answer, AnswerFormat, DifficultyLevel, InterviewType, Question
+from src.utils.feedback_generator import FeedbackGenerator
+from src.utils.feedback_rules import FEEDBACK_RULES, FEEDBACK_RULES_VERSION
+
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..')
+ESBUILD = os.path.join(PROJECT_ROOT, "node_modules", ".bin", "esbuild")
+FILLER = "the team and I worked on it over a few weeks while also handling support".split()
+
+def build_cases(count: int, seed: int = 0) -> list:
+    """Answers around every threshold in the rules: lengths, keyword tiers, STAR parts, confidence and time"""
+    rng = random.Random(seed)
+    keywords = FEEDBACK_RULES.keywords.terms + [k for ks in FEEDBACK_RULES.star.components.values() for k in ks]
+    length = FEEDBACK_RULES.length
+    lengths = [0, 1, length.min_words - 1, length.min_words, 60, length.max_words, length.max_words + 1]
+
+    referenced = [q for q in current_snapshot().questions if q.reference_answers or q.key_points]
+    cases = []
+    for i in range(count):
+        words = [rng.choice(FILLER) for _ in range(rng.choice(lengths))]
+        for _ in range(rng.randint(0, 6)):
+            if words:
+                words[rng.randrange(len(words))] = rng.choice(keywords).upper() if rng.random() < 0.2 else rng.choice(keywords)
+        time_limit = rng.choice([90, 180, 300])
+        bank_question = rng.choice(referenced) if referenced and rng.random() < 0.25 else None
+        if bank_question is not None:
+            # Mix in the question's own key points so the reference adjustment actually fires
+            words += rng.sample(bank_question.key_points, min(len(bank_question.key_points), rng.randint(0, 3)))
+        cases.append({
+            "questionId": bank_question.id if bank_question else None,
+            "text": rng.choice([" ", "  ", "\n"]).join(words),
+            "timeSpent": rng.choice([0, FEEDBACK_RULES.time.min_seconds - 1, FEEDBACK_RULES.time.min_seconds,
+                                     time_limit, time_limit + 1]),
+            "confidence": rng.choice([0, 49, 50, 70, 80, 81, 100]),
+            "expectedFormat": rng.choice([None, "star", "technical"]),
+            "timeLimit": time_limit,
+        })
+    return cases
+
+def python_feedback(case: dict, with_references: bool = False) -> dict:
+    """Server feedback; without ``with_references`` the question's references are left out, as in the frontend"""
+    question = Question(
+        id="parity", text="", type=InterviewType.MIXED, difficulty=DifficultyLevel.INTERMEDIATE,
+        category="Parity", time_limit=case["timeLimit"],
+        expected_answer_format=AnswerFormat(case["expectedFormat"]) if case["expectedFormat"] else None
+    )
+    if with_references:
+        bank_question = current_snapshot().get(case["questionId"])
+        question = question.model_copy(update={
+            "id": bank_question.id,
+            "reference_answers": bank_question.reference_answers,
+            "key_points": bank_question.key_points,
+        })
+    answer = Answer(question_id=question.id, text=case["text"], time_spent=case["timeSpent"], confidence=case["confidence"])
+    feedback = FeedbackGenerator.generate_feedback(answer, question)
+    return {
+        "score": feedback.score,
+        "strengths": feedback.strengths,
+        "improvements": feedback.improvements,
+        "starMethodCompliance": feedback.star_method_compliance,
+        "suggestions": feedback.suggestions,
+        "overallAssessment": feedback.overall_assessment,
+    }
+
+def typescript_unavailable() -> Optional[str]:
+    """Why the TypeScript generator cannot be run here, or None if it can"""
+    if shutil.which("node") is None:
+        return "node not found; install Node.js to run the TypeScript generator"
+    if not os.path.exists(ESBUILD):
+        return "esbuild not found; run `npm ci` in the project root first"
+    return None
+
+def typescript_feedback(cases: list) -> list:
+    with tempfile.TemporaryDirectory() as build_dir:
+        bundle = os.path.join(build_dir, "feedbackParity.cjs")
+        subprocess.run(
+            [ESBUILD, os.path.join("scripts", "feedbackParity.ts"), "--bundle", "--platform=node",
+             "--format=cjs", "--log-level=error", f"--outfile={bundle}"],
+            cwd=PROJECT_ROOT, check=True
+        )
+        result = subprocess.run(
+            ["node", bundle], input=json.dumps(cases), capture_output=True, text=True, cwd=PROJECT_ROOT, check=True
+        )
+    return [{"starMethodCompliance": None, **feedback} for feedback in json.loads(result.stdout)]
+
+def compare(cases: list) -> tuple:
+    """Cases where the generators disagree, and how many bank-question cases the reference adjustment changed"""
+    expected = [python_feedback(case) for case in cases]
+    actual = typescript_feedback(cases)
+    mismatches = [(case, e, a) for case, e, a in zip(cases, expected, actual) if e != a]
+    bank_cases = [(case, e) for case, e in zip(cases, expected) if case["questionId"]]
+    adjusted = sum(python_feedback(case, with_references=True) != e for case, e in bank_cases)
+    return mismatches, adjusted, len(bank_cases)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    reason = typescript_unavailable()
+    if reason:
+        sys.exit(reason)
+
+    cases = build_cases(args.cases, args.seed)
+    mismatches, adjusted, bank_cases = compare(cases)
+    for case, e, a in mismatches[:5]:
+        print(f"MISMATCH {json.dumps(case)}\n  python:     {json.dumps(e)}\n  typescript: {json.dumps(a)}")
+    print(f"rules {FEEDBACK_RULES_VERSION} (v{FEEDBACK_RULES.version}): "
+          f"{len(cases) - len(mismatches)}/{len(cases)} cases match")
+    print(f"reference adjustment (server only): changed {adjusted} of {bank_cases} bank-question cases")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Write the built-in question bank to a JSON file for QUESTION_BANK_PATH
+
+The file is the starting point for editing the bank without a deploy: the
+API reloads it when it changes, or on POST /admin/question-bank/reload.
+
+Run from the project root:
+    python scripts/export_question_bank.py question_bank.json
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.bank_snapshot import QuestionBankSnapshot
+from src.data.question_bank import QUESTION_BANK
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path")
+    args = parser.parse_args()
+
+    snapshot = QuestionBankSnapshot(QUESTION_BANK)
+    snapshot.to_file(args.path)
+    print(f"Wrote {len(snapshot.questions)} questions (version {snapshot.version}) to {args.path}")
+
+if __name__ == "__main__":
+    main()
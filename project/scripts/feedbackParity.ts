@@ -0,0 +1,26 @@
+// Scores parity cases with the frontend generator: JSON cases on stdin, JSON feedback on stdout.
+// Driven by scripts/check_feedback_parity.py.
+import { generateFeedback } from '../src/utils/feedbackGenerator';
+
+interface ParityCase {
+  text: string;
+  timeSpent: number;
+  confidence: number;
+  expectedFormat?: string;
+  timeLimit: number;
+}
+
+let input = '';
+process.stdin.on('data', chunk => (input += chunk));
+process.stdin.on('end', () => {
+  const cases: ParityCase[] = JSON.parse(input);
+  const results = cases.map(c =>
+    generateFeedback(
+      { questionId: 'parity', text: c.text, timeSpent: c.timeSpent, confidence: c.confidence, feedback: {} as never },
+      '',
+      c.expectedFormat,
+      c.timeLimit
+    )
+  );
+  process.stdout.write(JSON.stringify(results));
+});
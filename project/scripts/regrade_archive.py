@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Re-grade archived sessions with the current feedback rules
+
+Streams a session archive (SESSION_ARCHIVE_PATH), scores every archived
+answer again with FeedbackGenerator against the question as it was asked,
+and reports how the scores move. Memory stays flat however large the
+archive is.
+
+Run from the project root:
+    python scripts/regrade_archive.py session_archive.ipsa [--limit 100000]
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.session_archive import iter_sessions
+from src.utils.feedback_generator import FeedbackGenerator
+from src.utils.feedback_rules import FEEDBACK_RULES_VERSION
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--limit", type=int, default=None, help="stop after this many sessions")
+    args = parser.parse_args()
+
+    sessions = answers = changed = 0
+    old_total = new_total = 0
+    for session in iter_sessions(args.path):
+        if args.limit is not None and sessions >= args.limit:
+            break
+        sessions += 1
+        for position in range(len(session.answers)):
+            answer = session.answers.answer_at(position)
+            question = session.get_question(answer.question_id)
+            if answer.feedback is None or question is None:
+                continue
+            score = FeedbackGenerator.generate_feedback(answer, question).score
+            answers += 1
+            old_total += answer.feedback.score
+            new_total += score
+            changed += score != answer.feedback.score
+
+    print(f"rules {FEEDBACK_RULES_VERSION}: {sessions} sessions, {answers} scored answers")
+    if answers:
+        print(f"average score {old_total / answers:.1f} -> {new_total / answers:.1f}; "
+              f"{changed} answers ({changed / answers:.1%}) changed")
+
+if __name__ == "__main__":
+    main()
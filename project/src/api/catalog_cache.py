@@ -0,0 +1,139 @@
+import asyncio
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from src.api.serialization import dumps
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli variant is optional
+    brotli = None
+
+# Preferred order when the client accepts several encodings
+ENCODING_PREFERENCE = ("br", "gzip", "identity")
+# Cached catalogs are compressed once at the highest levels; one-off responses cheaply
+CACHED_LEVELS = {"gzip": 9, "br": 11}
+ONE_OFF_LEVELS = {"gzip": 5, "br": 4}
+
+
+def _compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class EncodedCatalog:
+    """A read-only response with its compressed variants"""
+
+    __slots__ = ("digest", "bodies")
+
+    def __init__(self, body: bytes, encodings: Optional[Dict[str, int]] = None):
+        """Compress into every encoding in ``encodings`` (name -> level); all supported ones by default"""
+        self.digest = hashlib.sha256(body).hexdigest()[:32]
+        self.bodies: Dict[str, bytes] = {"identity": body}
+        for encoding, level in (CACHED_LEVELS if encodings is None else encodings).items():
+            if encoding != "br" or brotli is not None:
+                self.bodies[encoding] = _compress(body, encoding, level)
+
+    def etag(self, encoding: str) -> str:
+        # Strong ETags must differ between encodings of the same content
+        return f'"{self.digest}"' if encoding == "identity" else f'"{self.digest}-{encoding}"'
+
+    def matches(self, if_none_match: str) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag.strip('"').split("-", 1)[0] == self.digest:
+                return True
+        return False
+
+
+def _negotiate(accept_encoding: str, available: Dict[str, bytes]) -> str:
+    """Pick the best available encoding the client accepts"""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+
+    for encoding in ENCODING_PREFERENCE:
+        if encoding in available and accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return "identity"
+
+
+class CatalogCache:
+    """Bounded LRU of pre-encoded catalog responses.
+
+    Only fixed catalogs (a handful per content version) belong in the cache;
+    keys should include the content version (e.g. the question bank version)
+    so a content change naturally produces new entries. Ad-hoc responses such
+    as filtered or paged queries are served with ``cacheable=False``: they get
+    ETags too, but are compressed once, cheaply, in the negotiated encoding.
+    """
+
+    def __init__(self, max_entries: int = 256, max_age: int = 300):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._entries: "OrderedDict[Hashable, EncodedCatalog]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "not_modified": 0, "uncached": 0}
+
+    async def get(self, key: Hashable, build: Callable[[], Any]) -> EncodedCatalog:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._stats["hits"] += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self._stats["misses"] += 1
+        # Maximum-level compression takes tens of milliseconds; keep it off the event loop
+        entry = await asyncio.to_thread(EncodedCatalog, dumps(build()))
+        self._entries[key] = entry
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    async def respond(self, request: Request, key: Hashable, build: Callable[[], Any],
+                      cacheable: bool = True) -> Response:
+        """Serve a catalog response, honouring conditional requests and Accept-Encoding"""
+        accept_encoding = request.headers.get("accept-encoding", "")
+        if cacheable:
+            entry = await self.get(key, build)
+        else:
+            self._stats["uncached"] += 1
+            body = dumps(build())
+            supported = [name for name in ONE_OFF_LEVELS if name != "br" or brotli is not None]
+            encoding = _negotiate(accept_encoding, dict.fromkeys([*supported, "identity"], b""))
+            entry = EncodedCatalog(body, {encoding: ONE_OFF_LEVELS[encoding]} if encoding != "identity" else {})
+        encoding = _negotiate(accept_encoding, entry.bodies)
+        headers = {
+            "ETag": entry.etag(encoding),
+            "Cache-Control": f"public, max-age={self.max_age}",
+            "Vary": "Accept-Encoding",
+        }
+
+        if entry.matches(request.headers.get("if-none-match", "")):
+            self._stats["not_modified"] += 1
+            return Response(status_code=304, headers=headers)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(entry.bodies[encoding], media_type="application/json", headers=headers)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "entries": len(self._entries)}
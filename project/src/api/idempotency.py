@@ -0,0 +1,51 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class IdempotencyConflict(Exception):
+    """An idempotency key was reused for a different request"""
+
+
+class IdempotencyCache:
+    """Bounded LRU of responses for requests carrying an idempotency key.
+
+    A retry with the same key and the same request body gets the stored
+    response instead of being processed again. Entries also keep a
+    fingerprint of the original request so a reused key with a different
+    body is rejected rather than silently answered with the old response.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[str, Any]]" = OrderedDict()
+        self._stats = {"hits": 0, "stored": 0, "conflicts": 0}
+
+    @staticmethod
+    def fingerprint(*parts: Any) -> str:
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: Hashable, fingerprint: str) -> Optional[Any]:
+        """Return the stored response for a retry, or None for a new request"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_fingerprint, response = entry
+        if stored_fingerprint != fingerprint:
+            self._stats["conflicts"] += 1
+            raise IdempotencyConflict("Idempotency key was already used for a different request")
+
+        self._stats["hits"] += 1
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: Hashable, fingerprint: str, response: Any) -> None:
+        self._entries[key] = (fingerprint, response)
+        self._entries.move_to_end(key)
+        self._stats["stored"] += 1
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "entries": len(self._entries)}
@@ -1,18 +1,45 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, Field
+from typing import Dict, Any, AsyncIterator, Iterator, Optional
+import asyncio
+import atexit
+import base64
+import hmac
 import os
+import time
 from dotenv import load_dotenv
 
 from src.workflows.interview_workflow import InterviewWorkflow
-from src.models.interview_models import InterviewSession, Question, Answer, Feedback
-from src.data.question_bank import get_questions_by_type, QUESTION_BANK
+from src.workflows import adaptive
+from src.models.interview_models import Question, Answer, Feedback, EnrichmentStatus
+from src.data.analytics_store import AnalyticsStore
+from src.data.question_store import GeneratedQuestionStore
+from src.data.session_archive import SessionArchiveWriter
+from src.data.review_scheduler import ReviewScheduler
+from src.data.question_bank import (
+    current_snapshot, reload_question_bank, add_reload_listener,
+    question_bank_stats, QuestionBankWatcher
+)
 from src.utils.job_parser import JobDescriptionParser
+from src.utils.llm_scheduler import LLMPriority, llm_scheduler
+from src.utils.task_queue import TaskQueue
+from src.utils.striped_lock import StripedLock
+from src.utils.score_percentiles import PercentileIndex, cohort_key
+from src.models.compact_session import CompactSession
+from src.utils.feedback_generator import FeedbackGenerator
+from src.utils.feedback_rules import FEEDBACK_RULES_DATA, FEEDBACK_RULES_VERSION
+from src.api.serialization import FastJSONResponse, dumps
+from src.api.catalog_cache import CatalogCache
+from src.api.idempotency import IdempotencyCache, IdempotencyConflict
 
 load_dotenv()
 
-app = FastAPI(title="Interview Preparation Bot API", version="1.0.0")
+app = FastAPI(
+    title="Interview Preparation Bot API",
+    version="1.0.0",
+    default_response_class=FastJSONResponse
+)
 
 # CORS middleware
 app.add_middleware(
@@ -28,22 +55,76 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 if not OPENAI_API_KEY:
     raise ValueError("OPENAI_API_KEY environment variable is required")
 
-interview_workflow = InterviewWorkflow(OPENAI_API_KEY)
+# Serve the question bank from a JSON file instead of the built-in one; it is reloaded
+# when the file changes (checked every QUESTION_BANK_WATCH_INTERVAL seconds, 0 disables)
+QUESTION_BANK_PATH = os.getenv("QUESTION_BANK_PATH")
+question_bank_watcher: Optional[QuestionBankWatcher] = None
+if QUESTION_BANK_PATH:
+    reload_question_bank(QUESTION_BANK_PATH)
+    watch_interval = float(os.getenv("QUESTION_BANK_WATCH_INTERVAL", "5"))
+    if watch_interval > 0:
+        question_bank_watcher = QuestionBankWatcher(QUESTION_BANK_PATH, watch_interval).start()
+
+# Enables POST /admin/question-bank/reload for requests carrying this X-Admin-Token
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+# Sessions are checkpointed here so they survive restarts; set to empty to disable
+CHECKPOINT_DB = os.getenv("INTERVIEW_CHECKPOINT_DB", "interview_checkpoints.sqlite")
+
+# Per-user spaced-repetition schedules used to pick each session's questions
+review_scheduler = ReviewScheduler(
+    os.getenv("REVIEW_SCHEDULES_PATH", "review_schedules.json") or None,
+    save_interval=float(os.getenv("ANALYTICS_SAVE_INTERVAL", "60"))
+)
+atexit.register(review_scheduler.save)
+
+# LLM-generated questions for job skills the bank does not cover, reused across sessions
+question_store = GeneratedQuestionStore(
+    current_snapshot().questions,
+    os.getenv("GENERATED_QUESTIONS_PATH", "generated_questions.json") or None,
+    save_interval=float(os.getenv("ANALYTICS_SAVE_INTERVAL", "60"))
+)
+atexit.register(question_store.save)
+add_reload_listener(lambda snapshot: question_store.set_bank(snapshot.questions))
+
+# Completed sessions are appended here for offline analysis and re-grading; empty disables
+SESSION_ARCHIVE_PATH = os.getenv("SESSION_ARCHIVE_PATH")
+session_archive: Optional[SessionArchiveWriter] = None
+if SESSION_ARCHIVE_PATH:
+    session_archive = SessionArchiveWriter(
+        SESSION_ARCHIVE_PATH, flush_interval=float(os.getenv("ANALYTICS_SAVE_INTERVAL", "60"))
+    )
+    atexit.register(session_archive.close)
+
+interview_workflow = InterviewWorkflow(
+    OPENAI_API_KEY, checkpoint_path=CHECKPOINT_DB or None, review_scheduler=review_scheduler,
+    question_store=question_store
+)
 
 # Request/Response models
 class InterviewConfigRequest(BaseModel):
+    # Finished sessions of identified users feed /analytics
+    user_id: Optional[str] = None
     job_role: str = "Software Engineer"
     difficulty: str = "intermediate"
     type: str = "mixed"
     question_count: int = 5
     job_description_text: Optional[str] = None
+    # Pick questions by a running skill estimate and stop early once it is confident;
+    # question_count is then the maximum
+    adaptive: bool = False
 
 class AnswerRequest(BaseModel):
     session_id: str
     question_id: str
     answer_text: str
-    time_spent: int
-    confidence: int
+    time_spent: int = Field(ge=0)
+    confidence: int = Field(ge=0, le=100)
+    # Return heuristic feedback if LLM enrichment is not done within this budget
+    # (ANSWER_LATENCY_BUDGET_MS when omitted)
+    latency_budget_ms: Optional[int] = None
+    # Retries with the same key get the original response (the Idempotency-Key header also works)
+    idempotency_key: Optional[str] = None
 
 class SessionResponse(BaseModel):
     session_id: str
@@ -51,24 +132,252 @@ class SessionResponse(BaseModel):
     question_presentation: Optional[str]
     progress: Dict[str, Any]
 
-# In-memory storage (in production, use a proper database)
-active_sessions: Dict[str, InterviewSession] = {}
+# In-memory storage (in production, use a proper database); sessions are kept
+# compact and only expanded to pydantic models when a response needs them
+active_sessions: Dict[str, CompactSession] = {}
+
+# Read-only catalog responses, pre-encoded once per content version
+catalog_cache = CatalogCache(max_age=int(os.getenv("CATALOG_MAX_AGE", "300")))
+
+INTERVIEW_RESOURCES = {
+    "star_method": "https://www.thebalancemoney.com/what-is-the-star-interview-response-technique-2061629",
+    "interview_questions": "https://www.thebalancemoney.com/top-job-interview-questions-2061228",
+    "salary_negotiation_tips": [
+        "Research industry standards and company salary ranges before negotiating",
+        "Consider the total compensation package, not just base salary",
+        "Practice your negotiation conversation beforehand",
+        "Be prepared to justify your salary request with specific examples",
+        "Know your minimum acceptable offer before starting negotiations"
+    ],
+    "body_language_tips": [
+        "Maintain good eye contact - shows confidence and engagement",
+        "Sit up straight with shoulders back - projects professionalism",
+        "Use open gestures - avoid crossing arms or fidgeting",
+        "Mirror the interviewer's energy level appropriately",
+        "Smile genuinely when appropriate - shows enthusiasm"
+    ]
+}
+
+# /questions pagination
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# Fields a question serializes with, and so the only ones ?fields= can select
+QUESTION_FIELDS = frozenset(name for name, field in Question.model_fields.items() if not field.exclude)
+
+def _encode_cursor(position: int, bank_version: str) -> str:
+    """Opaque cursor; tied to the bank version so it cannot skip or repeat after a change"""
+    return base64.urlsafe_b64encode(f"{bank_version}:{position}".encode()).decode()
+
+def _decode_cursor(cursor: str, bank_version: str) -> int:
+    try:
+        version, position = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        position = int(position)
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if version != bank_version:
+        raise ValueError("Cursor expired; the question bank has changed")
+    return position
+
+# Answers to the same session are applied one at a time; other sessions are not blocked
+session_locks = StripedLock(stripes=int(os.getenv("SESSION_LOCK_STRIPES", "256")))
+
+# Responses to answer submissions that carried an idempotency key
+answer_responses = IdempotencyCache()
+
+# Score history of finished sessions, per user, for the analytics dashboard
+analytics_store = AnalyticsStore(
+    os.getenv("ANALYTICS_STORE_PATH", "interview_analytics.npz") or None,
+    save_interval=float(os.getenv("ANALYTICS_SAVE_INTERVAL", "60"))
+)
+atexit.register(analytics_store.save)
+
+# Score distributions per (job role, type, difficulty) for percentile ranks in /results
+score_percentiles = PercentileIndex(
+    os.getenv("PERCENTILES_PATH", "score_percentiles.json") or None,
+    save_interval=float(os.getenv("ANALYTICS_SAVE_INTERVAL", "60"))
+)
+atexit.register(score_percentiles.save)
+
+# Keeps references to enrichment tasks that outlive their request
+background_tasks: set = set()
+
+# Session assessments are generated off the request path
+finalization_queue = TaskQueue(workers=int(os.getenv("FINALIZATION_WORKERS", "2")))
+
+# Default wait for LLM enrichment when an answer carries no latency_budget_ms; by default
+# heuristic feedback is returned at once and the enrichment finishes in the background
+DEFAULT_LATENCY_BUDGET_MS = int(os.getenv("ANSWER_LATENCY_BUDGET_MS", "0"))
+
+# Upper bound for long-polling the session assessment
+MAX_ASSESSMENT_WAIT_SECONDS = 30.0
+
+def _finalize_session(session: CompactSession) -> None:
+    """Generate and store the overall LLM assessment (runs in a worker thread)"""
+    try:
+        session.assessment = interview_workflow.assess_session(session.to_session())
+        session.assessment_status = EnrichmentStatus.COMPLETE
+    except Exception:
+        session.assessment_status = EnrichmentStatus.FAILED
+        raise
+    finally:
+        full_session = session.to_session()
+        interview_workflow.save_session(full_session)
+        if session.user_id:
+            analytics_store.record_session(session.user_id, full_session)
+            analytics_store.maybe_save()
+        score_percentiles.maybe_save()
+        review_scheduler.maybe_save()
+        if session_archive is not None:
+            session_archive.write(session)
+
+async def _get_session(session_id: str) -> Optional[CompactSession]:
+    """Get an active session, restoring it from its checkpoint after a restart"""
+    session = active_sessions.get(session_id)
+    if session:
+        return session
+    
+    state = await asyncio.to_thread(interview_workflow.resume_interview, session_id)
+    if not state or not state.session:
+        return None
+    
+    session = active_sessions.setdefault(session_id, CompactSession.from_session(state.session, restore_from=question_store))
+    if state.context.get("run_interrupted"):
+        # Finish the cut-off run off the request path; drop the cached copy once it is done
+        # so the next read restores the finished state from the checkpoint
+        job = finalization_queue.submit(f"resume:{session_id}", interview_workflow.resume_interview, session_id, True)
+        job.add_done_callback(lambda _: active_sessions.pop(session_id, None))
+        return session
+    if session.is_complete and session.assessment_status in (None, EnrichmentStatus.PENDING):
+        # The assessment job was lost with the previous process
+        session.assessment_status = EnrichmentStatus.PENDING
+        finalization_queue.submit(session.id, _finalize_session, session)
+    return session
+
+def _attach_enrichment(session: CompactSession, question_id: str, task: asyncio.Task) -> None:
+    """Store a late-arriving LLM assessment on the answer's feedback"""
+    if task.cancelled() or task.exception() is not None:
+        session.set_enrichment(question_id, None, EnrichmentStatus.FAILED)
+    else:
+        session.set_enrichment(question_id, task.result(), EnrichmentStatus.COMPLETE)
+
+def _score_answer(session: CompactSession, question: Question, answer: Answer) -> Feedback:
+    """Attach heuristic feedback to an answer and record it on the session"""
+    feedback = FeedbackGenerator.generate_feedback(answer, question)
+    interview_workflow.flag_duplicate(question, answer, feedback, session.id)
+    answer.feedback = feedback
+    session.record_answer(answer, question)
+    score_percentiles.record(
+        "answer", cohort_key(session.job_role, session.type, session.difficulty), feedback.score
+    )
+    if session.user_id:
+        review_scheduler.review(session.user_id, question.id, feedback.score)
+    if session.adaptive:
+        adaptive.advance(session)
+    return feedback
+
+def _complete_if_finished(session: CompactSession) -> None:
+    """Once the last answer is in, score the session and queue the overall assessment"""
+    if session.is_complete and session.end_time is None:
+        session.mark_complete()
+        if session.score is not None:
+            score_percentiles.record(
+                "session", cohort_key(session.job_role, session.type, session.difficulty), session.score
+            )
+        session.assessment_status = EnrichmentStatus.PENDING
+        finalization_queue.submit(session.id, _finalize_session, session)
+
+async def _iterate_in_thread(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Consume a blocking iterator (e.g. an LLM token stream) in a worker thread"""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    
+    def pump() -> None:
+        try:
+            for item in iterator:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, done)
+    
+    pumping = loop.run_in_executor(None, pump)
+    while True:
+        item = await queue.get()
+        if item is done:
+            break
+        yield item
+    await pumping  # Re-raise errors from the iterator
+
+async def _enrich_feedback(session: CompactSession, question: Question, answer: Answer,
+                           timeout: Optional[float]) -> None:
+    """Run LLM enrichment, leaving it in the background if it misses the deadline"""
+    feedback = answer.feedback
+    feedback.enrichment_status = EnrichmentStatus.PENDING
+    session.set_enrichment(question.id, None, EnrichmentStatus.PENDING)
+    task = asyncio.create_task(asyncio.to_thread(
+        interview_workflow.enhance_feedback, question, answer, feedback.model_copy(), session.id
+    ))
+    
+    try:
+        feedback.overall_assessment = await asyncio.wait_for(asyncio.shield(task), timeout)
+        feedback.enrichment_status = EnrichmentStatus.COMPLETE
+    except asyncio.TimeoutError:
+        # Keep the heuristic feedback for now and attach the LLM result when it lands
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+        task.add_done_callback(lambda done: _attach_enrichment(session, question.id, done))
+        return
+    except Exception:
+        feedback.enrichment_status = EnrichmentStatus.FAILED
+    
+    session.set_enrichment(question.id, feedback.overall_assessment, feedback.enrichment_status)
 
 @app.get("/")
 async def root():
-    return {"message": "Interview Preparation Bot API", "version": "1.0.0"}
+    return FastJSONResponse({"message": "Interview Preparation Bot API", "version": "1.0.0"})
 
 @app.get("/questions")
-async def get_questions(type: str = "mixed", difficulty: str = None):
-    """Get available questions by type and difficulty"""
+async def get_questions(request: Request, type: str = "mixed", difficulty: str = None,
+                        category: Optional[str] = None, q: Optional[str] = None,
+                        min_time_limit: Optional[int] = None, max_time_limit: Optional[int] = None,
+                        cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+                        fields: Optional[str] = None):
+    """Get a page of questions, filtered by type, difficulty, category, text and time limit"""
     try:
         from src.models.interview_models import InterviewType, DifficultyLevel
         
         interview_type = InterviewType(type)
         diff_level = DifficultyLevel(difficulty) if difficulty else None
+        # One snapshot for the whole request, so a concurrent reload cannot mix banks
+        snapshot = current_snapshot()
+        after = _decode_cursor(cursor, snapshot.version) if cursor else -1
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        
+        projection = None
+        if fields:
+            projection = frozenset(f.strip() for f in fields.split(",") if f.strip())
+            unknown = projection - QUESTION_FIELDS
+            if unknown:
+                raise HTTPException(status_code=422, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        
+        def build_page() -> Dict[str, Any]:
+            questions, last_position = snapshot.index.filter(
+                type=interview_type, difficulty=diff_level, category=category, search=q,
+                min_time_limit=min_time_limit, max_time_limit=max_time_limit,
+                after=after, limit=limit
+            )
+            return {
+                "questions": [question.model_dump(include=projection) for question in questions]
+                if projection else questions,
+                "next_cursor": _encode_cursor(last_position, snapshot.version) if last_position is not None else None
+            }
         
-        questions = get_questions_by_type(interview_type, diff_level)
-        return {"questions": questions}
+        # Only the first unfiltered page of each type/difficulty is a fixed catalog worth caching
+        catalog = (category is None and q is None and min_time_limit is None and max_time_limit is None
+                   and after == -1 and limit == DEFAULT_PAGE_SIZE and projection is None)
+        return await catalog_cache.respond(
+            request, ("questions", snapshot.version, interview_type, diff_level), build_page,
+            cacheable=catalog
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -82,121 +391,404 @@ async def start_interview(config: InterviewConfigRequest):
                 "job_role": config.job_role,
                 "difficulty": config.difficulty,
                 "type": config.type,
-                "question_count": config.question_count
+                "question_count": config.question_count,
+                "user_id": config.user_id,
+                "adaptive": config.adaptive
             }
         }
         
         if config.job_description_text:
             workflow_config["job_description_text"] = config.job_description_text
+            # Generating questions for uncovered skills is a slow LLM call; it is queued below instead
+            workflow_config["defer_question_expansion"] = True
         
-        # Run workflow to initialize session
-        state = interview_workflow.run_interview(workflow_config)
+        # Run the workflow up to the first question; LLM calls block, so keep them off the event loop
+        state = await asyncio.to_thread(interview_workflow.start_session, workflow_config)
         
         if not state.session:
             raise HTTPException(status_code=500, detail="Failed to initialize session")
         
         # Store session
-        active_sessions[state.session.id] = state.session
+        active_sessions[state.session.id] = CompactSession.from_session(state.session)
+        
+        skills = state.job_description.skills if state.job_description else []
+        missing = interview_workflow.uncovered_skills(skills) if skills else []
+        if missing:
+            # Later sessions for these skills get the generated questions
+            finalization_queue.submit(
+                f"expand:{','.join(missing)}", interview_workflow.expand_questions,
+                missing, state.session.difficulty, state.session.id, LLMPriority.BACKGROUND
+            )
         
-        return SessionResponse(
+        return FastJSONResponse(SessionResponse.model_construct(
             session_id=state.session.id,
             current_question=state.current_question,
             question_presentation=state.context.get("question_presentation"),
-            progress={
-                "current_index": state.session.current_question_index,
-                "total_questions": len(state.session.questions),
-                "completed": len(state.session.answers)
-            }
-        )
+            progress=state.session.progress()
+        ))
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/interview/{session_id}/resume")
+async def resume_interview(session_id: str):
+    """Resume an interview by id, e.g. after a server restart"""
+    session = await _get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    return FastJSONResponse(SessionResponse.model_construct(
+        session_id=session.id,
+        current_question=session.current_question(),
+        question_presentation=None,
+        progress=session.progress()
+    ))
+
 @app.post("/interview/answer")
-async def submit_answer(answer_request: AnswerRequest):
+async def submit_answer(answer_request: AnswerRequest,
+                        idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")):
     """Submit an answer and get feedback"""
+    started = time.monotonic()
+    idempotency_key = idempotency_key or answer_request.idempotency_key
     try:
-        session = active_sessions.get(answer_request.session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        # Find the question
-        question = next(
-            (q for q in session.questions if q.id == answer_request.question_id),
-            None
+        async with session_locks.hold(answer_request.session_id):
+            return await _submit_answer(answer_request, idempotency_key, started)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def _submit_answer(answer_request: AnswerRequest, idempotency_key: Optional[str],
+                         started: float) -> FastJSONResponse:
+    """Apply an answer; the caller holds the session's lock"""
+    cache_key = fingerprint = None
+    if idempotency_key:
+        cache_key = (answer_request.session_id, idempotency_key)
+        fingerprint = IdempotencyCache.fingerprint(
+            answer_request.question_id, answer_request.answer_text,
+            answer_request.time_spent, answer_request.confidence
         )
-        if not question:
-            raise HTTPException(status_code=404, detail="Question not found")
+        try:
+            cached = answer_responses.get(cache_key, fingerprint)
+        except IdempotencyConflict as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        if cached is not None:
+            return FastJSONResponse(cached)
+    
+    session = await _get_session(answer_request.session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    # Find the question
+    question = session.get_question(answer_request.question_id)
+    if not question:
+        raise HTTPException(status_code=404, detail="Question not found")
+    if session.has_answer(question.id):
+        raise HTTPException(status_code=409, detail="Question already answered")
+    
+    # Create answer, generate feedback and add it to the session
+    answer = Answer(
+        question_id=answer_request.question_id,
+        text=answer_request.answer_text,
+        time_spent=answer_request.time_spent,
+        confidence=answer_request.confidence
+    )
+    feedback = _score_answer(session, question, answer)
+    
+    # Enhance with the LLM, within the caller's latency budget (or the server default);
+    # answers that local reference scoring handles confidently skip it
+    if interview_workflow.needs_enhancement(feedback):
+        budget_ms = answer_request.latency_budget_ms
+        if budget_ms is None:
+            budget_ms = DEFAULT_LATENCY_BUDGET_MS
+        timeout = max(0.0, budget_ms / 1000 - (time.monotonic() - started))
+        await _enrich_feedback(session, question, answer, timeout)
+    
+    # Get next question if available
+    next_question = session.current_question()
+    _complete_if_finished(session)
+    
+    # Checkpoint progress so the session can be resumed after a restart
+    await asyncio.to_thread(interview_workflow.save_session, session.to_session())
+    
+    response = {
+        "feedback": feedback.model_copy(),
+        "next_question": next_question,
+        "progress": session.progress(),
+        "is_complete": session.is_complete
+    }
+    if cache_key:
+        answer_responses.put(cache_key, fingerprint, response)
+    return FastJSONResponse(response)
+
+class InterviewChannel:
+    """Server side of a session's WebSocket.
+    
+    Keeps the session hot for the lifetime of the connection, prefetches the
+    presentation of the upcoming question while the current one is answered,
+    and pushes LLM output (presentations, feedback tokens, the assessment)
+    as soon as it is available.
+    """
+    
+    def __init__(self, websocket: WebSocket, session: CompactSession):
+        self.websocket = websocket
+        self.session = session
+        self.closed = False
+        self._send_lock = asyncio.Lock()
+        self._presentations: Dict[str, asyncio.Task] = {}
+    
+    async def send(self, message: Dict[str, Any]) -> None:
+        if self.closed:
+            return
+        async with self._send_lock:
+            try:
+                await self.websocket.send_text(dumps(message).decode())
+            except Exception:
+                # Client went away; background work still completes and is stored on the session
+                self.closed = True
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+        return task
+    
+    def _presentation(self, question: Question) -> asyncio.Task:
+        """Start (or reuse) the presentation for a question"""
+        task = self._presentations.get(question.id)
+        if task is None:
+            task = asyncio.create_task(asyncio.to_thread(
+                interview_workflow.present_question, question, self.session.id
+            ))
+            self._presentations[question.id] = task
+        return task
+    
+    async def open(self) -> None:
+        """Greet the client with the session state and whatever comes next"""
+        session = self.session
+        await self.send({"type": "session", "session_id": session.id, "progress": session.progress()})
+        if session.is_complete:
+            self._spawn(self._push_assessment())
+        else:
+            await self.push_question()
+    
+    async def push_question(self) -> None:
+        """Send the current question, and its presentation once ready"""
+        session = self.session
+        question = session.current_question()
+        if question is None:
+            return
+        
+        presentation = self._presentation(question)
+        # Prefetch the next presentation while the candidate answers this one
+        next_index = session.current_question_index + 1
+        if next_index < session.question_count:
+            self._presentation(session.get_question(session.question_ids[next_index]))
         
-        # Create answer and generate feedback
-        from src.utils.feedback_generator import FeedbackGenerator
+        ready = presentation.done() and not presentation.cancelled() and presentation.exception() is None
+        await self.send({
+            "type": "question",
+            "question": question,
+            "presentation": presentation.result() if ready else None,
+            "progress": session.progress()
+        })
+        if not presentation.done():
+            self._spawn(self._push_presentation(question.id, presentation))
+    
+    async def _push_presentation(self, question_id: str, presentation: asyncio.Task) -> None:
+        try:
+            text = await presentation
+        except Exception:
+            return  # The question is still usable without a presentation
+        await self.send({"type": "presentation", "question_id": question_id, "presentation": text})
+    
+    async def handle_answer(self, message: Dict[str, Any]) -> None:
+        # Shares the session lock with the HTTP endpoint
+        async with session_locks.hold(self.session.id):
+            await self._apply_answer(message)
+    
+    async def _apply_answer(self, message: Dict[str, Any]) -> None:
+        session = self.session
+        question = session.get_question(message.get("question_id", ""))
+        if not question:
+            await self.send({"type": "error", "detail": "Question not found"})
+            return
+        if session.has_answer(question.id):
+            await self.send({"type": "error", "detail": "Question already answered"})
+            return
         
         answer = Answer(
-            question_id=answer_request.question_id,
-            text=answer_request.answer_text,
-            time_spent=answer_request.time_spent,
-            confidence=answer_request.confidence
+            question_id=question.id,
+            text=message.get("answer_text", ""),
+            time_spent=message.get("time_spent", 0),
+            confidence=message.get("confidence", 50)
         )
+        feedback = _score_answer(session, question, answer)
+        enrich = interview_workflow.needs_enhancement(feedback)
+        if enrich:
+            feedback.enrichment_status = EnrichmentStatus.PENDING
+            session.set_enrichment(question.id, None, EnrichmentStatus.PENDING)
         
-        feedback = FeedbackGenerator.generate_feedback(answer, question)
-        answer.feedback = feedback
+        # Heuristic feedback goes out at once; LLM enrichment is streamed behind it
+        await self.send({
+            "type": "feedback",
+            "question_id": question.id,
+            "feedback": feedback,
+            "progress": session.progress()
+        })
+        if enrich:
+            self._spawn(self._stream_enrichment(question, answer, feedback.model_copy()))
         
-        # Add to session
-        session.answers.append(answer)
-        session.current_question_index += 1
+        _complete_if_finished(session)
+        if session.is_complete:
+            await self.send({
+                "type": "complete",
+                "overall_score": session.aggregates.average,
+                "summary": session.aggregates.summary(),
+                "assessment_status": session.assessment_status
+            })
+            self._spawn(self._push_assessment())
+        else:
+            await self.push_question()
         
-        # Get next question if available
-        next_question = None
-        if session.current_question_index < len(session.questions):
-            next_question = session.questions[session.current_question_index]
+        await asyncio.to_thread(interview_workflow.save_session, session.to_session())
+    
+    async def _stream_enrichment(self, question: Question, answer: Answer, feedback: Feedback) -> None:
+        """Forward LLM feedback tokens as they arrive and store the final text"""
+        tokens = []
+        try:
+            async for token in _iterate_in_thread(interview_workflow.stream_feedback(
+                question, answer, feedback, self.session.id
+            )):
+                tokens.append(token)
+                await self.send({"type": "feedback_delta", "question_id": question.id, "delta": token})
+            assessment, status = "".join(tokens), EnrichmentStatus.COMPLETE
+        except Exception:
+            assessment, status = None, EnrichmentStatus.FAILED
         
-        return {
-            "feedback": feedback,
-            "next_question": next_question,
-            "progress": {
-                "current_index": session.current_question_index,
-                "total_questions": len(session.questions),
-                "completed": len(session.answers)
-            },
-            "is_complete": session.current_question_index >= len(session.questions)
-        }
+        self.session.set_enrichment(question.id, assessment, status)
+        await self.send({
+            "type": "feedback_enriched",
+            "question_id": question.id,
+            "overall_assessment": assessment,
+            "enrichment_status": status
+        })
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    async def _push_assessment(self) -> None:
+        await finalization_queue.wait(self.session.id)
+        await self.send({
+            "type": "assessment",
+            "assessment_status": self.session.assessment_status,
+            "assessment": self.session.assessment
+        })
+
+@app.websocket("/interview/{session_id}/ws")
+async def interview_channel(websocket: WebSocket, session_id: str):
+    """Run an interview over one persistent connection.
+    
+    Client messages: ``{"type": "answer", "question_id", "answer_text", "time_spent", "confidence"}``
+    and ``{"type": "ping"}``. Server messages: ``session``, ``question``, ``presentation``,
+    ``feedback``, ``feedback_delta``, ``feedback_enriched``, ``complete``, ``assessment``,
+    ``pong`` and ``error``.
+    """
+    session = await _get_session(session_id)
+    if not session:
+        await websocket.close(code=4404, reason="Session not found")
+        return
+    
+    await websocket.accept()
+    channel = InterviewChannel(websocket, session)
+    await channel.open()
+    
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+                message_type = message.get("type") if isinstance(message, dict) else None
+                if message_type == "answer":
+                    await channel.handle_answer(message)
+                elif message_type == "ping":
+                    await channel.send({"type": "pong", "progress": session.progress()})
+                else:
+                    await channel.send({"type": "error", "detail": f"Unknown message type: {message_type}"})
+            except (ValueError, OverflowError) as e:
+                # Malformed JSON or an invalid answer; the connection stays usable
+                await channel.send({"type": "error", "detail": str(e)})
+    except WebSocketDisconnect:
+        channel.closed = True
+
+@app.get("/interview/{session_id}/answers/{question_id}/feedback")
+async def get_answer_feedback(session_id: str, question_id: str):
+    """Get the latest feedback for an answer, including late LLM enrichment"""
+    session = await _get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    answer = session.get_answer(question_id)
+    if not answer:
+        raise HTTPException(status_code=404, detail="Answer not found")
+    
+    return FastJSONResponse({
+        "question_id": question_id,
+        "feedback": answer.feedback,
+        "enrichment_status": answer.feedback.enrichment_status
+    })
 
 @app.get("/interview/{session_id}/results")
 async def get_interview_results(session_id: str):
     """Get final interview results"""
     try:
-        session = active_sessions.get(session_id)
+        session = await _get_session(session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        if not session.answers:
+        if not len(session.answers):
             raise HTTPException(status_code=400, detail="No answers submitted yet")
         
-        # Calculate overall score
-        total_score = sum(answer.feedback.score for answer in session.answers)
-        average_score = total_score / len(session.answers)
-        
-        return {
-            "session": session,
-            "overall_score": average_score,
-            "total_questions": len(session.questions),
-            "answered_questions": len(session.answers),
+        full_session = session.to_session()
+        cohort = cohort_key(session.job_role, session.type, session.difficulty)
+        return FastJSONResponse({
+            "session": full_session,
+            "overall_score": session.aggregates.average,
+            # Percentile ranks against other candidates with the same role, type and difficulty
+            "percentile": score_percentiles.percentile("session", cohort, session.score),
+            "summary": session.aggregates.summary(),
+            "assessment_status": session.assessment_status,
+            "assessment": session.assessment,
+            "skill_estimate": adaptive.SkillEstimate(session.score_history(), session.difficulty).summary()
+            if session.adaptive else None,
+            "total_questions": session.question_count,
+            "answered_questions": len(full_session.answers),
             "detailed_feedback": [
                 {
-                    "question": next(q for q in session.questions if q.id == answer.question_id),
+                    "question": session.get_question(answer.question_id),
                     "answer": answer,
-                    "feedback": answer.feedback
+                    "feedback": answer.feedback,
+                    "percentile": score_percentiles.percentile("answer", cohort, answer.feedback.score)
                 }
-                for answer in session.answers
+                for answer in full_session.answers
             ]
-        }
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/interview/{session_id}/assessment")
+async def get_interview_assessment(session_id: str, wait: float = 0):
+    """Poll for the overall LLM assessment; ``wait`` long-polls for up to that many seconds"""
+    session = await _get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    if wait > 0 and finalization_queue.is_pending(session_id):
+        await finalization_queue.wait(session_id, min(wait, MAX_ASSESSMENT_WAIT_SECONDS))
+    
+    return FastJSONResponse({
+        "session_id": session_id,
+        "assessment_status": session.assessment_status,
+        "assessment": session.assessment
+    })
+
 @app.post("/job-description/parse")
 async def parse_job_description(request: Dict[str, str]):
     """Parse a job description and extract information"""
@@ -208,35 +800,102 @@ async def parse_job_description(request: Dict[str, str]):
         parsed_job = JobDescriptionParser.parse(description)
         research_tips = JobDescriptionParser.generate_research_tips(parsed_job)
         
-        return {
+        return FastJSONResponse({
             "job_info": parsed_job,
             "research_tips": research_tips
-        }
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/resources")
-async def get_resources():
+async def get_resources(request: Request):
     """Get helpful interview preparation resources"""
-    return {
-        "star_method": "https://www.thebalancemoney.com/what-is-the-star-interview-response-technique-2061629",
-        "interview_questions": "https://www.thebalancemoney.com/top-job-interview-questions-2061228",
-        "salary_negotiation_tips": [
-            "Research industry standards and company salary ranges before negotiating",
-            "Consider the total compensation package, not just base salary",
-            "Practice your negotiation conversation beforehand",
-            "Be prepared to justify your salary request with specific examples",
-            "Know your minimum acceptable offer before starting negotiations"
-        ],
-        "body_language_tips": [
-            "Maintain good eye contact - shows confidence and engagement",
-            "Sit up straight with shoulders back - projects professionalism",
-            "Use open gestures - avoid crossing arms or fidgeting",
-            "Mirror the interviewer's energy level appropriately",
-            "Smile genuinely when appropriate - shows enthusiasm"
-        ]
-    }
+    return await catalog_cache.respond(request, ("resources",), lambda: INTERVIEW_RESOURCES)
+
+@app.get("/feedback/rules")
+async def get_feedback_rules(request: Request):
+    """Get the heuristic scoring rules, so clients can preview feedback offline.
+    
+    The rules cover everything except reference coverage: reference answers and
+    key points never leave the server, so a client score is a preview taken
+    before the reference adjustment and the server score remains authoritative.
+    """
+    return await catalog_cache.respond(
+        request,
+        ("feedback_rules", FEEDBACK_RULES_VERSION),
+        lambda: {
+            "rules_version": FEEDBACK_RULES_VERSION,
+            "rules": FEEDBACK_RULES_DATA,
+            "preview": {"server_only": ["reference_coverage"]}
+        }
+    )
+
+@app.get("/analytics/{user_id}")
+async def get_analytics(user_id: str, range: str = "all"):
+    """Dashboard summary of a user's finished sessions within a time range"""
+    try:
+        return FastJSONResponse(analytics_store.dashboard(user_id, range))
+    except KeyError:
+        raise HTTPException(status_code=404, detail="No analytics for this user")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/analytics/{user_id}/trend")
+async def get_analytics_trend(user_id: str, bucket: str = "week", range: str = "all"):
+    """Average score per week or month"""
+    try:
+        return FastJSONResponse({"bucket": bucket, "points": analytics_store.trend(user_id, bucket, range)})
+    except KeyError:
+        raise HTTPException(status_code=404, detail="No analytics for this user")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/analytics/{user_id}/categories")
+async def get_analytics_categories(user_id: str, range: str = "all", points: int = 5):
+    """Per-category averages, recent scores and improvement"""
+    try:
+        return FastJSONResponse(analytics_store.categories_progress(user_id, range, max(1, min(points, 50))))
+    except KeyError:
+        raise HTTPException(status_code=404, detail="No analytics for this user")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/metrics")
+async def get_metrics():
+    """Get runtime metrics for capacity monitoring"""
+    return FastJSONResponse({
+        "llm_scheduler": llm_scheduler.metrics(),
+        "llm_batcher": interview_workflow.batcher.stats(),
+        "finalization_queue": finalization_queue.stats(),
+        "catalog_cache": catalog_cache.stats(),
+        "job_parser": JobDescriptionParser.cache_stats(),
+        "session_locks": session_locks.stats(),
+        "answer_idempotency": answer_responses.stats(),
+        "analytics": analytics_store.stats(),
+        "score_percentiles": score_percentiles.stats(),
+        "review_scheduler": review_scheduler.stats(),
+        "answer_index": interview_workflow.answer_index.stats(),
+        "reference_index": current_snapshot().references.stats(),
+        "question_store": question_store.stats(),
+        "session_archive": session_archive.stats() if session_archive else None,
+        "question_bank": {
+            **question_bank_stats(),
+            "watch_error": question_bank_watcher.last_error if question_bank_watcher else None
+        }
+    })
+
+@app.post("/admin/question-bank/reload")
+async def reload_questions(x_admin_token: Optional[str] = Header(None)):
+    """Reload the question bank from QUESTION_BANK_PATH (or the built-in bank) without a restart"""
+    if not ADMIN_TOKEN or not hmac.compare_digest((x_admin_token or "").encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Admin access required")
+    try:
+        # Building the indexes is CPU work; keep it off the event loop
+        snapshot = await asyncio.to_thread(reload_question_bank, QUESTION_BANK_PATH)
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid question bank: {e}")
+    return {"version": snapshot.version, "questions": len(snapshot.questions), "source": snapshot.source}
 
 if __name__ == "__main__":
     import uvicorn
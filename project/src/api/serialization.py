@@ -0,0 +1,54 @@
+from typing import Any, Callable, Dict
+
+import pydantic_core
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from src.models.compact_session import CompactSession
+from src.models.interview_models import Answer, Feedback, InterviewSession, Question
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Compiled pydantic-core serializers for the models on the hot path. They
+# dump already-validated instances straight to builtins without re-validating.
+MODEL_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    model: model.__pydantic_serializer__.to_python
+    for model in (Question, Feedback, Answer, InterviewSession)
+}
+
+
+def _encode_default(obj: Any) -> Any:
+    """orjson hook for types it cannot encode natively"""
+    encoder = MODEL_ENCODERS.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    if isinstance(obj, CompactSession):
+        return MODEL_ENCODERS[InterviewSession](obj.to_session())
+    if isinstance(obj, BaseModel):
+        encoder = MODEL_ENCODERS.setdefault(type(obj), type(obj).__pydantic_serializer__.to_python)
+        return encoder(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode a response payload (dicts, lists and models, nested freely) to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_encode_default, option=orjson.OPT_NON_STR_KEYS)
+    return pydantic_core.to_json(content, fallback=_encode_default)
+
+
+class FastJSONResponse(Response):
+    """JSON response encoded with orjson and precompiled model serializers.
+
+    Return it directly from a route so FastAPI skips ``jsonable_encoder``
+    and response model validation.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -5,14 +5,20 @@ Command-line interface for the Interview Preparation Bot
 import asyncio
 import os
 import sys
-from typing import Dict, Any
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional
 from dotenv import load_dotenv
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.workflows.interview_workflow import InterviewWorkflow
-from src.models.interview_models import InterviewType, DifficultyLevel
+from src.data.question_bank import current_snapshot
+from src.data.question_store import GeneratedQuestionStore
+from src.models.interview_models import InterviewType, DifficultyLevel, Answer, EnrichmentStatus
+from src.utils.feedback_generator import FeedbackGenerator
 from src.utils.job_parser import JobDescriptionParser
 
 load_dotenv()
@@ -26,7 +32,12 @@ class InterviewCLI:
             print("❌ Error: OPENAI_API_KEY environment variable is required")
             sys.exit(1)
         
-        self.workflow = InterviewWorkflow(self.openai_api_key)
+        # Generated questions are shared with the API through the same file; save as soon as they arrive
+        question_store = GeneratedQuestionStore(
+            current_snapshot().questions, os.getenv("GENERATED_QUESTIONS_PATH", "generated_questions.json") or None,
+            save_interval=0
+        )
+        self.workflow = InterviewWorkflow(self.openai_api_key, question_store=question_store)
         self.current_session = None
     
     def print_banner(self):
@@ -198,12 +209,11 @@ class InterviewCLI:
         # Score breakdown
         print(f"\n📈 SCORE BREAKDOWN:")
         for i, answer in enumerate(session.answers):
-            question = session.questions[i]
+            question = session.get_question(answer.question_id)
             print(f"  Q{i+1}: {answer.feedback.score}/100 - {question.category}")
         
         # Performance summary
-        scores = [answer.feedback.score for answer in session.answers]
-        avg_score = sum(scores) / len(scores)
+        avg_score = session.aggregates.average or 0
         
         print(f"\n🎯 PERFORMANCE SUMMARY:")
         if avg_score >= 80:
@@ -217,8 +227,58 @@ class InterviewCLI:
         
         print("\n" + "=" * 60)
     
+    def stream_text(self, label: str, tokens: Iterator[str]) -> str:
+        """Print LLM tokens as they arrive and return the full text"""
+        print(f"\n{label}", end=" ", flush=True)
+        parts = []
+        try:
+            for token in tokens:
+                parts.append(token)
+                print(token, end="", flush=True)
+        except Exception as e:
+            print(f"\n⚠️  Could not generate this part: {str(e)}")
+        print()
+        return "".join(parts)
+    
+    def display_insights(self, number: int, enrichment: str, followups: str):
+        """Display LLM insights computed in the background for an earlier answer"""
+        if not (enrichment or followups):
+            return
+        print(f"\n📬 INSIGHTS FOR QUESTION {number}")
+        if enrichment:
+            print(f"\n🤖 PERSONALIZED INSIGHTS:")
+            print(f"   {enrichment}")
+        
+        if followups:
+            print(f"\n❓ FOLLOW-UP QUESTIONS TO PRACTICE:")
+            print(f"   {followups}")
+        
+        print("\n" + "-" * 60)
+    
+    def show_ready_insights(self, pending: List[tuple], block: bool = False) -> None:
+        """Show insights whose LLM calls have finished (all of them if ``block``) and drop them from ``pending``"""
+        for entry in list(pending):
+            number, feedback, enrichment, followups = entry
+            futures = [f for f in (enrichment, followups) if f is not None]
+            if block:
+                wait(futures)
+            elif not all(f.done() for f in futures):
+                continue
+            pending.remove(entry)
+            
+            enrichment_result = None
+            if enrichment is not None:
+                if enrichment.exception() is not None:
+                    feedback.enrichment_status = EnrichmentStatus.FAILED
+                else:
+                    enrichment_result = enrichment.result()
+                    feedback.overall_assessment = enrichment_result
+                    feedback.enrichment_status = EnrichmentStatus.COMPLETE
+            followup_result = followups.result() if followups.exception() is None else None
+            self.display_insights(number, enrichment_result, followup_result)
+    
     async def run_interview(self):
-        """Run the complete interview process"""
+        """Run the interview one question at a time"""
         self.print_banner()
         
         # Configure interview
@@ -226,47 +286,65 @@ class InterviewCLI:
         
         print("\n🚀 Starting interview...")
         
-        # Run workflow
+        # Runs LLM enrichment and follow-ups while the user keeps answering
+        executor = ThreadPoolExecutor(max_workers=4)
+        # (question number, feedback, enrichment future, follow-up future) not shown yet
+        pending: List[tuple] = []
         try:
-            state = self.workflow.run_interview(config)
+            # Only parse the job description and pick questions up front; each question
+            # is presented (streamed) when it is reached
+            state = await asyncio.to_thread(
+                self.workflow.start_session, config, ["present_question"]
+            )
             
             if not state.session:
                 print("❌ Failed to initialize interview session")
                 return
             
             session = state.session
+            self.current_session = session
             print(f"\n✅ Interview initialized with {len(session.questions)} questions")
             
             # Process each question
             for i, question in enumerate(session.questions):
+                self.show_ready_insights(pending)
                 print(f"\n📍 Question {i+1} of {len(session.questions)}")
                 
-                # Display question
-                presentation = state.context.get("question_presentation", "")
-                self.display_question(question, presentation)
+                # Display question, then stream its presentation
+                self.display_question(question)
+                self.stream_text("💡 Context:", self.workflow.stream_question_presentation(question, session.id))
+                print("\n" + "-" * 60)
                 
                 # Collect answer
+                started = time.monotonic()
                 answer_text, confidence = self.collect_answer()
                 
-                # Create answer object and generate feedback
-                from src.models.interview_models import Answer
-                from src.utils.feedback_generator import FeedbackGenerator
-                
                 answer = Answer(
                     question_id=question.id,
                     text=answer_text,
-                    time_spent=120,  # Placeholder
+                    time_spent=int(time.monotonic() - started),
                     confidence=confidence
                 )
                 
                 feedback = FeedbackGenerator.generate_feedback(answer, question)
+                self.workflow.flag_duplicate(question, answer, feedback, session.id)
                 answer.feedback = feedback
                 
+                # LLM enrichment (unless local scoring is confident) and follow-ups run
+                # in the background; they are shown once ready, without holding up the next question
+                enrichment: Optional[Future] = None
+                if self.workflow.needs_enhancement(feedback):
+                    enrichment = executor.submit(
+                        self.workflow.enhance_feedback, question, answer, feedback.model_copy(), session.id
+                    )
+                followups = executor.submit(self.workflow.generate_followups, question, answer, session.id)
+                pending.append((i + 1, feedback, enrichment, followups))
+                
                 # Display feedback
                 self.display_feedback(feedback)
                 
                 # Add to session
-                session.answers.append(answer)
+                session.record_answer(answer, question)
                 
                 # Ask if user wants to continue
                 if i < len(session.questions) - 1:
@@ -274,17 +352,28 @@ class InterviewCLI:
                         break
             
             # Finalize session
-            from datetime import datetime
             session.end_time = datetime.now()
-            if session.answers:
-                session.score = sum(a.feedback.score for a in session.answers) / len(session.answers)
+            session.score = session.aggregates.average
+            
+            # Remaining insights; enrichment also feeds the session assessment
+            if pending:
+                print("\n⏳ Collecting the remaining personalized insights...")
+                self.show_ready_insights(pending, block=True)
             
             # Display final results
             self.display_final_results(session)
             
+            if session.answers:
+                session.assessment = self.stream_text(
+                    "🧭 SESSION ASSESSMENT:", self.workflow.stream_session_assessment(session)
+                )
+                session.assessment_status = EnrichmentStatus.COMPLETE if session.assessment else EnrichmentStatus.FAILED
+            
         except Exception as e:
             print(f"❌ Error during interview: {str(e)}")
             return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def run(self):
         """Main entry point"""
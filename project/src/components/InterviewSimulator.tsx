@@ -57,7 +57,8 @@ const InterviewSimulator: React.FC = () => {
     const feedback = generateFeedback(
       { questionId: question.id, text: currentAnswer, timeSpent, confidence, feedback: {} as any },
       question.text,
-      question.expectedAnswerFormat
+      question.expectedAnswerFormat,
+      question.timeLimit
     );
 
     const answer: Answer = {
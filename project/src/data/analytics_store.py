@@ -0,0 +1,389 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+from src.models.interview_models import DifficultyLevel, InterviewSession, InterviewType
+
+# Relative time ranges accepted by analytics queries, in seconds
+TIME_RANGES = {"week": 7 * 86400, "month": 30 * 86400, "quarter": 91 * 86400, "all": None}
+
+_DAY = 86400
+_TYPE_CODES = {member: code for code, member in enumerate(InterviewType)}
+_DIFFICULTY_CODES = {member: code for code, member in enumerate(DifficultyLevel)}
+_TYPES = list(InterviewType)
+
+
+class _Column:
+    """Growable, append-only NumPy array"""
+
+    __slots__ = ("data", "size")
+
+    def __init__(self, dtype: Any, capacity: int = 16):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values: Any) -> None:
+        values = np.asarray(values, dtype=self.data.dtype)
+        end = self.size + len(values)
+        if end > len(self.data):
+            grown = np.empty(max(end, 2 * len(self.data)), dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:end] = values
+        self.size = end
+
+    def view(self) -> np.ndarray:
+        return self.data[:self.size]
+
+
+# Column name -> dtype for the per-answer and per-session tables
+ANSWER_COLUMNS = {
+    "session": np.int32,  # row in the user's session table
+    "timestamp": np.float64,
+    "score": np.int16,
+    "category": np.int16,  # code in AnalyticsStore.categories
+    "difficulty": np.int8,
+    "type": np.int8,
+    "time_spent": np.int32,
+    "confidence": np.int16,
+}
+SESSION_COLUMNS = {
+    "start": np.float64,
+    "duration": np.float32,
+    "score": np.float32,
+    "type": np.int8,
+    "difficulty": np.int8,
+    "answered": np.int16,
+}
+
+
+class UserHistory:
+    """Columnar score history of one user, with rollups cached until the next append"""
+
+    MAX_ROLLUPS = 64
+
+    def __init__(self):
+        self.answers = {name: _Column(dtype) for name, dtype in ANSWER_COLUMNS.items()}
+        self.sessions = {name: _Column(dtype) for name, dtype in SESSION_COLUMNS.items()}
+        self._rollups: Dict[Hashable, Any] = {}
+
+    def append(self, answers: Dict[str, List], session: Dict[str, Any]) -> None:
+        offset = self.sessions["start"].size
+        for name, column in self.sessions.items():
+            column.extend([session[name]])
+        answers = {**answers, "session": [offset] * len(answers["score"])}
+        for name, column in self.answers.items():
+            column.extend(answers[name])
+        self._rollups.clear()
+
+    def cached(self, key: Hashable, compute) -> Any:
+        if key not in self._rollups:
+            if len(self._rollups) >= self.MAX_ROLLUPS:
+                self._rollups.clear()
+            self._rollups[key] = compute()
+        return self._rollups[key]
+
+
+class AnalyticsStore:
+    """Append-only, NumPy-backed history of finalized sessions for dashboards.
+
+    Each user's answers and sessions are kept in their own column arrays,
+    so a dashboard query only touches that user's rows and aggregates them
+    with vectorized operations. Categories are dictionary-encoded. Results
+    are cached per user and dropped when the user records a new session.
+    """
+
+    def __init__(self, path: Optional[str] = None, save_interval: float = 60.0, max_recorded: int = 100000):
+        self.path = path
+        self.save_interval = save_interval
+        # Ids of the most recently recorded sessions, to ignore a repeated finalization
+        self.max_recorded = max_recorded
+        self.categories: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+        self._users: Dict[str, UserHistory] = {}
+        self._recorded: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.monotonic()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_codes.get(category)
+        if code is None:
+            code = self._category_codes[category] = len(self.categories)
+            self.categories.append(category)
+        return code
+
+    def record_session(self, user_id: str, session: InterviewSession) -> bool:
+        """Append a finalized session's scored answers; each session is recorded once"""
+        scored = [answer for answer in session.answers if answer.feedback is not None]
+        with self._lock:
+            if session.id in self._recorded or not scored:
+                return False
+
+            questions = {question.id: question for question in session.questions}
+            answers: Dict[str, List] = {name: [] for name in ANSWER_COLUMNS if name != "session"}
+            for answer in scored:
+                question = questions.get(answer.question_id)
+                answers["timestamp"].append(answer.timestamp.timestamp())
+                answers["score"].append(answer.feedback.score)
+                answers["category"].append(self._category_code(question.category if question else "Other"))
+                answers["difficulty"].append(_DIFFICULTY_CODES[question.difficulty if question else session.difficulty])
+                answers["type"].append(_TYPE_CODES[question.type if question else session.type])
+                answers["time_spent"].append(answer.time_spent)
+                answers["confidence"].append(answer.confidence)
+
+            start = session.start_time.timestamp()
+            end = session.end_time.timestamp() if session.end_time else max(answers["timestamp"])
+            history = self._users.setdefault(user_id, UserHistory())
+            history.append(answers, {
+                "start": start,
+                "duration": max(0.0, end - start),
+                "score": session.score if session.score is not None else float(np.mean(answers["score"])),
+                "type": _TYPE_CODES[session.type],
+                "difficulty": _DIFFICULTY_CODES[session.difficulty],
+                "answered": len(scored),
+            })
+            self._recorded[session.id] = None
+            if len(self._recorded) > self.max_recorded:
+                self._recorded.popitem(last=False)
+            self._dirty = True
+        return True
+
+    def has_user(self, user_id: str) -> bool:
+        return user_id in self._users
+
+    # Queries
+
+    def dashboard(self, user_id: str, time_range: str = "all", recent: int = 5) -> Dict[str, Any]:
+        """Everything the analytics dashboard shows, for one user and time range"""
+        history, cutoff = self._resolve(user_id, time_range)
+        with self._lock:
+            return history.cached(("dashboard", cutoff, recent),
+                                  lambda: self._dashboard(history, cutoff, recent))
+
+    def trend(self, user_id: str, bucket: str = "week", time_range: str = "all") -> List[Dict[str, Any]]:
+        """Average answer score per calendar week or month"""
+        if bucket not in ("week", "month"):
+            raise ValueError("bucket must be 'week' or 'month'")
+        history, cutoff = self._resolve(user_id, time_range)
+        with self._lock:
+            return history.cached(("trend", bucket, cutoff), lambda: self._trend(history, bucket, cutoff))
+
+    def categories_progress(self, user_id: str, time_range: str = "all", points: int = 5) -> Dict[str, Any]:
+        """Per-category average, recent per-session scores and improvement"""
+        history, cutoff = self._resolve(user_id, time_range)
+        with self._lock:
+            return history.cached(("categories", cutoff, points),
+                                  lambda: self._categories(history, cutoff, points))
+
+    def _resolve(self, user_id: str, time_range: str):
+        if time_range not in TIME_RANGES:
+            raise ValueError(f"time_range must be one of: {', '.join(TIME_RANGES)}")
+        history = self._users.get(user_id)
+        if history is None:
+            raise KeyError(user_id)
+        window = TIME_RANGES[time_range]
+        # Rounded to the minute so cached rollups are reused between nearby requests
+        cutoff = None if window is None else (int(time.time()) // 60) * 60 - window
+        return history, cutoff
+
+    @staticmethod
+    def _answer_rows(history: UserHistory, cutoff: Optional[float]) -> Dict[str, np.ndarray]:
+        columns = {name: column.view() for name, column in history.answers.items()}
+        if cutoff is None:
+            return columns
+        mask = columns["timestamp"] >= cutoff
+        return {name: values[mask] for name, values in columns.items()}
+
+    @staticmethod
+    def _session_rows(history: UserHistory, cutoff: Optional[float]) -> Dict[str, np.ndarray]:
+        columns = {name: column.view() for name, column in history.sessions.items()}
+        if cutoff is None:
+            return columns
+        mask = columns["start"] >= cutoff
+        return {name: values[mask] for name, values in columns.items()}
+
+    def _category_means(self, answers: Dict[str, np.ndarray]) -> Dict[str, float]:
+        counts = np.bincount(answers["category"], minlength=len(self.categories))
+        totals = np.bincount(answers["category"], weights=answers["score"], minlength=len(self.categories))
+        present = np.nonzero(counts)[0]
+        return {self.categories[code]: float(totals[code] / counts[code]) for code in present}
+
+    def _dashboard(self, history: UserHistory, cutoff: Optional[float], recent: int) -> Dict[str, Any]:
+        answers = self._answer_rows(history, cutoff)
+        sessions = self._session_rows(history, cutoff)
+        session_count = len(sessions["start"])
+
+        # Improvement: latest sessions against the earliest ones in the range
+        improvement = 0.0
+        if session_count >= 2:
+            order = np.argsort(sessions["start"], kind="stable")
+            scores = sessions["score"][order]
+            window = max(1, min(5, session_count // 2))
+            first, last = float(scores[:window].mean()), float(scores[-window:].mean())
+            improvement = (last - first) / first * 100 if first else 0.0
+
+        category_means = sorted(self._category_means(answers).items(), key=lambda item: item[1], reverse=True)
+        strongest = [name for name, _ in category_means[:2]]
+        recent_rows = np.argsort(sessions["start"], kind="stable")[::-1][:recent]
+
+        return {
+            "totalSessions": session_count,
+            "totalQuestions": int(len(answers["score"])),
+            "averageScore": round(float(answers["score"].mean()), 1) if len(answers["score"]) else 0.0,
+            "totalPracticeTime": round(float(answers["time_spent"].sum()) / 60, 1),
+            "averageConfidence": round(float(answers["confidence"].mean()), 1) if len(answers["confidence"]) else 0.0,
+            "improvementRate": round(improvement, 1),
+            "strongestCategories": strongest,
+            "weakestCategories": [name for name, _ in category_means[::-1] if name not in strongest][:2],
+            "recentSessions": [
+                {
+                    "date": time.strftime("%Y-%m-%d", time.gmtime(float(sessions["start"][row]))),
+                    "type": _TYPES[sessions["type"][row]].value,
+                    "score": round(float(sessions["score"][row]), 1),
+                    "duration": round(float(sessions["duration"][row]) / 60, 1),
+                }
+                for row in recent_rows
+            ],
+        }
+
+    def _trend(self, history: UserHistory, bucket: str, cutoff: Optional[float]) -> List[Dict[str, Any]]:
+        answers = self._answer_rows(history, cutoff)
+        if not len(answers["score"]):
+            return []
+
+        days = (answers["timestamp"] // _DAY).astype(np.int64)
+        if bucket == "week":
+            # Day 0 (1970-01-01) is a Thursday; shift so weeks start on Monday
+            periods = (days + 3) // 7
+        else:
+            periods = days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+
+        keys, inverse = np.unique(periods, return_inverse=True)
+        counts = np.bincount(inverse)
+        totals = np.bincount(inverse, weights=answers["score"])
+        # Distinct sessions per period: unique (period, session) pairs counted per period
+        pairs = np.unique(inverse.astype(np.int64) * history.sessions["start"].size + answers["session"])
+        sessions = np.bincount(pairs // history.sessions["start"].size, minlength=len(keys))
+
+        if bucket == "week":
+            labels = (keys * 7 - 3).astype("datetime64[D]").astype(str)
+        else:
+            labels = keys.astype("datetime64[M]").astype(str)
+
+        return [
+            {"period": str(label), "score": round(float(total / count), 1),
+             "questions": int(count), "sessions": int(session_count)}
+            for label, total, count, session_count in zip(labels, totals, counts, sessions)
+        ]
+
+    def _categories(self, history: UserHistory, cutoff: Optional[float], points: int) -> Dict[str, Any]:
+        answers = self._answer_rows(history, cutoff)
+        if not len(answers["score"]):
+            return {}
+
+        # Average score per (category, session), in session order
+        session_count = history.sessions["start"].size
+        pair = answers["category"].astype(np.int64) * session_count + answers["session"]
+        keys, inverse = np.unique(pair, return_inverse=True)
+        means = np.bincount(inverse, weights=answers["score"]) / np.bincount(inverse)
+        categories = keys // session_count
+
+        result = {}
+        for code in np.unique(categories):
+            series = means[categories == code]
+            result[self.categories[code]] = {
+                "average": round(float(series.mean()), 1),
+                "sessions": int(len(series)),
+                "scores": [round(float(score), 1) for score in series[-points:]],
+                "improvement": round(float(series[-1] - series[0]), 1),
+            }
+        return result
+
+    # Persistence
+
+    def maybe_save(self) -> None:
+        """Persist if there are new sessions and ``save_interval`` has passed"""
+        if self.path and self._dirty and time.monotonic() - self._last_save >= self.save_interval:
+            self.save()
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = path or self.path
+        if not path:
+            return
+        with self._save_lock:
+            with self._lock:
+                # Columns only ever grow past their current size, so these views stay
+                # valid after the lock is released; the copying happens outside it
+                users = list(self._users)
+                answer_views = {name: [self._users[u].answers[name].view() for u in users] for name in ANSWER_COLUMNS}
+                session_views = {name: [self._users[u].sessions[name].view() for u in users] for name in SESSION_COLUMNS}
+                categories = list(self.categories)
+                recorded = list(self._recorded)
+                self._dirty = False
+                self._last_save = time.monotonic()
+
+            arrays: Dict[str, np.ndarray] = {
+                "users": np.array(users, dtype=str),
+                "categories": np.array(categories, dtype=str),
+                "recorded": np.array(recorded, dtype=str),
+                "answer_user": np.repeat(np.arange(len(users), dtype=np.int32),
+                                         [len(view) for view in answer_views["score"]]),
+                "session_user": np.repeat(np.arange(len(users), dtype=np.int32),
+                                          [len(view) for view in session_views["start"]]),
+            }
+            for name, dtype in ANSWER_COLUMNS.items():
+                arrays[f"answer_{name}"] = np.concatenate(answer_views[name] or [np.empty(0, dtype)])
+            for name, dtype in SESSION_COLUMNS.items():
+                arrays[f"session_{name}"] = np.concatenate(session_views[name] or [np.empty(0, dtype)])
+
+            # Write then rename so a crash never leaves a truncated file
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(temp_path, path)
+
+    @staticmethod
+    def _split_by_user(data: Any, prefix: str, columns: Dict[str, Any], user_count: int) -> List[Dict[str, np.ndarray]]:
+        """Group a table's rows by user with one sort, instead of one mask per user"""
+        owners = data[f"{prefix}_user"]
+        order = np.argsort(owners, kind="stable")
+        bounds = np.searchsorted(owners[order], np.arange(user_count + 1))
+        sorted_columns = {name: data[f"{prefix}_{name}"][order] for name in columns}
+        return [
+            {name: values[bounds[index]:bounds[index + 1]] for name, values in sorted_columns.items()}
+            for index in range(user_count)
+        ]
+
+    def load(self, path: str) -> None:
+        with np.load(path) as data, self._lock:
+            users = [str(user) for user in data["users"]]
+            self.categories = [str(category) for category in data["categories"]]
+            self._category_codes = {category: code for code, category in enumerate(self.categories)}
+            self._recorded = OrderedDict.fromkeys(str(session_id) for session_id in data["recorded"][-self.max_recorded:])
+            answers = self._split_by_user(data, "answer", ANSWER_COLUMNS, len(users))
+            sessions = self._split_by_user(data, "session", SESSION_COLUMNS, len(users))
+            self._users = {}
+            for index, user_id in enumerate(users):
+                history = UserHistory()
+                for name, column in history.answers.items():
+                    column.extend(answers[index][name])
+                for name, column in history.sessions.items():
+                    column.extend(sessions[index][name])
+                self._users[user_id] = history
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "users": len(self._users),
+                "sessions": sum(history.sessions["start"].size for history in self._users.values()),
+                "answers": sum(history.answers["score"].size for history in self._users.values()),
+                "categories": len(self.categories),
+            }
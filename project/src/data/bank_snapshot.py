@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+import time
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from src.data.question_index import QuestionIndex
+from src.data.reference_index import ReferenceIndex
+from src.models.interview_models import DifficultyLevel, InterviewType, Question
+
+
+def bank_version(questions: Sequence[Question]) -> str:
+    """Content hash of a bank, including the (normally excluded) reference answers and key points"""
+    digest = hashlib.sha256()
+    for question in questions:
+        digest.update(question.model_dump_json().encode())
+        digest.update(json.dumps([question.reference_answers, question.key_points]).encode())
+    return digest.hexdigest()[:16]
+
+
+class QuestionBankSnapshot:
+    """One immutable version of the question bank together with its derived indexes.
+
+    Everything is built in the constructor, so a snapshot is complete before
+    anyone can see it; replacing the bank means building a new snapshot and
+    swapping a single reference. Sessions keep the id mapping of the snapshot
+    they started on, so a reload never changes questions under them.
+    """
+
+    __slots__ = ("questions", "version", "source", "loaded_at", "by_id", "index", "references", "_buckets")
+
+    def __init__(self, questions: Sequence[Question], source: str = "builtin"):
+        self.questions: Tuple[Question, ...] = tuple(questions)
+        by_id: Dict[str, Question] = {}
+        for question in self.questions:
+            if question.id in by_id:
+                raise ValueError(f"Duplicate question id: {question.id}")
+            by_id[question.id] = question
+
+        self.version = bank_version(self.questions)
+        self.source = source
+        self.loaded_at = time.time()
+        self.by_id: Mapping[str, Question] = MappingProxyType(by_id)
+        self.index = QuestionIndex(self.questions)
+        self.references = ReferenceIndex(self.questions)
+        # Difficulty buckets per type for adaptive sessions
+        self._buckets: Dict[InterviewType, Dict[DifficultyLevel, Tuple[Question, ...]]] = {}
+        for interview_type in InterviewType:
+            questions_of_type, _ = self.index.filter(type=interview_type)
+            self._buckets[interview_type] = {
+                level: tuple(q for q in questions_of_type if q.difficulty == level)
+                for level in DifficultyLevel
+            }
+
+    @classmethod
+    def from_file(cls, path: str) -> "QuestionBankSnapshot":
+        """Load a bank from a JSON array of questions (reference answers and key points included)"""
+        with open(path) as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError("Question bank file must contain a JSON array of questions")
+        return cls([Question.model_validate(item) for item in data], source=path)
+
+    def to_file(self, path: str) -> None:
+        """Write the bank in the format ``from_file`` reads"""
+        # Reference answers and key points are excluded from model dumps, so add them back
+        data = [
+            {**q.model_dump(mode="json"), "reference_answers": q.reference_answers, "key_points": q.key_points}
+            for q in self.questions
+        ]
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, path)
+
+    def get(self, question_id: str) -> Optional[Question]:
+        return self.by_id.get(question_id)
+
+    def by_type(self, interview_type: InterviewType, difficulty: Optional[DifficultyLevel] = None) -> List[Question]:
+        questions, _ = self.index.filter(type=interview_type, difficulty=difficulty)
+        return questions
+
+    def by_skills(self, skills: List[str]) -> List[Question]:
+        skills_lower = [skill.lower() for skill in skills]
+        return [
+            question for question in self.questions
+            if any(skill in question.category.lower() or skill in question.text.lower() for skill in skills_lower)
+        ]
+
+    def difficulty_buckets(self, interview_type: InterviewType) -> Dict[DifficultyLevel, Tuple[Question, ...]]:
+        return self._buckets[InterviewType(interview_type)]
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "version": self.version,
+            "questions": len(self.questions),
+            "source": self.source,
+            "loaded_at": self.loaded_at,
+        }
@@ -1,5 +1,8 @@
-from typing import List, Dict
+import os
+import threading
+from typing import Callable, List, Dict, Optional, Tuple
 from src.models.interview_models import Question, InterviewType, DifficultyLevel, AnswerFormat
+from src.data.bank_snapshot import QuestionBankSnapshot
 
 QUESTION_BANK: List[Question] = [
     # Technical Questions - Beginner
@@ -14,6 +17,21 @@ QUESTION_BANK: List[Question] = [
         follow_up_prompts=[
             "Can you provide examples of when you would use each?",
             "What happens with hoisting in each case?"
+        ],
+        reference_answers=[
+            (
+                "var is function scoped and hoisted with an initial value of undefined, so it can be read "
+                "before its declaration and redeclared. let and const are block scoped and sit in the "
+                "temporal dead zone until their declaration runs, so using them earlier throws a "
+                "ReferenceError. let can be reassigned while const cannot, although a const object can "
+                "still be mutated. Prefer const by default, let when the value changes, and avoid var."
+            )
+        ],
+        key_points=[
+            "var is function scoped while let and const are block scoped",
+            "var is hoisted and initialized as undefined; let and const are in the temporal dead zone",
+            "const cannot be reassigned but const objects can still be mutated",
+            "var can be redeclared in the same scope, let and const cannot"
         ]
     ),
     Question(
@@ -23,7 +41,21 @@ QUESTION_BANK: List[Question] = [
         difficulty=DifficultyLevel.BEGINNER,
         category="JavaScript",
         time_limit=120,
-        expected_answer_format=AnswerFormat.TECHNICAL
+        expected_answer_format=AnswerFormat.TECHNICAL,
+        reference_answers=[
+            (
+                "== compares values after type coercion, so 0 == '0' and null == undefined are true. === is "
+                "strict equality and compares both value and type without coercion, so 0 === '0' is false. "
+                "Strict equality is more predictable and should be the default; == is mainly useful for "
+                "checking null or undefined together."
+            )
+        ],
+        key_points=[
+            "== performs type coercion before comparing",
+            "=== compares value and type without coercion",
+            "prefer strict equality === for predictable comparisons",
+            "null == undefined is true but null === undefined is false"
+        ]
     ),
     Question(
         id="tech-003",
@@ -32,7 +64,23 @@ QUESTION_BANK: List[Question] = [
         difficulty=DifficultyLevel.BEGINNER,
         category="Web Development",
         time_limit=240,
-        expected_answer_format=AnswerFormat.TECHNICAL
+        expected_answer_format=AnswerFormat.TECHNICAL,
+        reference_answers=[
+            (
+                "REST is an architectural style for APIs built on HTTP where resources are identified by "
+                "URLs and manipulated with standard methods such as GET, POST, PUT and DELETE. Requests are "
+                "stateless, so each one carries everything the server needs. Responses use representations "
+                "like JSON with meaningful status codes, can be cacheable, and the interface is uniform, "
+                "with a client-server separation and a layered system."
+            )
+        ],
+        key_points=[
+            "resources are identified by URLs or URIs",
+            "standard HTTP methods GET POST PUT DELETE map to operations",
+            "stateless requests: each request contains all needed information",
+            "responses can be cacheable",
+            "uniform interface with client-server separation and status codes"
+        ]
     ),
 
     # Technical Questions - Intermediate
@@ -47,6 +95,22 @@ QUESTION_BANK: List[Question] = [
         follow_up_prompts=[
             "Can you do this iteratively and recursively?",
             "What's the time and space complexity?"
+        ],
+        reference_answers=[
+            (
+                "Walk the list with three pointers: previous starts as null and current starts at the head. "
+                "For each node, save next, point current.next at previous, then advance previous and "
+                "current. When current is null, previous is the new head. This runs in O(n) time and O(1) "
+                "space; a recursive version reverses the rest of the list first and then links the node "
+                "back, using O(n) stack space."
+            )
+        ],
+        key_points=[
+            "iterate with previous, current and next pointers",
+            "point each node's next to the previous node",
+            "return previous as the new head when current is null",
+            "O(n) time and O(1) space iteratively",
+            "recursive solution uses O(n) stack space"
         ]
     ),
     Question(
@@ -56,7 +120,23 @@ QUESTION_BANK: List[Question] = [
         difficulty=DifficultyLevel.INTERMEDIATE,
         category="JavaScript",
         time_limit=300,
-        expected_answer_format=AnswerFormat.TECHNICAL
+        expected_answer_format=AnswerFormat.TECHNICAL,
+        reference_answers=[
+            (
+                "A closure is a function bundled with its lexical scope, so it keeps access to variables of "
+                "the outer function even after that function has returned. For example, a counter factory "
+                "returns an inner function that increments a private count variable. Closures enable data "
+                "privacy, function factories, memoization and callbacks that remember state, but captured "
+                "variables stay in memory and var in loops shares one binding across iterations."
+            )
+        ],
+        key_points=[
+            "a closure is a function that retains access to its outer lexical scope",
+            "inner function can use variables after the outer function returned",
+            "example such as a counter or function factory",
+            "used for data privacy and encapsulation of private state",
+            "captured variables stay in memory; var in loops shares one binding"
+        ]
     ),
     Question(
         id="tech-103",
@@ -65,7 +145,23 @@ QUESTION_BANK: List[Question] = [
         difficulty=DifficultyLevel.INTERMEDIATE,
         category="Database",
         time_limit=360,
-        expected_answer_format=AnswerFormat.TECHNICAL
+        expected_answer_format=AnswerFormat.TECHNICAL,
+        reference_answers=[
+            (
+                "Start by measuring: run EXPLAIN or EXPLAIN ANALYZE to read the execution plan and find "
+                "full table scans or expensive joins. Add indexes on columns used in WHERE, JOIN and ORDER "
+                "BY clauses, and avoid SELECT * by fetching only needed columns. Rewrite inefficient "
+                "subqueries, fix N+1 query patterns, paginate large results, and consider caching, "
+                "denormalization or partitioning for very large tables."
+            )
+        ],
+        key_points=[
+            "analyze the execution plan with EXPLAIN",
+            "add indexes on filtered, joined and sorted columns",
+            "select only needed columns instead of SELECT *",
+            "rewrite subqueries and avoid N+1 queries",
+            "use caching, pagination or partitioning for large data"
+        ]
     ),
 
     # Technical Questions - Advanced
@@ -81,6 +177,24 @@ QUESTION_BANK: List[Question] = [
             "How would you handle data consistency?",
             "What about caching strategies?",
             "How would you scale the database?"
+        ],
+        reference_answers=[
+            (
+                "Put stateless application servers behind load balancers so the tier scales horizontally, "
+                "with a CDN for static content and media. Cache hot data such as feeds and profiles in a "
+                "distributed cache like Redis. Scale the database with read replicas and sharding by user, "
+                "and use asynchronous message queues for fan-out of posts, notifications and feed "
+                "generation. Accept eventual consistency where possible, and add monitoring, rate limiting "
+                "and multi-region redundancy."
+            )
+        ],
+        key_points=[
+            "load balancers in front of stateless horizontally scaled servers",
+            "CDN for static content and media",
+            "caching layer such as Redis for hot data",
+            "database replication and sharding",
+            "message queues for asynchronous fan-out and notifications",
+            "eventual consistency trade-offs and monitoring"
         ]
     ),
     Question(
@@ -90,7 +204,24 @@ QUESTION_BANK: List[Question] = [
         difficulty=DifficultyLevel.ADVANCED,
         category="System Design",
         time_limit=900,
-        expected_answer_format=AnswerFormat.TECHNICAL
+        expected_answer_format=AnswerFormat.TECHNICAL,
+        reference_answers=[
+            (
+                "Consistent hashing places cache nodes and keys on a hash ring; each key belongs to the "
+                "first node clockwise from its hash. Adding or removing a node only remaps the keys between "
+                "it and its neighbor instead of reshuffling everything. Virtual nodes give each server "
+                "many ring positions to balance load. Each node runs an LRU cache with eviction and TTLs, "
+                "and keys are replicated to the next nodes on the ring for fault tolerance."
+            )
+        ],
+        key_points=[
+            "keys and nodes are placed on a hash ring",
+            "a key maps to the next node clockwise on the ring",
+            "adding or removing a node only remaps a small share of keys",
+            "virtual nodes balance the load",
+            "replication to neighboring nodes for fault tolerance",
+            "eviction policy such as LRU and TTL expiration"
+        ]
     ),
 
     # Behavioral Questions
@@ -185,6 +316,22 @@ QUESTION_BANK: List[Question] = [
         follow_up_prompts=[
             "What research methods would you use?",
             "How would you measure success?"
+        ],
+        reference_answers=[
+            (
+                "Start with research: analytics to find drop-off points, user interviews and usability "
+                "testing to understand pain points. Prioritize problems by impact, then simplify key flows "
+                "such as onboarding and navigation, improve performance and accessibility, and follow "
+                "platform conventions. Prototype and A/B test the changes, and measure success with metrics "
+                "like task completion, retention and app store ratings."
+            )
+        ],
+        key_points=[
+            "user research such as interviews and usability testing",
+            "analytics to find drop-off points and pain points",
+            "simplify navigation and key flows like onboarding",
+            "prototype and A/B test changes",
+            "measure success with metrics like retention and task completion"
         ]
     ),
     Question(
@@ -201,30 +348,118 @@ QUESTION_BANK: List[Question] = [
         type=InterviewType.DESIGN,
         difficulty=DifficultyLevel.INTERMEDIATE,
         category="User Research",
-        time_limit=240
+        time_limit=240,
+        reference_answers=[
+            (
+                "Define the research goals and questions first, then choose methods: interviews and "
+                "contextual inquiry for needs, surveys for scale, and usability testing of prototypes. "
+                "Recruit participants that represent the target users, run the sessions without leading "
+                "questions, and synthesize findings with affinity mapping into personas or journey maps. "
+                "Share insights with the team and turn them into prioritized design decisions."
+            )
+        ],
+        key_points=[
+            "define research goals and questions",
+            "choose methods such as interviews, surveys and usability testing",
+            "recruit representative participants",
+            "synthesize findings with affinity mapping or personas",
+            "share insights and turn them into design decisions"
+        ]
     )
 ]
 
+# The active bank and its indexes; replaced as a whole on reload, never mutated
+_snapshot = QuestionBankSnapshot(QUESTION_BANK)
+_reload_lock = threading.Lock()
+_reload_listeners: List[Callable[[QuestionBankSnapshot], None]] = []
+_reload_stats = {"reloads": 0, "failed_reloads": 0}
+
+def current_snapshot() -> QuestionBankSnapshot:
+    """The question bank snapshot in use; callers keep the reference for the rest of their work"""
+    return _snapshot
+
+def add_reload_listener(listener: Callable[[QuestionBankSnapshot], None]) -> None:
+    """Call ``listener`` with each new snapshot after a reload"""
+    _reload_listeners.append(listener)
+
+def reload_question_bank(path: Optional[str] = None) -> QuestionBankSnapshot:
+    """Build a snapshot from ``path`` (or the built-in bank) and make it current.
+
+    The snapshot and all its indexes are built before the swap, so readers
+    see either the old bank or the new one, never a mix. On an invalid file
+    the exception propagates and the current snapshot stays in place.
+    """
+    global _snapshot
+    with _reload_lock:
+        try:
+            snapshot = QuestionBankSnapshot.from_file(path) if path else QuestionBankSnapshot(QUESTION_BANK)
+        except Exception:
+            _reload_stats["failed_reloads"] += 1
+            raise
+        if (snapshot.version, snapshot.source) == (_snapshot.version, _snapshot.source):
+            return _snapshot
+        _snapshot = snapshot
+        _reload_stats["reloads"] += 1
+        for listener in _reload_listeners:
+            listener(snapshot)
+        return snapshot
+
+def question_bank_stats() -> Dict[str, object]:
+    return {**_snapshot.summary(), **_reload_stats}
+
+class QuestionBankWatcher:
+    """Reload the bank when its file changes, polling the file's mtime and size"""
+
+    def __init__(self, path: str, interval: float = 5.0):
+        self.path = path
+        self.interval = interval
+        self.last_error: Optional[str] = None
+        self._signature = self._stat()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="question-bank-watcher", daemon=True)
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def start(self) -> "QuestionBankWatcher":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def check(self) -> bool:
+        """Reload if the file changed since the last check; True if a new snapshot was installed"""
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        previous = current_snapshot()
+        try:
+            snapshot = reload_question_bank(self.path)
+        except Exception as e:
+            # Keep serving the previous bank until the file is fixed
+            self.last_error = f"{type(e).__name__}: {e}"
+            return False
+        self.last_error = None
+        return snapshot is not previous
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+def get_question_by_id(question_id: str) -> Optional[Question]:
+    """Get a bank question by its id"""
+    return _snapshot.get(question_id)
+
 def get_questions_by_type(interview_type: InterviewType, difficulty: DifficultyLevel = None) -> List[Question]:
     """Get questions filtered by type and optionally by difficulty"""
-    questions = QUESTION_BANK
-    
-    if interview_type != InterviewType.MIXED:
-        questions = [q for q in questions if q.type == interview_type]
-    
-    if difficulty:
-        questions = [q for q in questions if q.difficulty == difficulty]
-    
-    return questions
+    return _snapshot.by_type(interview_type, difficulty)
 
 def get_questions_by_skills(skills: List[str]) -> List[Question]:
     """Get questions that match the provided skills"""
-    relevant_questions = []
-    skills_lower = [skill.lower() for skill in skills]
-    
-    for question in QUESTION_BANK:
-        if any(skill in question.category.lower() or skill in question.text.lower() 
-               for skill in skills_lower):
-            relevant_questions.append(question)
-    
-    return relevant_questions
\ No newline at end of file
+    return _snapshot.by_skills(skills)
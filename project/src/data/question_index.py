@@ -0,0 +1,96 @@
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.models.interview_models import DifficultyLevel, InterviewType, Question
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens used for question text search"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class QuestionIndex:
+    """Secondary indexes over a list of questions for filtered, paginated lookups.
+
+    Questions are addressed by their position in the source list, which is
+    also the pagination order. Every posting list is kept sorted so a page
+    can resume right after a cursor position.
+    """
+
+    def __init__(self, questions: Sequence[Question]):
+        self.questions: Tuple[Question, ...] = tuple(questions)
+        self.by_id: Dict[str, int] = {}
+        self.by_type: Dict[InterviewType, List[int]] = {}
+        self.by_difficulty: Dict[DifficultyLevel, List[int]] = {}
+        self.by_category: Dict[str, List[int]] = {}
+        self.by_token: Dict[str, List[int]] = {}
+
+        for position, question in enumerate(self.questions):
+            self.by_id[question.id] = position
+            self.by_type.setdefault(question.type, []).append(position)
+            self.by_difficulty.setdefault(question.difficulty, []).append(position)
+            self.by_category.setdefault(question.category.lower(), []).append(position)
+            for token in set(tokenize(f"{question.text} {question.category}")):
+                self.by_token.setdefault(token, []).append(position)
+
+        # (time_limit, position) pairs sorted for range queries
+        self._by_time_limit = sorted((q.time_limit, p) for p, q in enumerate(self.questions))
+        self._time_keys = [time_limit for time_limit, _ in self._by_time_limit]
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def get(self, question_id: str) -> Optional[Question]:
+        position = self.by_id.get(question_id)
+        return None if position is None else self.questions[position]
+
+    def filter(self, type: Optional[InterviewType] = None, difficulty: Optional[DifficultyLevel] = None,
+               category: Optional[str] = None, search: Optional[str] = None,
+               min_time_limit: Optional[int] = None, max_time_limit: Optional[int] = None,
+               after: int = -1, limit: Optional[int] = None) -> Tuple[List[Question], Optional[int]]:
+        """Return up to ``limit`` matches positioned after ``after``, plus the last position if more remain"""
+        postings: List[Sequence[int]] = []
+        if type is not None and type != InterviewType.MIXED:
+            postings.append(self.by_type.get(type, []))
+        if difficulty is not None:
+            postings.append(self.by_difficulty.get(difficulty, []))
+        if category:
+            postings.append(self.by_category.get(category.lower(), []))
+        if search:
+            postings.extend(self.by_token.get(token, []) for token in tokenize(search))
+
+        has_time_range = min_time_limit is not None or max_time_limit is not None
+        low = min_time_limit if min_time_limit is not None else float("-inf")
+        high = max_time_limit if max_time_limit is not None else float("inf")
+
+        if postings:
+            # Walk the shortest posting list and probe the others by bisection
+            postings.sort(key=len)
+            driver, others = postings[0], postings[1:]
+        elif has_time_range:
+            start, end = bisect_left(self._time_keys, low), bisect_right(self._time_keys, high)
+            driver, others = sorted(p for _, p in self._by_time_limit[start:end]), []
+        else:
+            driver, others = range(len(self.questions)), []
+
+        matches: List[Question] = []
+        last_position = after
+        for position in driver[bisect_right(driver, after):]:
+            if not all(_contains(other, position) for other in others):
+                continue
+            question = self.questions[position]
+            if has_time_range and not low <= question.time_limit <= high:
+                continue
+            if limit is not None and len(matches) == limit:
+                return matches, last_position
+            matches.append(question)
+            last_position = position
+        return matches, None
+
+
+def _contains(sorted_positions: Sequence[int], position: int) -> bool:
+    index = bisect_left(sorted_positions, position)
+    return index < len(sorted_positions) and sorted_positions[index] == position
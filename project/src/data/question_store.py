@@ -0,0 +1,254 @@
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+from pydantic import ValidationError
+
+from src.models.interview_models import Question
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no cross-process locking (e.g. Windows)
+    fcntl = None
+
+_WORD_PATTERN = re.compile(r"[a-z0-9+#.]+")
+# Questions whose word sets overlap at least this much count as duplicates
+DUPLICATE_JACCARD = 0.6
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(skill.lower().split())
+
+
+def _words(text: str) -> frozenset:
+    return frozenset(_WORD_PATTERN.findall(text.lower()))
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Exclusive lock on ``path``'s sidecar lock file, shared by every process saving to ``path``"""
+    if fcntl is None:
+        yield
+        return
+    with open(f"{path}.lock", "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class _DuplicateIndex:
+    """Exact word-set Jaccard lookup that only compares candidates sharing a prefix word.
+
+    Each word set is ordered rarest word first (by document frequency in the
+    bank it was built from) and indexed under its prefix: the words it cannot
+    lose and still reach the threshold. Two sets at or above the threshold
+    always share a prefix word, so nothing is missed, and the rare words in
+    prefixes keep candidate lists short.
+    """
+
+    def __init__(self, bank_words: Sequence[frozenset], threshold: float = DUPLICATE_JACCARD):
+        self.threshold = threshold
+        self._df = Counter(word for words in bank_words for word in words)
+        self._sets: List[frozenset] = []
+        self._postings: Dict[str, List[int]] = {}
+        for words in bank_words:
+            self.add(words)
+
+    def _prefix(self, words: frozenset) -> List[str]:
+        ordered = sorted(words, key=lambda word: (self._df.get(word, 0), word))
+        # Small epsilon so float noise (0.6 * 5 = 3.0000000000000004) cannot shorten the prefix
+        return ordered[:len(ordered) - math.ceil(self.threshold * len(ordered) - 1e-9) + 1]
+
+    def add(self, words: frozenset) -> None:
+        position = len(self._sets)
+        self._sets.append(words)
+        for word in self._prefix(words):
+            self._postings.setdefault(word, []).append(position)
+
+    def is_duplicate(self, words: frozenset) -> bool:
+        candidates = {position for word in self._prefix(words) for position in self._postings.get(word, ())}
+        return any(_jaccard(words, self._sets[position]) >= self.threshold for position in candidates)
+
+
+def generated_question_id(skill: str, text: str) -> str:
+    """Stable id, so regenerating the same question never creates a second copy"""
+    slug = re.sub(r"[^a-z0-9]+", "-", normalize_skill(skill)).strip("-") or "skill"
+    return f"gen-{slug}-{hashlib.sha1(' '.join(text.lower().split()).encode()).hexdigest()[:8]}"
+
+
+class GeneratedQuestionStore:
+    """Local store of LLM-generated questions for skills the bank does not cover.
+
+    Questions are indexed by skill and by word set; a new question is only
+    accepted if it is not a near-duplicate of a bank question or of one
+    already stored. The store is persisted so coverage grows across
+    restarts and generation is a one-off cost per skill; saves merge with
+    whatever other processes (API workers, the CLI) saved to the same file.
+    """
+
+    def __init__(self, bank: Sequence[Question], path: Optional[str] = None,
+                 save_interval: float = 60.0, retry_after: float = 86400.0,
+                 failure_retry_after: float = 300.0):
+        self.path = path
+        self.save_interval = save_interval
+        # A skill that got a usable generation is not regenerated before this many seconds
+        self.retry_after = retry_after
+        # A skill whose generation failed (LLM error, unparseable output) is retried sooner
+        self.failure_retry_after = failure_retry_after
+        self._retry_at: Dict[str, float] = {}
+        self._duplicates = _DuplicateIndex([_words(q.text) for q in bank])
+        self._questions: Dict[str, Question] = {}
+        self._by_skill: Dict[str, List[str]] = {}
+        self._words: Dict[str, frozenset] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._stats = {"accepted": 0, "duplicates": 0, "invalid": 0}
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def set_bank(self, bank: Sequence[Question]) -> None:
+        """Check new questions against ``bank`` from now on, e.g. after the bank is reloaded"""
+        bank_words = [_words(q.text) for q in bank]
+        with self._lock:
+            # Word order depends on the bank, so the index is rebuilt rather than patched
+            self._duplicates = _DuplicateIndex(bank_words)
+            for words in self._words.values():
+                self._duplicates.add(words)
+
+    def get(self, question_id: str) -> Optional[Question]:
+        return self._questions.get(question_id)
+
+    def by_skills(self, skills: Iterable[str]) -> List[Question]:
+        """Stored questions generated for any of ``skills``"""
+        seen: Set[str] = set()
+        questions = []
+        with self._lock:
+            for skill in skills:
+                for question_id in self._by_skill.get(normalize_skill(skill), ()):
+                    if question_id not in seen:
+                        seen.add(question_id)
+                        questions.append(self._questions[question_id])
+        return questions
+
+    def count(self, skill: str) -> int:
+        return len(self._by_skill.get(normalize_skill(skill), ()))
+
+    def claim(self, skills: Iterable[str]) -> List[str]:
+        """Skills due for generation; they are held back for ``failure_retry_after`` until ``settle``"""
+        now = time.monotonic()
+        claimed = []
+        with self._lock:
+            for skill in skills:
+                skill = normalize_skill(skill)
+                if now >= self._retry_at.get(skill, 0.0):
+                    self._retry_at[skill] = now + self.failure_retry_after
+                    claimed.append(skill)
+        return claimed
+
+    def settle(self, skills: Iterable[str]) -> None:
+        """Start the full ``retry_after`` cooldown for skills whose generation succeeded"""
+        retry_at = time.monotonic() + self.retry_after
+        with self._lock:
+            for skill in skills:
+                self._retry_at[normalize_skill(skill)] = retry_at
+
+    def _is_duplicate(self, words: frozenset) -> bool:
+        return self._duplicates.is_duplicate(words)
+
+    def add(self, skill: str, data: Dict[str, Any]) -> Optional[Question]:
+        """Validate a generated question and store it unless it is invalid or a duplicate"""
+        skill = normalize_skill(skill)
+        try:
+            question = Question(
+                id=generated_question_id(skill, str(data.get("text", ""))),
+                category=skill.title(),
+                **{key: value for key, value in data.items() if key not in ("id", "category", "skill")}
+            )
+        except (ValidationError, TypeError):
+            question = None
+        if question is None or len(question.text.split()) < 4:
+            with self._lock:
+                self._stats["invalid"] += 1
+            return None
+
+        words = _words(question.text)
+        with self._lock:
+            if question.id in self._questions or self._is_duplicate(words):
+                self._stats["duplicates"] += 1
+                return None
+            self._index(skill, question, words)
+            self._stats["accepted"] += 1
+            self._dirty = True
+        return question
+
+    def _index(self, skill: str, question: Question, words: frozenset) -> None:
+        self._questions[question.id] = question
+        self._by_skill.setdefault(skill, []).append(question.id)
+        self._words[question.id] = words
+        self._duplicates.add(words)
+
+    def maybe_save(self) -> None:
+        if self.path and self._dirty and time.monotonic() - self._last_save >= self.save_interval:
+            self.save()
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Write the store, first merging in questions other processes (API, CLI) saved to the same file"""
+        path = path or self.path
+        if not path:
+            return
+        with _file_lock(path):
+            if os.path.exists(path):
+                self.load(path)
+            with self._lock:
+                # Reference answers and key points are excluded from model dumps, so add them back
+                data = {
+                    skill: [
+                        {
+                            **self._questions[question_id].model_dump(mode="json"),
+                            "reference_answers": self._questions[question_id].reference_answers,
+                            "key_points": self._questions[question_id].key_points,
+                        }
+                        for question_id in question_ids
+                    ]
+                    for skill, question_ids in self._by_skill.items()
+                }
+                self._dirty = False
+                self._last_save = time.monotonic()
+
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(temp_path, path)
+
+    def load(self, path: str) -> None:
+        with open(path) as f:
+            data = json.load(f)
+        with self._lock:
+            for skill, questions in data.items():
+                for fields in questions:
+                    question = Question.model_validate(fields)
+                    if question.id not in self._questions:
+                        self._index(skill, question, _words(question.text))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "questions": len(self._questions),
+                "skills": len(self._by_skill),
+                "attempted_skills": len(self._retry_at),
+                **self._stats
+            }
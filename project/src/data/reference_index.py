@@ -0,0 +1,169 @@
+import os
+import re
+import threading
+import zlib
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models.interview_models import Question
+
+# Hashed feature space shared by reference answers, key points and candidate answers
+FEATURES = 1 << 12
+# Share of a key point's (IDF-weighted) terms an answer must use to cover it
+KEY_POINT_MATCH = 0.5
+# Cosine similarity to a reference answer that counts as a full match
+FULL_SIMILARITY = 0.5
+# Feedback is left to local scoring at or above this confidence
+LOCAL_CONFIDENCE = float(os.getenv("LOCAL_FEEDBACK_CONFIDENCE", "0.6"))
+
+_WORD_PATTERN = re.compile(r"[a-z0-9+#=]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by can do for from has have how i if in into is it its of on or "
+    "so that the their then there these they this to was we what when which while will with you your".split()
+)
+
+
+def _stem(word: str) -> str:
+    """Crude suffix folding so inflections match, e.g. closures/closure and redeclared/redeclare"""
+    if len(word) <= 4 or word.endswith("ss"):
+        return word
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix):
+            word = word[:-len(suffix)]
+            break
+    return word[:-1] if word.endswith("e") else word
+
+
+def _terms(text: str) -> List[str]:
+    return [_stem(w) for w in _WORD_PATTERN.findall(text.lower()) if w not in _STOPWORDS]
+
+
+def _term_features(text: str) -> List[int]:
+    """Hashed unigrams only"""
+    return [zlib.crc32(term.encode("utf-8")) % FEATURES for term in _terms(text)]
+
+
+def _features(text: str) -> Counter:
+    """Hashed unigram and bigram counts"""
+    terms = _terms(text)
+    grams = terms + [f"{a} {b}" for a, b in zip(terms, terms[1:])]
+    return Counter(zlib.crc32(gram.encode("utf-8")) % FEATURES for gram in grams)
+
+
+def reference_confidence(similarity: Optional[float], coverage: Optional[float]) -> float:
+    """How well local scoring explains an answer; low values warrant an LLM review"""
+    if coverage is None:
+        return 0.0
+    return max(coverage, min(1.0, (similarity or 0.0) / FULL_SIMILARITY))
+
+
+class ReferenceScore(NamedTuple):
+    similarity: float  # best cosine similarity to a reference answer
+    coverage: float  # share of key points covered (the similarity when there are none)
+    covered: List[str]
+    missing: List[str]
+
+    @property
+    def confidence(self) -> float:
+        return reference_confidence(self.similarity, self.coverage)
+
+
+class _QuestionReferences:
+    __slots__ = ("reference_answers", "answers", "key_points", "key_point_features", "key_point_weights")
+
+    def __init__(self, reference_answers: List[str], answers: np.ndarray, key_points: List[str],
+                 key_point_features: List[np.ndarray], key_point_weights: List[np.ndarray]):
+        self.reference_answers = reference_answers
+        self.answers = answers  # (references, FEATURES), rows L2-normalized
+        self.key_points = key_points
+        self.key_point_features = key_point_features
+        self.key_point_weights = key_point_weights
+
+
+class ReferenceIndex:
+    """Precomputed TF-IDF vectors of reference answers and key points per question.
+
+    Vectors use hashed unigrams and bigrams, so no vocabulary has to be
+    stored and unseen words need no special handling. Scoring an answer
+    vectorizes it once and compares it with its question's references,
+    which takes well under a millisecond.
+    """
+
+    def __init__(self, questions: Sequence[Question]):
+        documents = [
+            _features(text)
+            for question in questions
+            for text in (*question.reference_answers, *question.key_points)
+        ]
+        # Smoothed inverse document frequency, as in scikit-learn
+        document_frequency = np.zeros(FEATURES)
+        for counts in documents:
+            document_frequency[list(counts)] += 1
+        self._idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+
+        self._references: Dict[str, _QuestionReferences] = {}
+        for question in questions:
+            if question.reference_answers or question.key_points:
+                self._references[question.id] = self._build(question)
+        self._lock = threading.Lock()
+        self._stats = {"scored": 0, "confident": 0}
+
+    def _vector(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Sparse (indices, weights) TF-IDF vector with unit length"""
+        counts = _features(text)
+        if not counts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        indices = np.fromiter(counts, dtype=np.int64, count=len(counts))
+        weights = (1 + np.log(np.fromiter(counts.values(), dtype=float, count=len(counts)))) * self._idf[indices]
+        return indices, weights / np.linalg.norm(weights)
+
+    def _build(self, question: Question) -> _QuestionReferences:
+        answers = np.zeros((len(question.reference_answers), FEATURES), dtype=np.float32)
+        for row, text in enumerate(question.reference_answers):
+            indices, weights = self._vector(text)
+            answers[row, indices] = weights
+
+        key_point_features, key_point_weights = [], []
+        for point in question.key_points:
+            # Coverage only looks at single terms; bigrams would penalize paraphrases
+            indices = np.unique(np.array(_term_features(point), dtype=np.int64))
+            key_point_features.append(indices)
+            key_point_weights.append(self._idf[indices])
+        return _QuestionReferences(list(question.reference_answers), answers, list(question.key_points),
+                                   key_point_features, key_point_weights)
+
+    def score(self, question: Question, text: str) -> Optional[ReferenceScore]:
+        """Similarity to the question's reference answers and key-point coverage; None without references"""
+        references = self._references.get(question.id)
+        if references is None or (references.reference_answers != question.reference_answers
+                                   or references.key_points != question.key_points):
+            if not (question.reference_answers or question.key_points):
+                return None
+            # e.g. generated questions, or a session still on a question from an older bank
+            references = self._build(question)
+
+        indices, weights = self._vector(text)
+        similarity = 0.0
+        if len(references.answers) and len(indices):
+            similarity = float((references.answers[:, indices] @ weights).max())
+
+        present = np.array(sorted(set(_term_features(text))), dtype=np.int64)
+        covered, missing = [], []
+        for point, features, idf in zip(references.key_points, references.key_point_features,
+                                        references.key_point_weights):
+            matched = float(idf[np.isin(features, present)].sum() / idf.sum()) if len(features) else 0.0
+            (covered if matched >= KEY_POINT_MATCH else missing).append(point)
+        coverage = len(covered) / len(references.key_points) if references.key_points else similarity
+
+        result = ReferenceScore(round(similarity, 3), round(coverage, 3), covered, missing)
+        with self._lock:
+            self._stats["scored"] += 1
+            self._stats["confident"] += result.confidence >= LOCAL_CONFIDENCE
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"questions": len(self._references), **self._stats}
+
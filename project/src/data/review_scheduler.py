@@ -0,0 +1,202 @@
+import heapq
+import json
+import os
+import random
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.models.interview_models import Question
+
+_DAY = 86400.0
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+
+
+class ReviewCard:
+    """SM-2 schedule of one question for one user"""
+
+    __slots__ = ("repetitions", "interval", "ease", "due")
+
+    def __init__(self, repetitions: int = 0, interval: float = 0.0,
+                 ease: float = DEFAULT_EASE, due: float = 0.0):
+        self.repetitions = repetitions
+        self.interval = interval  # days
+        self.ease = ease
+        self.due = due  # epoch seconds
+
+    def review(self, score: int, now: float) -> None:
+        """Apply an SM-2 review; the 0-100 feedback score maps to SM-2 quality 0-5"""
+        quality = min(max(score, 0), 100) / 20
+        if quality >= 3:
+            self.repetitions += 1
+            if self.repetitions == 1:
+                self.interval = 1.0
+            elif self.repetitions == 2:
+                self.interval = 6.0
+            else:
+                self.interval = round(self.interval * self.ease, 1)
+        else:
+            # Failed recall starts the question over
+            self.repetitions = 0
+            self.interval = 1.0
+        self.ease = max(MIN_EASE, self.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        self.due = now + self.interval * _DAY
+
+    def to_list(self) -> List[float]:
+        return [self.repetitions, self.interval, round(self.ease, 3), int(self.due)]
+
+
+class UserReviews:
+    """A user's cards plus a min-heap of (due, question_id).
+
+    Rescheduling pushes a new heap entry instead of updating in place; stale
+    entries are recognised by their due time no longer matching the card
+    and dropped when they surface.
+    """
+
+    __slots__ = ("cards", "heap")
+
+    def __init__(self):
+        self.cards: Dict[str, ReviewCard] = {}
+        self.heap: List[Tuple[float, str]] = []
+
+    def schedule(self, question_id: str, card: ReviewCard) -> None:
+        self.cards[question_id] = card
+        heapq.heappush(self.heap, (card.due, question_id))
+        # Rebuild once stale entries dominate so the heap stays O(cards)
+        if len(self.heap) > 2 * len(self.cards) + 16:
+            self.heap = [(c.due, qid) for qid, c in self.cards.items()]
+            heapq.heapify(self.heap)
+
+    def pop_due(self, now: float, allowed: Optional[set], limit: int) -> List[str]:
+        """Remove and return up to ``limit`` due question ids, earliest first"""
+        due, skipped = [], []
+        while self.heap and len(due) < limit and self.heap[0][0] <= now:
+            entry = heapq.heappop(self.heap)
+            card = self.cards.get(entry[1])
+            if card is None or card.due != entry[0]:
+                continue  # stale entry
+            if allowed is not None and entry[1] not in allowed:
+                skipped.append(entry)
+                continue
+            due.append(entry[1])
+        for entry in skipped:
+            heapq.heappush(self.heap, entry)
+        return due
+
+    def restore(self, question_ids: Iterable[str]) -> None:
+        for question_id in question_ids:
+            heapq.heappush(self.heap, (self.cards[question_id].due, question_id))
+
+
+class ReviewScheduler:
+    """Per-user spaced-repetition (SM-2) schedules over the question bank.
+
+    Answer scores reschedule questions: weak answers come back the next
+    day, strong ones at growing intervals. Sessions are drawn from due
+    questions first, then questions the user has not seen, and only then
+    from questions that are not due yet.
+    """
+
+    def __init__(self, path: Optional[str] = None, save_interval: float = 60.0):
+        self.path = path
+        self.save_interval = save_interval
+        self._users: Dict[str, UserReviews] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.monotonic()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def review(self, user_id: str, question_id: str, score: int, now: Optional[float] = None) -> None:
+        """Reschedule a question after the user answered it"""
+        now = time.time() if now is None else now
+        with self._lock:
+            reviews = self._users.setdefault(user_id, UserReviews())
+            card = reviews.cards.get(question_id) or ReviewCard()
+            card.review(score, now)
+            reviews.schedule(sys.intern(question_id), card)
+            self._dirty = True
+
+    def due_count(self, user_id: str, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        reviews = self._users.get(user_id)
+        if reviews is None:
+            return 0
+        return sum(card.due <= now for card in reviews.cards.values())
+
+    def select(self, user_id: str, candidates: Sequence[Question], count: int,
+               now: Optional[float] = None) -> List[Question]:
+        """Pick ``count`` questions from ``candidates``: due reviews, then unseen, then least recently due"""
+        now = time.time() if now is None else now
+        by_id = {question.id: question for question in candidates}
+
+        with self._lock:
+            reviews = self._users.get(user_id)
+            if reviews is None:
+                selected_ids: List[str] = []
+            else:
+                # O(k log n): pop the k earliest due cards, then put them back
+                selected_ids = reviews.pop_due(now, set(by_id), count)
+                reviews.restore(selected_ids)
+            seen = reviews.cards if reviews else {}
+
+        selected = [by_id[question_id] for question_id in selected_ids]
+        if len(selected) < count:
+            unseen = [question for question in candidates if question.id not in seen]
+            random.shuffle(unseen)
+            selected.extend(unseen[:count - len(selected)])
+        if len(selected) < count:
+            # Everything left is already scheduled for later; take the soonest due
+            chosen = {question.id for question in selected}
+            upcoming = sorted(
+                (question for question in candidates if question.id not in chosen),
+                key=lambda question: seen[question.id].due
+            )
+            selected.extend(upcoming[:count - len(selected)])
+        return selected
+
+    def maybe_save(self) -> None:
+        if self.path and self._dirty and time.monotonic() - self._last_save >= self.save_interval:
+            self.save()
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = path or self.path
+        if not path:
+            return
+        with self._lock:
+            # One [repetitions, interval, ease, due] row per card
+            data = {
+                user_id: {question_id: card.to_list() for question_id, card in reviews.cards.items()}
+                for user_id, reviews in self._users.items()
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    def load(self, path: str) -> None:
+        with open(path) as f:
+            data = json.load(f)
+        users = {}
+        for user_id, cards in data.items():
+            reviews = UserReviews()
+            for question_id, row in cards.items():
+                reviews.cards[sys.intern(question_id)] = ReviewCard(*row)
+            reviews.heap = [(card.due, question_id) for question_id, card in reviews.cards.items()]
+            heapq.heapify(reviews.heap)
+            users[user_id] = reviews
+        with self._lock:
+            self._users = users
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "users": len(self._users),
+                "cards": sum(len(reviews.cards) for reviews in self._users.values()),
+            }
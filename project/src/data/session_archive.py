@@ -0,0 +1,375 @@
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.models.compact_session import CompactAnswers, CompactSession
+from src.models.interview_models import EnrichmentStatus, InterviewSession, Question
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - falls back to msgpack
+    ormsgpack = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional when ormsgpack is installed
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - falls back to zlib
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no cross-process locking (e.g. Windows)
+    fcntl = None
+
+# File header: magic and format version. Blocks follow, each a header
+# (codec, payload length, session count) and a compressed msgpack payload.
+# A session's question refs index its block's question table; a bare id
+# string stands for a question that could not be resolved when archived.
+MAGIC = b"IPSA"
+FORMAT_VERSION = 1
+_FILE_HEADER = MAGIC + bytes([FORMAT_VERSION])
+_BLOCK_HEADER = struct.Struct("<BII")
+CODEC_ZSTD = 1
+CODEC_ZLIB = 2
+
+# Answer columns in the order they are archived; see CompactAnswers
+ANSWER_COLUMNS = (
+    "question_ids", "texts", "time_spent", "confidence", "timestamps",
+    "scores", "star", "strengths", "improvements", "suggestions",
+    "assessments", "enrichment", "duplicates", "reference_similarity", "key_point_coverage"
+)
+
+
+def _packb(obj: Any) -> bytes:
+    if ormsgpack is not None:
+        return ormsgpack.packb(obj)
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def _unpackb(data: bytes) -> Any:
+    if ormsgpack is not None:
+        return ormsgpack.unpackb(data)
+    return msgpack.unpackb(data, raw=False)
+
+
+def _require_msgpack() -> None:
+    if ormsgpack is None and msgpack is None:
+        raise RuntimeError("Session archives need ormsgpack or msgpack installed")
+
+
+def _compress(codec: int, data: bytes, level: int) -> bytes:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=level, write_checksum=True).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(codec: int, data: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("Archive block is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown archive block codec: {codec}")
+
+
+def _question_record(question: Question) -> List[Any]:
+    return [
+        question.id, question.text, question.type.value, question.difficulty.value, question.category,
+        list(question.follow_up_prompts or []), question.time_limit,
+        question.expected_answer_format.value if question.expected_answer_format else None,
+        list(question.reference_answers), list(question.key_points)
+    ]
+
+
+_QUESTION_FIELDS = (
+    "id", "text", "type", "difficulty", "category", "follow_up_prompts", "time_limit",
+    "expected_answer_format", "reference_answers", "key_points"
+)
+
+
+def _question_from_record(record: List[Any]) -> Question:
+    return Question(**dict(zip(_QUESTION_FIELDS, record)))
+
+
+def _answer_columns(answers: CompactAnswers) -> List[Any]:
+    columns = []
+    for name in ANSWER_COLUMNS:
+        values = getattr(answers, name)
+        if name in ("strengths", "improvements", "suggestions"):
+            values = [list(lines) for lines in values]
+        elif name == "enrichment":
+            values = [None if status is None else status.value for status in values]
+        elif name in ("duplicates", "reference_similarity", "key_point_coverage"):
+            values = [round(value, 4) for value in values]  # float32 storage; drop the noise
+        elif not isinstance(values, list):
+            values = values.tolist()
+        columns.append(values)
+    return columns
+
+
+class _Block:
+    """Sessions waiting to be written, with a table of the questions they reference"""
+
+    __slots__ = ("questions", "question_refs", "sessions")
+
+    def __init__(self):
+        self.questions: List[Question] = []
+        self.question_refs: Dict[int, int] = {}  # id(question) -> table position; questions are kept alive above
+        self.sessions: List[List[Any]] = []
+
+    def question_ref(self, question: Question) -> int:
+        ref = self.question_refs.get(id(question))
+        if ref is None:
+            ref = self.question_refs[id(question)] = len(self.questions)
+            self.questions.append(question)
+        return ref
+
+    def add(self, session: CompactSession) -> None:
+        self.sessions.append([
+            session.id, session.user_id, session.job_role, session.difficulty.value, session.type.value,
+            session.adaptive, session.max_questions, session.current_question_index,
+            session.start_time, session.end_time, session.score, session.assessment,
+            session.assessment_status.value if session.assessment_status else None,
+            [self._ref_or_id(session, question_id) for question_id in session.question_ids],
+            _answer_columns(session.answers)
+        ])
+
+    def _ref_or_id(self, session: CompactSession, question_id: str) -> Union[int, str]:
+        question = session.get_question(question_id)
+        return question_id if question is None else self.question_ref(question)
+
+    def encode(self) -> bytes:
+        return _packb([[_question_record(q) for q in self.questions], self.sessions])
+
+
+def _session_from_record(record: List[Any], questions: List[Question]) -> CompactSession:
+    (session_id, user_id, job_role, difficulty, interview_type, adaptive, max_questions, current_question_index,
+     start_time, end_time, score, assessment, assessment_status, question_refs, answer_columns) = record
+    # Unresolved questions (bare ids) stay unresolved, as they were in the live session
+    session_questions = [questions[ref] for ref in question_refs if not isinstance(ref, str)]
+    session = CompactSession(
+        id=session_id, job_role=job_role, difficulty=difficulty, type=interview_type,
+        question_ids=[ref if isinstance(ref, str) else questions[ref].id for ref in question_refs], questions={},
+        extra_questions={q.id: q for q in session_questions}, user_id=user_id
+    )
+    session.adaptive = adaptive
+    session.max_questions = max_questions
+    session.current_question_index = current_question_index
+    session.start_time = start_time
+    session.end_time = end_time
+    session.score = score
+    session.assessment = assessment
+    session.assessment_status = EnrichmentStatus(assessment_status) if assessment_status else None
+    session.answers = CompactAnswers.from_columns(*answer_columns)
+    # Aggregates are derived data, so they are rebuilt rather than archived
+    for position, question_id in enumerate(session.answers.question_ids):
+        feedback = session.answers.feedback_at(position)
+        if feedback is not None:
+            session.aggregates.add(session.get_question(question_id), feedback)
+    return session
+
+
+def _read_blocks(f: BinaryIO) -> Iterator[List[Any]]:
+    """Decoded [questions, sessions] payloads, one block in memory at a time"""
+    if f.read(len(_FILE_HEADER)) != _FILE_HEADER:
+        raise ValueError("Not a session archive (or an unsupported format version)")
+    while True:
+        header = f.read(_BLOCK_HEADER.size)
+        if len(header) < _BLOCK_HEADER.size:
+            return
+        codec, length, _ = _BLOCK_HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length:
+            return  # Block cut short by a crash mid-write; everything before it is intact
+        yield _unpackb(_decompress(codec, payload))
+
+
+def iter_sessions(path: str) -> Iterator[CompactSession]:
+    """Stream the sessions in an archive, in write order, with memory bounded by one block.
+
+    Sessions come back as CompactSession with their questions (including
+    reference answers and key points) exactly as they were when the session
+    ran; ``to_session`` gives the full pydantic model.
+    """
+    _require_msgpack()
+    with open(path, "rb") as f:
+        for question_records, session_records in _read_blocks(f):
+            questions = [_question_from_record(record) for record in question_records]
+            for record in session_records:
+                yield _session_from_record(record, questions)
+
+
+class SessionArchiveWriter:
+    """Append-only archive of completed sessions.
+
+    Sessions are encoded to column-form msgpack records as they are written
+    and buffered into blocks; each block carries one table of the questions
+    its sessions reference and is compressed as a whole with zstd (zlib when
+    zstandard is not installed), so repeated question text and templated
+    feedback cost almost nothing. A block is written once it holds
+    ``block_sessions`` sessions or, by a background timer, ``flush_interval``
+    seconds after its first session arrived. Blocks are appended under an
+    exclusive file lock where fcntl is available, so several processes can
+    share one archive. Reopening an archive drops a trailing block cut
+    short by a crash.
+
+    Writing is idempotent per session id: a session already archived (the
+    last ``max_recorded`` ids, seeded from the newest blocks on open) is
+    skipped, so re-running finalization after a restart adds no copy.
+    """
+
+    def __init__(self, path: str, block_sessions: int = 256, flush_interval: float = 60.0, level: int = 3,
+                 max_recorded: int = 100000):
+        _require_msgpack()
+        self.path = path
+        self.block_sessions = block_sessions
+        self.flush_interval = flush_interval
+        self.level = level
+        self.max_recorded = max_recorded
+        self.codec = CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+        self._lock = threading.Lock()
+        self._block = _Block()
+        self._last_flush = time.monotonic()
+        self._timer: Optional[threading.Timer] = None
+        self._stats = {"sessions": 0, "duplicates": 0, "blocks": 0, "raw_bytes": 0, "compressed_bytes": 0}
+        self._archived: "OrderedDict[str, None]" = OrderedDict()
+        self._file: Optional[BinaryIO] = open(path, "r+b" if os.path.exists(path) else "w+b")
+        with self._file_lock():
+            self._load_archived_ids(self._recover())
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the archive file against other processes"""
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+    def _recover(self) -> List[Tuple[int, int, int]]:
+        """Validate the header, then truncate after the last complete block.
+
+        Returns (codec, payload offset, payload length) of every complete block.
+        """
+        f = self._file
+        blocks = []
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            f.write(_FILE_HEADER)
+            return blocks
+        f.seek(0)
+        if f.read(len(_FILE_HEADER)) != _FILE_HEADER:
+            f.close()
+            raise ValueError(f"{self.path} is not a session archive (or an unsupported format version)")
+        end = f.tell()
+        while True:
+            header = f.read(_BLOCK_HEADER.size)
+            if len(header) < _BLOCK_HEADER.size:
+                break
+            codec, length, _ = _BLOCK_HEADER.unpack(header)
+            if end + _BLOCK_HEADER.size + length > size:
+                break
+            blocks.append((codec, end + _BLOCK_HEADER.size, length))
+            end = f.seek(length, os.SEEK_CUR)
+        if end < size:
+            f.truncate(end)
+        f.seek(end)
+        return blocks
+
+    def _load_archived_ids(self, blocks: List[Tuple[int, int, int]]) -> None:
+        """Remember the ids in the newest blocks, up to ``max_recorded``"""
+        ids: List[str] = []
+        end = self._file.tell()
+        for codec, offset, length in reversed(blocks):
+            if len(ids) >= self.max_recorded:
+                break
+            self._file.seek(offset)
+            try:
+                _, session_records = _unpackb(_decompress(codec, self._file.read(length)))
+            except RuntimeError:
+                break  # e.g. a zstd block without zstandard installed; older ids go unchecked
+            ids.extend(record[0] for record in reversed(session_records))
+        self._file.seek(end)
+        self._archived = OrderedDict.fromkeys(reversed(ids[:self.max_recorded]))
+
+    def write(self, session: Union[CompactSession, InterviewSession]) -> None:
+        if isinstance(session, InterviewSession):
+            session = CompactSession.from_session(session)
+        with self._lock:
+            if self._file is None:
+                raise ValueError("Session archive is closed")
+            if session.id in self._archived:
+                self._stats["duplicates"] += 1
+                return
+            self._block.add(session)
+            self._archived[session.id] = None
+            if len(self._archived) > self.max_recorded:
+                self._archived.popitem(last=False)
+            self._stats["sessions"] += 1
+            if (len(self._block.sessions) >= self.block_sessions
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush_block()
+            elif self._timer is None:
+                # Make sure a quiet period cannot leave sessions buffered indefinitely
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_block(self) -> None:
+        """Append the pending block (lock must be held)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._last_flush = time.monotonic()
+        if not self._block.sessions:
+            return
+        raw = self._block.encode()
+        payload = _compress(self.codec, raw, self.level)
+        with self._file_lock():
+            # Another process may have appended since our last write
+            self._file.seek(0, os.SEEK_END)
+            self._file.write(_BLOCK_HEADER.pack(self.codec, len(payload), len(self._block.sessions)) + payload)
+            self._file.flush()
+        self._block = _Block()
+        self._stats["blocks"] += 1
+        self._stats["raw_bytes"] += len(raw)
+        self._stats["compressed_bytes"] += len(payload)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._flush_block()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._flush_block()
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "SessionArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "pending": len(self._block.sessions),
+                "codec": "zstd" if self.codec == CODEC_ZSTD else "zlib"
+            }
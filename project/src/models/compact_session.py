@@ -0,0 +1,345 @@
+import sys
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.data.question_bank import current_snapshot
+from src.models.interview_models import (
+    Answer, DifficultyLevel, EnrichmentStatus, Feedback, InterviewSession,
+    InterviewType, Question, SessionAggregates
+)
+
+
+def _intern_all(values: Iterable[str]) -> Tuple[str, ...]:
+    """Intern templated strings so identical feedback lines share one object"""
+    return tuple(sys.intern(value) for value in values)
+
+
+def _optional_float(value: Optional[float]) -> float:
+    return -1 if value is None else value
+
+
+def _from_optional_float(value: float, digits: int) -> Optional[float]:
+    """Undo _optional_float, dropping float32 noise"""
+    return None if value < 0 else round(value, digits)
+
+
+def _restored(question: Question, *sources: Optional[Any]) -> Question:
+    """The full copy of ``question`` from the first source holding it unchanged, else ``question`` itself"""
+    for source in sources:
+        found = source.get(question.id) if source is not None else None
+        if found is question:
+            return found
+        if (found is not None and not (question.reference_answers or question.key_points)
+                and found.model_dump() == question.model_dump()):
+            return found
+    return question
+
+
+class CompactAnswers:
+    """Column-oriented storage for a session's answers and their feedback"""
+
+    __slots__ = (
+        "question_ids", "texts", "time_spent", "confidence", "timestamps",
+        "scores", "star", "strengths", "improvements", "suggestions",
+        "assessments", "enrichment", "duplicates",
+        "reference_similarity", "key_point_coverage", "_positions"
+    )
+
+    def __init__(self):
+        self.question_ids: List[str] = []
+        self.texts: List[str] = []
+        self.time_spent = array("l")
+        self.confidence = array("h")
+        self.timestamps = array("d")
+        self.scores = array("h")  # -1 when the answer has no feedback
+        self.star = array("b")  # -1 not evaluated, 0 non-compliant, 1 compliant
+        self.strengths: List[Tuple[str, ...]] = []
+        self.improvements: List[Tuple[str, ...]] = []
+        self.suggestions: List[Tuple[str, ...]] = []
+        self.assessments: List[Optional[str]] = []
+        self.enrichment: List[Optional[EnrichmentStatus]] = []
+        self.duplicates = array("f")  # -1 when no near-duplicate was found
+        self.reference_similarity = array("f")  # -1 when the question has no references
+        self.key_point_coverage = array("f")
+        self._positions: Dict[str, int] = {}
+
+    @classmethod
+    def from_columns(cls, question_ids: List[str], texts: List[str], time_spent: Iterable[int],
+                     confidence: Iterable[int], timestamps: Iterable[float], scores: Iterable[int],
+                     star: Iterable[int], strengths: Iterable[Iterable[str]], improvements: Iterable[Iterable[str]],
+                     suggestions: Iterable[Iterable[str]], assessments: List[Optional[str]],
+                     enrichment: Iterable[Optional[str]], duplicates: Iterable[float],
+                     reference_similarity: Iterable[float], key_point_coverage: Iterable[float]) -> "CompactAnswers":
+        """Rebuild from plain column values, using the same sentinels as the arrays"""
+        answers = cls()
+        answers.question_ids = list(_intern_all(question_ids))
+        answers.texts = list(texts)
+        answers.time_spent = array("l", time_spent)
+        answers.confidence = array("h", confidence)
+        answers.timestamps = array("d", timestamps)
+        answers.scores = array("h", scores)
+        answers.star = array("b", star)
+        answers.strengths = [_intern_all(values) for values in strengths]
+        answers.improvements = [_intern_all(values) for values in improvements]
+        answers.suggestions = [_intern_all(values) for values in suggestions]
+        answers.assessments = list(assessments)
+        answers.enrichment = [None if status is None else EnrichmentStatus(status) for status in enrichment]
+        answers.duplicates = array("f", duplicates)
+        answers.reference_similarity = array("f", reference_similarity)
+        answers.key_point_coverage = array("f", key_point_coverage)
+        answers._positions = {question_id: i for i, question_id in enumerate(answers.question_ids)}
+        return answers
+
+    def __len__(self) -> int:
+        return len(self.question_ids)
+
+    def append(self, answer: Answer) -> None:
+        feedback = answer.feedback
+        if feedback is None:
+            numbers = {"scores": -1, "star": -1, "duplicates": -1, "reference_similarity": -1, "key_point_coverage": -1}
+        else:
+            numbers = {
+                "scores": feedback.score,
+                "star": -1 if feedback.star_method_compliance is None else int(feedback.star_method_compliance),
+                "duplicates": _optional_float(feedback.duplicate_similarity),
+                "reference_similarity": _optional_float(feedback.reference_similarity),
+                "key_point_coverage": _optional_float(feedback.key_point_coverage),
+            }
+        numbers.update(time_spent=answer.time_spent, confidence=answer.confidence,
+                       timestamps=answer.timestamp.timestamp())
+        # Convert every typed value before touching a column, so an out-of-range one
+        # (OverflowError, TypeError) cannot leave the columns misaligned
+        typed = {name: array(getattr(self, name).typecode, [value]) for name, value in numbers.items()}
+
+        question_id = sys.intern(answer.question_id)
+        self._positions[question_id] = len(self.question_ids)
+        self.question_ids.append(question_id)
+        self.texts.append(answer.text)
+        for name, value in typed.items():
+            getattr(self, name).extend(value)
+        if feedback is None:
+            self.strengths.append(())
+            self.improvements.append(())
+            self.suggestions.append(())
+            self.assessments.append(None)
+            self.enrichment.append(None)
+            return
+
+        self.strengths.append(_intern_all(feedback.strengths))
+        self.improvements.append(_intern_all(feedback.improvements))
+        self.suggestions.append(_intern_all(feedback.suggestions))
+        self.assessments.append(feedback.overall_assessment)
+        self.enrichment.append(feedback.enrichment_status)
+
+    def position(self, question_id: str) -> Optional[int]:
+        return self._positions.get(question_id)
+
+    def set_enrichment(self, position: int, assessment: Optional[str],
+                       status: Optional[EnrichmentStatus]) -> None:
+        if assessment is not None:
+            self.assessments[position] = assessment
+        self.enrichment[position] = status
+
+    def feedback_at(self, position: int) -> Optional[Feedback]:
+        score = self.scores[position]
+        if score < 0:
+            return None
+
+        star = self.star[position]
+        return Feedback.model_construct(
+            score=score,
+            strengths=list(self.strengths[position]),
+            improvements=list(self.improvements[position]),
+            star_method_compliance=None if star < 0 else bool(star),
+            suggestions=list(self.suggestions[position]),
+            overall_assessment=self.assessments[position],
+            enrichment_status=self.enrichment[position],
+            duplicate_similarity=_from_optional_float(self.duplicates[position], 2),
+            reference_similarity=_from_optional_float(self.reference_similarity[position], 3),
+            key_point_coverage=_from_optional_float(self.key_point_coverage[position], 3)
+        )
+
+    def answer_at(self, position: int) -> Answer:
+        return Answer.model_construct(
+            question_id=self.question_ids[position],
+            text=self.texts[position],
+            time_spent=self.time_spent[position],
+            confidence=self.confidence[position],
+            timestamp=datetime.fromtimestamp(self.timestamps[position]),
+            feedback=self.feedback_at(position)
+        )
+
+
+class CompactSession:
+    """Memory-lean, internal form of an InterviewSession.
+
+    Questions are stored as ids resolved against the shared question bank,
+    answers live in a CompactAnswers column store, and repeated strings are
+    interned. Full pydantic models are only built by ``to_session`` and the
+    accessor methods used at the API boundary.
+    """
+
+    __slots__ = (
+        "id", "user_id", "job_role", "difficulty", "type", "question_ids", "adaptive", "max_questions",
+        "current_question_index", "answers", "start_time", "end_time",
+        "score", "assessment", "assessment_status", "aggregates",
+        "_questions", "_extra_questions", "_question_set"
+    )
+
+    def __init__(self, id: str, job_role: str, difficulty: DifficultyLevel,
+                 type: InterviewType, question_ids: Iterable[str],
+                 questions: Optional[Mapping[str, Question]] = None,
+                 extra_questions: Optional[Dict[str, Question]] = None,
+                 user_id: Optional[str] = None):
+        self.id = id
+        self.user_id = user_id
+        self.job_role = sys.intern(job_role)
+        self.difficulty = DifficultyLevel(difficulty)
+        self.type = InterviewType(type)
+        self.question_ids: Tuple[str, ...] = _intern_all(question_ids)
+        self._question_set = set(self.question_ids)
+        self.adaptive = False
+        self.max_questions: Optional[int] = None
+        self.current_question_index = 0
+        self.answers = CompactAnswers()
+        self.start_time = datetime.now().timestamp()
+        self.end_time: Optional[float] = None
+        self.score: Optional[float] = None
+        self.assessment: Optional[str] = None
+        self.assessment_status: Optional[EnrichmentStatus] = None
+        self.aggregates = SessionAggregates()
+        # Pinned to the bank snapshot the session started on, so reloads never change its questions
+        self._questions = questions if questions is not None else current_snapshot().by_id
+        # Questions that are not in the bank, e.g. generated for this session
+        self._extra_questions = extra_questions or None
+
+    @classmethod
+    def from_session(cls, session: InterviewSession,
+                     questions: Optional[Mapping[str, Question]] = None,
+                     restore_from: Optional[Any] = None) -> "CompactSession":
+        """Compact a session.
+
+        Questions restored from a checkpoint have lost their reference answers and
+        key points (they are excluded from serialization), so each one is swapped
+        back for the bank's copy, or ``restore_from``'s (anything with
+        ``get(question_id)``, e.g. the generated question store), when all of its
+        serialized fields match. Only questions found in neither are kept as extras.
+        """
+        lookup = questions if questions is not None else current_snapshot().by_id
+        session_questions = [_restored(q, lookup, restore_from) for q in session.questions]
+        extra = {q.id: q for q in session_questions if lookup.get(q.id) is not q}
+
+        compact = cls(
+            id=session.id,
+            job_role=session.job_role,
+            difficulty=session.difficulty,
+            type=session.type,
+            question_ids=[q.id for q in session_questions],
+            questions=lookup,
+            extra_questions=extra,
+            user_id=session.user_id
+        )
+        compact.adaptive = session.adaptive
+        compact.max_questions = session.max_questions
+        compact.start_time = session.start_time.timestamp()
+        compact.end_time = session.end_time.timestamp() if session.end_time else None
+        compact.score = session.score
+        compact.assessment = session.assessment
+        compact.assessment_status = session.assessment_status
+        compact.aggregates = session.aggregates.model_copy(deep=True)
+        for answer in session.answers:
+            compact.answers.append(answer)
+        compact.current_question_index = session.current_question_index
+        return compact
+
+    @property
+    def question_count(self) -> int:
+        return len(self.question_ids)
+
+    @property
+    def is_complete(self) -> bool:
+        return self.current_question_index >= len(self.question_ids)
+
+    def get_question(self, question_id: str) -> Optional[Question]:
+        if self._extra_questions and question_id in self._extra_questions:
+            return self._extra_questions[question_id]
+        if question_id not in self._question_set:
+            return None
+        return self._questions.get(question_id)
+
+    def current_question(self) -> Optional[Question]:
+        if self.is_complete:
+            return None
+        return self.get_question(self.question_ids[self.current_question_index])
+
+    def has_answer(self, question_id: str) -> bool:
+        return self.answers.position(question_id) is not None
+    
+    def add_question(self, question: Question) -> None:
+        """Queue another question (used by adaptive sessions)"""
+        if self._questions.get(question.id) is not question:
+            self._extra_questions = {**(self._extra_questions or {}), question.id: question}
+        self.question_ids += (sys.intern(question.id),)
+        self._question_set.add(self.question_ids[-1])
+    
+    def score_history(self) -> List[Tuple[DifficultyLevel, int]]:
+        """(question difficulty, score) of each scored answer, in order"""
+        history = []
+        for question_id, score in zip(self.answers.question_ids, self.answers.scores):
+            question = self.get_question(question_id)
+            if score >= 0 and question:
+                history.append((question.difficulty, score))
+        return history
+    
+    def get_answer(self, question_id: str) -> Optional[Answer]:
+        position = self.answers.position(question_id)
+        return None if position is None else self.answers.answer_at(position)
+
+    def record_answer(self, answer: Answer, question: Optional[Question] = None) -> None:
+        """Store a scored answer, advance to the next question and update aggregates"""
+        if question is None:
+            question = self.get_question(answer.question_id)
+        self.answers.append(answer)
+        self.current_question_index += 1
+        if answer.feedback:
+            self.aggregates.add(question, answer.feedback)
+
+    def set_enrichment(self, question_id: str, assessment: Optional[str],
+                       status: Optional[EnrichmentStatus]) -> None:
+        """Attach LLM enrichment to a stored answer's feedback"""
+        position = self.answers.position(question_id)
+        if position is not None:
+            self.answers.set_enrichment(position, assessment, status)
+
+    def mark_complete(self) -> None:
+        self.end_time = datetime.now().timestamp()
+        self.score = self.aggregates.average
+
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "current_index": self.current_question_index,
+            "total_questions": self.max_questions if self.adaptive and self.max_questions else len(self.question_ids),
+            "completed": len(self.answers)
+        }
+
+    def to_session(self) -> InterviewSession:
+        """Materialize the full pydantic session for API responses"""
+        return InterviewSession.model_construct(
+            id=self.id,
+            user_id=self.user_id,
+            job_role=self.job_role,
+            difficulty=self.difficulty,
+            type=self.type,
+            adaptive=self.adaptive,
+            max_questions=self.max_questions,
+            questions=[self.get_question(qid) for qid in self.question_ids],
+            current_question_index=self.current_question_index,
+            answers=[self.answers.answer_at(i) for i in range(len(self.answers))],
+            start_time=datetime.fromtimestamp(self.start_time),
+            end_time=datetime.fromtimestamp(self.end_time) if self.end_time else None,
+            score=self.score,
+            assessment=self.assessment,
+            assessment_status=self.assessment_status,
+            aggregates=self.aggregates
+        )
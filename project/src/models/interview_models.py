@@ -1,5 +1,6 @@
-from typing import List, Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Literal, Tuple
+from typing_extensions import Annotated, TypedDict
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 from enum import Enum
 
@@ -20,6 +21,11 @@ class AnswerFormat(str, Enum):
     TECHNICAL = "technical"
     GENERAL = "general"
 
+class EnrichmentStatus(str, Enum):
+    PENDING = "pending"
+    COMPLETE = "complete"
+    FAILED = "failed"
+
 class Question(BaseModel):
     id: str
     text: str
@@ -29,6 +35,9 @@ class Question(BaseModel):
     follow_up_prompts: Optional[List[str]] = []
     time_limit: int = 300  # seconds
     expected_answer_format: Optional[AnswerFormat] = None
+    # Used for local scoring only; excluded from serialization so candidates never see them
+    reference_answers: List[str] = Field(default_factory=list, exclude=True)
+    key_points: List[str] = Field(default_factory=list, exclude=True)
 
 class JobDescription(BaseModel):
     title: str
@@ -38,13 +47,6 @@ class JobDescription(BaseModel):
     description: str
     industry: str
 
-class Answer(BaseModel):
-    question_id: str
-    text: str
-    time_spent: int
-    confidence: int
-    timestamp: datetime = Field(default_factory=datetime.now)
-
 class Feedback(BaseModel):
     score: int = Field(ge=0, le=100)
     strengths: List[str]
@@ -52,6 +54,66 @@ class Feedback(BaseModel):
     star_method_compliance: Optional[bool] = None
     suggestions: List[str]
     overall_assessment: str
+    enrichment_status: Optional[EnrichmentStatus] = None  # None when no LLM enrichment was requested
+    duplicate_similarity: Optional[float] = None  # Set when the answer nearly repeats an earlier one
+    reference_similarity: Optional[float] = None  # Best match against the question's reference answers
+    key_point_coverage: Optional[float] = None  # Share of the question's key points the answer covers
+
+class Answer(BaseModel):
+    question_id: str
+    text: str
+    time_spent: int = Field(ge=0)
+    confidence: int = Field(ge=0, le=100)
+    timestamp: datetime = Field(default_factory=datetime.now)
+    feedback: Optional[Feedback] = None
+
+class SessionAggregates(BaseModel):
+    """Running score statistics, updated as each answer is recorded"""
+    count: int = 0
+    total: int = 0
+    min_score: Optional[int] = None
+    max_score: Optional[int] = None
+    by_category: Dict[str, List[int]] = Field(default_factory=dict)  # category -> [count, total]
+    by_difficulty: Dict[str, List[int]] = Field(default_factory=dict)  # difficulty -> [count, total]
+    star_evaluated: int = 0
+    star_compliant: int = 0
+    
+    def add(self, question: Optional[Question], feedback: Feedback) -> None:
+        score = feedback.score
+        self.count += 1
+        self.total += score
+        self.min_score = score if self.min_score is None else min(self.min_score, score)
+        self.max_score = score if self.max_score is None else max(self.max_score, score)
+        
+        if question:
+            for key, buckets in ((question.category, self.by_category),
+                                 (question.difficulty.value, self.by_difficulty)):
+                bucket = buckets.setdefault(key, [0, 0])
+                bucket[0] += 1
+                bucket[1] += score
+        
+        if feedback.star_method_compliance is not None:
+            self.star_evaluated += 1
+            self.star_compliant += int(feedback.star_method_compliance)
+    
+    @property
+    def average(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+    
+    @property
+    def star_compliance_rate(self) -> Optional[float]:
+        return self.star_compliant / self.star_evaluated if self.star_evaluated else None
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "answered": self.count,
+            "average_score": self.average,
+            "min_score": self.min_score,
+            "max_score": self.max_score,
+            "category_averages": {k: total / count for k, (count, total) in self.by_category.items()},
+            "difficulty_averages": {k: total / count for k, (count, total) in self.by_difficulty.items()},
+            "star_compliance_rate": self.star_compliance_rate
+        }
 
 class InterviewSession(BaseModel):
     id: str
@@ -59,11 +121,69 @@ class InterviewSession(BaseModel):
     difficulty: DifficultyLevel
     type: InterviewType
     questions: List[Question]
+    user_id: Optional[str] = None
+    # Adaptive sessions add one question at a time, up to max_questions
+    adaptive: bool = False
+    max_questions: Optional[int] = None
     current_question_index: int = 0
     answers: List[Answer] = []
     start_time: datetime = Field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
     score: Optional[float] = None
+    assessment: Optional[str] = None
+    assessment_status: Optional[EnrichmentStatus] = None
+    aggregates: SessionAggregates = Field(default_factory=SessionAggregates)
+    
+    _question_index: Dict[str, Question] = PrivateAttr(default_factory=dict)
+    _indexed_questions: Optional[List[Question]] = PrivateAttr(default=None)
+    _indexed_count: int = PrivateAttr(default=-1)
+    _answer_index: Dict[str, Answer] = PrivateAttr(default_factory=dict)
+    
+    def get_question(self, question_id: str) -> Optional[Question]:
+        """Look up one of this session's questions by id"""
+        # Rebuild only when the question list is replaced or grows
+        if self._indexed_questions is not self.questions or self._indexed_count != len(self.questions):
+            self._question_index = {q.id: q for q in self.questions}
+            self._indexed_questions = self.questions
+            self._indexed_count = len(self.questions)
+        return self._question_index.get(question_id)
+    
+    @property
+    def question_ids(self) -> List[str]:
+        return [q.id for q in self.questions]
+    
+    def add_question(self, question: Question) -> None:
+        self.questions.append(question)
+    
+    def score_history(self) -> List[Tuple[DifficultyLevel, int]]:
+        """(question difficulty, score) of each scored answer, in order"""
+        return [
+            (self.get_question(a.question_id).difficulty, a.feedback.score)
+            for a in self.answers if a.feedback and self.get_question(a.question_id)
+        ]
+    
+    def get_answer(self, question_id: str) -> Optional[Answer]:
+        """Look up the answer given to a question, if any"""
+        if len(self._answer_index) != len(self.answers):
+            self._answer_index = {a.question_id: a for a in self.answers}
+        return self._answer_index.get(question_id)
+    
+    def record_answer(self, answer: Answer, question: Optional[Question] = None) -> None:
+        """Append a scored answer, advance to the next question and update aggregates"""
+        if question is None:
+            question = self.get_question(answer.question_id)
+        self.answers.append(answer)
+        self._answer_index[answer.question_id] = answer
+        self.current_question_index += 1
+        if answer.feedback:
+            self.aggregates.add(question, answer.feedback)
+    
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "current_index": self.current_question_index,
+            "total_questions": self.max_questions if self.adaptive and self.max_questions else len(self.questions),
+            "completed": len(self.answers)
+        }
 
 class InterviewState(BaseModel):
     """State object for LangGraph workflow"""
@@ -74,4 +194,27 @@ class InterviewState(BaseModel):
     job_description: Optional[JobDescription] = None
     user_input: str = ""
     workflow_step: str = "start"
-    context: Dict[str, Any] = Field(default_factory=dict)
\ No newline at end of file
+    context: Dict[str, Any] = Field(default_factory=dict)
+
+def merge_context(current: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """LangGraph reducer: nodes return only the context keys they add or change"""
+    if not current:
+        return update
+    if not update:
+        return current
+    return {**current, **update}
+
+class InterviewGraphState(TypedDict, total=False):
+    """Lightweight LangGraph state; nodes return partial updates.
+    
+    Unlike InterviewState this is not validated or copied between steps, so
+    heavy objects such as the session are passed by reference.
+    """
+    session: Optional[InterviewSession]
+    current_question: Optional[Question]
+    current_answer: Optional[Answer]
+    feedback: Optional[Feedback]
+    job_description: Optional[JobDescription]
+    user_input: str
+    workflow_step: str
+    context: Annotated[Dict[str, Any], merge_context]
@@ -0,0 +1,168 @@
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+_WORD_PATTERN = re.compile(r"[a-z0-9']+")
+# Mersenne prime modulus for the universal hash family
+_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingles(text: str, size: int = 3) -> List[str]:
+    """Overlapping word n-grams of the normalized text"""
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) < size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+class AnswerMatch(NamedTuple):
+    key: str
+    similarity: float
+
+
+class _Entry:
+    __slots__ = ("question_id", "signature", "enhancement")
+
+    def __init__(self, question_id: str, signature: np.ndarray):
+        self.question_id = question_id
+        self.signature = signature
+        self.enhancement: Optional[str] = None
+
+
+class AnswerIndex:
+    """MinHash/LSH index of submitted answers for near-duplicate lookup.
+
+    Each answer is reduced to a MinHash signature over its word 3-grams;
+    the signature is split into bands, and answers to the same question
+    that share any band bucket become candidates. Only candidates are
+    compared, so lookups stay sublinear in the number of stored answers.
+    Matching signature positions estimate the Jaccard similarity.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, max_entries: int = 100000,
+                 max_bucket_size: int = 32, seed: int = 7):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max_entries
+        self.max_bucket_size = max_bucket_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._buckets: Dict[Tuple[str, int, bytes], List[str]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"added": 0, "queries": 0, "candidates": 0, "matches": 0, "reused": 0}
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        grams = shingles(text)
+        if not grams:
+            return None
+        hashes = np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+        # (a * h + b) mod p for every permutation and shingle; the product wraps at 2^64,
+        # which keeps the permutations independent enough for similarity estimates
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _PRIME
+        return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, question_id: str, signature: np.ndarray):
+        for band in range(self.bands):
+            yield question_id, band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def _candidates(self, question_id: str, signature: np.ndarray) -> List[AnswerMatch]:
+        keys = set()
+        for band_key in self._band_keys(question_id, signature):
+            keys.update(self._buckets.get(band_key, ()))
+        self._stats["candidates"] += len(keys)
+
+        matches = []
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None:
+                similarity = float(np.count_nonzero(entry.signature == signature)) / self.num_perm
+                matches.append(AnswerMatch(key, similarity))
+        matches.sort(key=lambda match: match.similarity, reverse=True)
+        return matches
+
+    def query(self, question_id: str, text: str, min_similarity: float = 0.8) -> List[AnswerMatch]:
+        """Stored answers to the same question whose estimated similarity is at least ``min_similarity``"""
+        signature = self.signature(text)
+        if signature is None:
+            return []
+        with self._lock:
+            self._stats["queries"] += 1
+            return [m for m in self._candidates(question_id, signature) if m.similarity >= min_similarity]
+
+    def add(self, key: str, question_id: str, text: str, min_similarity: float = 0.8) -> Optional[AnswerMatch]:
+        """Index an answer and return its closest earlier near-duplicate, if any"""
+        signature = self.signature(text)
+        if signature is None:
+            return None
+
+        with self._lock:
+            self._stats["queries"] += 1
+            matches = [m for m in self._candidates(question_id, signature)
+                       if m.key != key and m.similarity >= min_similarity]
+            if matches:
+                self._stats["matches"] += 1
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._unlink(key, previous)
+            self._entries[key] = _Entry(question_id, signature)
+            self._stats["added"] += 1
+            for band_key in self._band_keys(question_id, signature):
+                bucket = self._buckets.setdefault(band_key, [])
+                bucket.append(key)
+                # Very common buckets (templated answers) keep only recent members
+                if len(bucket) > self.max_bucket_size:
+                    del bucket[0]
+            if len(self._entries) > self.max_entries:
+                self._unlink(*self._entries.popitem(last=False))
+        return matches[0] if matches else None
+
+    def _unlink(self, key: str, entry: _Entry) -> None:
+        """Remove an entry's key from its band buckets, dropping buckets left empty (lock must be held)"""
+        for band_key in self._band_keys(entry.question_id, entry.signature):
+            bucket = self._buckets.get(band_key)
+            if bucket is None:
+                continue
+            try:
+                bucket.remove(key)
+            except ValueError:
+                pass  # Already trimmed from a full bucket
+            if not bucket:
+                del self._buckets[band_key]
+
+    def set_enhancement(self, key: str, enhancement: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.enhancement = enhancement
+
+    def enhancement_for(self, question_id: str, text: str, min_similarity: float = 0.95) -> Optional[str]:
+        """LLM enhancement generated for a near-identical earlier answer to the same question"""
+        signature = self.signature(text)
+        if signature is None:
+            return None
+        with self._lock:
+            for match in self._candidates(question_id, signature):
+                if match.similarity < min_similarity:
+                    break
+                enhancement = self._entries[match.key].enhancement
+                if enhancement:
+                    self._stats["reused"] += 1
+                    return enhancement
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "buckets": len(self._buckets)}
@@ -1,104 +1,93 @@
 import { Answer, Feedback } from '../types';
+import bundledRules from '../data/feedback_rules.json';
 
-export const generateFeedback = (answer: Answer, questionText: string, expectedFormat?: string): Feedback => {
+// Scoring rules shared with the Python FeedbackGenerator; edit the JSON, not this file.
+// The server stays authoritative: this gives an instant, offline preview of its heuristic score.
+export type FeedbackRules = typeof bundledRules;
+
+interface RuleOutcome {
+  delta?: number;
+  strength?: string;
+  improvement?: string;
+}
+
+const applyOutcome = (outcome: RuleOutcome, score: number, strengths: string[], improvements: string[]): number => {
+  if (outcome.strength) strengths.push(outcome.strength);
+  if (outcome.improvement) improvements.push(outcome.improvement);
+  return score + (outcome.delta ?? 0);
+};
+
+export const generateFeedback = (
+  answer: Answer,
+  _questionText: string,
+  expectedFormat?: string,
+  timeLimit?: number,
+  rules: FeedbackRules = bundledRules
+): Feedback => {
   const text = answer.text.toLowerCase();
-  const wordCount = answer.text.split(' ').length;
-  
-  let score = 50; // Base score
+  const wordCount = answer.text.split(/\s+/).filter(Boolean).length;
+
+  let score = rules.base_score;
   const strengths: string[] = [];
   const improvements: string[] = [];
-  const suggestions: string[] = [];
-  
+
   // Check length appropriateness
-  if (wordCount < 20) {
-    improvements.push('Answer is too brief - provide more detail and examples');
-    score -= 15;
-  } else if (wordCount > 300) {
-    improvements.push('Answer is too lengthy - focus on key points and be more concise');
-    score -= 10;
+  const length = rules.length;
+  if (wordCount < length.min_words) {
+    score = applyOutcome(length.too_short, score, strengths, improvements);
+  } else if (wordCount > length.max_words) {
+    score = applyOutcome(length.too_long, score, strengths, improvements);
   } else {
-    strengths.push('Good answer length and detail level');
-    score += 10;
+    score = applyOutcome(length.ok, score, strengths, improvements);
   }
 
-  // Check for specific keywords that indicate good answers
-  const positiveKeywords = ['experience', 'example', 'result', 'learned', 'improved', 'achieved', 'implemented', 'developed'];
-  const keywordCount = positiveKeywords.filter(keyword => text.includes(keyword)).length;
-  
-  if (keywordCount >= 3) {
-    strengths.push('Rich in relevant examples and specific outcomes');
-    score += 15;
-  } else if (keywordCount >= 1) {
-    strengths.push('Includes some relevant examples');
-    score += 5;
-  } else {
-    improvements.push('Add more specific examples and concrete outcomes');
-    score -= 10;
+  // Check for specific keywords that indicate good answers (tiers go from the highest threshold down)
+  const keywordCount = rules.keywords.terms.filter(keyword => text.includes(keyword)).length;
+  const tier = rules.keywords.tiers.find(candidate => keywordCount >= candidate.min_count);
+  if (tier) {
+    score = applyOutcome(tier, score, strengths, improvements);
   }
 
   // STAR method compliance for behavioral questions
-  let starMethodCompliance = false;
+  let starMethodCompliance: boolean | undefined;
   if (expectedFormat === 'star') {
-    const starElements = {
-      situation: ['situation', 'context', 'background', 'project', 'challenge'],
-      task: ['task', 'responsibility', 'goal', 'objective', 'assigned'],
-      action: ['action', 'did', 'implemented', 'decided', 'approached', 'used'],
-      result: ['result', 'outcome', 'achieved', 'improved', 'increased', 'decreased', 'learned']
-    };
-
-    const starScore = Object.values(starElements).reduce((acc, keywords) => {
+    const starScore = Object.values(rules.star.components).reduce((acc, keywords) => {
       return acc + (keywords.some(keyword => text.includes(keyword)) ? 1 : 0);
     }, 0);
 
-    starMethodCompliance = starScore >= 3;
-    
-    if (starMethodCompliance) {
-      strengths.push('Follows STAR method structure effectively');
-      score += 20;
-    } else {
-      improvements.push('Structure your answer using the STAR method (Situation, Task, Action, Result)');
-      suggestions.push('Learn more about the STAR method: https://www.thebalancemoney.com/what-is-the-star-interview-response-technique-2061629');
-      score -= 15;
-    }
+    starMethodCompliance = starScore >= rules.star.min_components;
+    score = applyOutcome(starMethodCompliance ? rules.star.pass : rules.star.fail, score, strengths, improvements);
   }
 
   // Check confidence level alignment
-  if (answer.confidence > 80 && score < 60) {
-    improvements.push('Your confidence level seems higher than your answer quality - practice more or be more realistic about your confidence');
-  } else if (answer.confidence < 50 && score > 70) {
-    strengths.push('Your answer quality is good - you can be more confident in your responses');
+  const { overconfident, underconfident } = rules.confidence;
+  if (answer.confidence > overconfident.confidence_above && score < overconfident.score_below) {
+    score = applyOutcome(overconfident, score, strengths, improvements);
+  } else if (answer.confidence < underconfident.confidence_below && score > underconfident.score_above) {
+    score = applyOutcome(underconfident, score, strengths, improvements);
   }
 
   // Time management feedback
-  if (answer.timeSpent > 300) {
-    improvements.push('Work on being more concise - practice timing your responses');
-  } else if (answer.timeSpent < 30) {
-    improvements.push('Take more time to think through your answer before responding');
+  const time = rules.time;
+  if (answer.timeSpent > (timeLimit ?? time.default_limit)) {
+    score = applyOutcome(time.over_limit, score, strengths, improvements);
+  } else if (answer.timeSpent < time.min_seconds) {
+    score = applyOutcome(time.too_fast, score, strengths, improvements);
   } else {
-    strengths.push('Good time management for your response');
+    score = applyOutcome(time.ok, score, strengths, improvements);
+  }
+
+  // Suggestions, with the STAR guide first for behavioral questions
+  const suggestions = [...rules.suggestions.general];
+  if (expectedFormat === 'star') {
+    suggestions.unshift(rules.suggestions.star);
   }
 
   // Ensure score is within bounds
   score = Math.max(0, Math.min(100, score));
 
-  // Generate overall assessment
-  let overallAssessment = '';
-  if (score >= 80) {
-    overallAssessment = 'Excellent response! You demonstrate strong communication skills and relevant experience.';
-  } else if (score >= 60) {
-    overallAssessment = 'Good response with room for improvement. Focus on the suggested areas to strengthen your answer.';
-  } else if (score >= 40) {
-    overallAssessment = 'Adequate response but needs significant improvement. Practice with the suggested resources.';
-  } else {
-    overallAssessment = 'Response needs substantial work. Consider practicing more and reviewing interview best practices.';
-  }
-
-  // Add general suggestions
-  suggestions.push(
-    'Review common interview questions: https://www.thebalancemoney.com/top-job-interview-questions-2061228',
-    'Practice your responses out loud to improve fluency',
-    'Research the company and role thoroughly before the interview'
-  );
+  // Generate overall assessment (ordered from the highest score down)
+  const overallAssessment = rules.assessments.find(rule => score >= rule.min_score)?.text ?? '';
 
   return {
     score,
@@ -114,4 +103,4 @@ export const calculateOverallScore = (answers: Answer[]): number => {
   if (answers.length === 0) return 0;
   const totalScore = answers.reduce((sum, answer) => sum + answer.feedback.score, 0);
   return Math.round(totalScore / answers.length);
-};
\ No newline at end of file
+};
@@ -1,20 +1,20 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from src.models.interview_models import Answer, Feedback, Question, AnswerFormat
+from src.data.question_bank import current_snapshot
+from src.data.reference_index import ReferenceScore
+from src.utils.feedback_rules import FEEDBACK_RULES
 
 class FeedbackGenerator:
-    """Generate detailed feedback for interview answers using AI-powered analysis"""
+    """Generate detailed feedback for interview answers using AI-powered analysis.
     
-    POSITIVE_KEYWORDS = [
-        'experience', 'example', 'result', 'learned', 'improved', 'achieved',
-        'implemented', 'developed', 'created', 'solved', 'optimized', 'delivered'
-    ]
+    The heuristic rules (keywords, thresholds, weights and messages) come from
+    the shared feedback rules file, so the frontend scores answers the same way.
+    Reference-answer scoring is server-only and added on top.
+    """
     
-    STAR_KEYWORDS = {
-        'situation': ['situation', 'context', 'background', 'project', 'challenge', 'problem'],
-        'task': ['task', 'responsibility', 'goal', 'objective', 'assigned', 'needed'],
-        'action': ['action', 'did', 'implemented', 'decided', 'approached', 'used', 'created'],
-        'result': ['result', 'outcome', 'achieved', 'improved', 'increased', 'decreased', 'learned']
-    }
+    RULES = FEEDBACK_RULES
+    POSITIVE_KEYWORDS = RULES.keywords.terms
+    STAR_KEYWORDS = RULES.star.components
     
     @classmethod
     def generate_feedback(cls, answer: Answer, question: Question) -> Feedback:
@@ -22,7 +22,7 @@ class FeedbackGenerator:
         text = answer.text.lower()
         word_count = len(answer.text.split())
         
-        score = 50  # Base score
+        score = cls.RULES.base_score
         strengths = []
         improvements = []
         suggestions = []
@@ -37,6 +37,13 @@ class FeedbackGenerator:
             text, score, strengths, improvements
         )
         
+        # Compare with the question's reference answers and key points
+        reference = current_snapshot().references.score(question, answer.text)
+        if reference is not None:
+            score, strengths, improvements = cls._analyze_reference_coverage(
+                reference, score, strengths, improvements
+            )
+        
         # STAR method analysis for behavioral questions
         star_compliance = None
         if question.expected_answer_format == AnswerFormat.STAR:
@@ -61,7 +68,7 @@ class FeedbackGenerator:
         score = max(0, min(100, score))
         
         # Generate overall assessment
-        overall_assessment = cls._generate_overall_assessment(score)
+        overall_assessment = cls._generate_overall_assessment(score, reference)
         
         return Feedback(
             score=score,
@@ -69,21 +76,22 @@ class FeedbackGenerator:
             improvements=improvements,
             star_method_compliance=star_compliance,
             suggestions=suggestions,
-            overall_assessment=overall_assessment
+            overall_assessment=overall_assessment,
+            reference_similarity=reference.similarity if reference else None,
+            key_point_coverage=reference.coverage if reference else None
         )
     
     @classmethod
     def _analyze_length(cls, word_count: int, score: int, strengths: List[str], improvements: List[str]) -> tuple:
         """Analyze answer length appropriateness"""
-        if word_count < 20:
-            improvements.append('Answer is too brief - provide more detail and examples')
-            score -= 15
-        elif word_count > 300:
-            improvements.append('Answer is too lengthy - focus on key points and be more concise')
-            score -= 10
+        rules = cls.RULES.length
+        if word_count < rules.min_words:
+            outcome = rules.too_short
+        elif word_count > rules.max_words:
+            outcome = rules.too_long
         else:
-            strengths.append('Good answer length and detail level')
-            score += 10
+            outcome = rules.ok
+        score = outcome.apply(score, strengths, improvements)
         
         return score, strengths, improvements
     
@@ -92,15 +100,28 @@ class FeedbackGenerator:
         """Analyze the quality of content using keyword analysis"""
         keyword_count = sum(1 for keyword in cls.POSITIVE_KEYWORDS if keyword in text)
         
-        if keyword_count >= 3:
-            strengths.append('Rich in relevant examples and specific outcomes')
-            score += 15
-        elif keyword_count >= 1:
-            strengths.append('Includes some relevant examples')
-            score += 5
-        else:
-            improvements.append('Add more specific examples and concrete outcomes')
-            score -= 10
+        # Tiers are ordered from the highest threshold down
+        for tier in cls.RULES.keywords.tiers:
+            if keyword_count >= tier.min_count:
+                score = tier.apply(score, strengths, improvements)
+                break
+        
+        return score, strengths, improvements
+    
+    @classmethod
+    def _analyze_reference_coverage(cls, reference: ReferenceScore, score: int, strengths: List[str], improvements: List[str]) -> tuple:
+        """Analyze coverage of the question's key points and similarity to reference answers"""
+        rules = cls.RULES.references
+        # Tiers are ordered from the highest threshold down
+        for tier in rules.coverage_tiers:
+            if reference.coverage >= tier.min_coverage:
+                score = tier.apply(score, strengths, improvements)
+                break
+        
+        if reference.missing:
+            improvements.append(rules.missing_prefix + '; '.join(reference.missing[:rules.max_missing_listed]))
+        if reference.similarity >= rules.similar.min_similarity:
+            score = rules.similar.apply(score, strengths, improvements)
         
         return score, strengths, improvements
     
@@ -112,61 +133,55 @@ class FeedbackGenerator:
             if any(keyword in text for keyword in keywords):
                 star_score += 1
         
-        star_compliance = star_score >= 3
-        
-        if star_compliance:
-            strengths.append('Follows STAR method structure effectively')
-            score += 20
-        else:
-            improvements.append('Structure your answer using the STAR method (Situation, Task, Action, Result)')
-            score -= 15
+        star_compliance = star_score >= cls.RULES.star.min_components
+        outcome = cls.RULES.star.pass_ if star_compliance else cls.RULES.star.fail
+        score = outcome.apply(score, strengths, improvements)
         
         return star_compliance, score, strengths, improvements
     
     @classmethod
     def _analyze_confidence(cls, confidence: int, score: int, strengths: List[str], improvements: List[str]) -> tuple:
         """Analyze confidence level alignment with answer quality"""
-        if confidence > 80 and score < 60:
-            improvements.append('Your confidence level seems higher than your answer quality - practice more or be more realistic')
-        elif confidence < 50 and score > 70:
-            strengths.append('Your answer quality is good - you can be more confident in your responses')
+        over, under = cls.RULES.confidence.overconfident, cls.RULES.confidence.underconfident
+        if confidence > over.confidence_above and score < over.score_below:
+            score = over.apply(score, strengths, improvements)
+        elif confidence < under.confidence_below and score > under.score_above:
+            score = under.apply(score, strengths, improvements)
         
         return score, strengths, improvements
     
     @classmethod
     def _analyze_time_management(cls, time_spent: int, time_limit: int, score: int, strengths: List[str], improvements: List[str]) -> tuple:
         """Analyze time management"""
+        rules = cls.RULES.time
         if time_spent > time_limit:
-            improvements.append('Work on being more concise - practice timing your responses')
-        elif time_spent < 30:
-            improvements.append('Take more time to think through your answer before responding')
+            outcome = rules.over_limit
+        elif time_spent < rules.min_seconds:
+            outcome = rules.too_fast
         else:
-            strengths.append('Good time management for your response')
+            outcome = rules.ok
+        score = outcome.apply(score, strengths, improvements)
         
         return score, strengths, improvements
     
     @classmethod
     def _generate_suggestions(cls, answer_format: AnswerFormat = None) -> List[str]:
         """Generate helpful suggestions"""
-        suggestions = [
-            'Review common interview questions: https://www.thebalancemoney.com/top-job-interview-questions-2061228',
-            'Practice your responses out loud to improve fluency',
-            'Research the company and role thoroughly before the interview'
-        ]
+        suggestions = list(cls.RULES.suggestions.general)
         
         if answer_format == AnswerFormat.STAR:
-            suggestions.insert(0, 'Learn more about the STAR method: https://www.thebalancemoney.com/what-is-the-star-interview-response-technique-2061629')
+            suggestions.insert(0, cls.RULES.suggestions.star)
         
         return suggestions
     
     @classmethod
-    def _generate_overall_assessment(cls, score: int) -> str:
+    def _generate_overall_assessment(cls, score: int, reference: Optional[ReferenceScore] = None) -> str:
         """Generate overall assessment based on score"""
-        if score >= 80:
-            return 'Excellent response! You demonstrate strong communication skills and relevant experience.'
-        elif score >= 60:
-            return 'Good response with room for improvement. Focus on the suggested areas to strengthen your answer.'
-        elif score >= 40:
-            return 'Adequate response but needs significant improvement. Practice with the suggested resources.'
-        else:
-            return 'Response needs substantial work. Consider practicing more and reviewing interview best practices.'
\ No newline at end of file
+        assessment = next(
+            rule.text for rule in cls.RULES.assessments if score >= rule.min_score
+        )
+        
+        if reference is not None and (reference.covered or reference.missing):
+            total = len(reference.covered) + len(reference.missing)
+            assessment += f' You covered {len(reference.covered)} of {total} key points.'
+        return assessment
\ No newline at end of file
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared with the frontend (src/utils/feedbackGenerator.ts); edit the JSON, not the generators
+RULES_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "feedback_rules.json")
+
+
+class RuleOutcome(BaseModel):
+    """Score change and message applied when a rule matches"""
+    delta: int = 0
+    strength: Optional[str] = None
+    improvement: Optional[str] = None
+
+    def apply(self, score: int, strengths: List[str], improvements: List[str]) -> int:
+        if self.strength:
+            strengths.append(self.strength)
+        if self.improvement:
+            improvements.append(self.improvement)
+        return score + self.delta
+
+
+class LengthRules(BaseModel):
+    min_words: int
+    max_words: int
+    too_short: RuleOutcome
+    too_long: RuleOutcome
+    ok: RuleOutcome
+
+
+class KeywordTier(RuleOutcome):
+    min_count: int
+
+
+class KeywordRules(BaseModel):
+    terms: List[str]
+    tiers: List[KeywordTier]  # highest min_count first
+
+
+class StarRules(BaseModel):
+    components: Dict[str, List[str]]
+    min_components: int
+    pass_: RuleOutcome = Field(alias="pass")
+    fail: RuleOutcome
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class OverconfidenceRule(RuleOutcome):
+    confidence_above: int
+    score_below: int
+
+
+class UnderconfidenceRule(RuleOutcome):
+    confidence_below: int
+    score_above: int
+
+
+class ConfidenceRules(BaseModel):
+    overconfident: OverconfidenceRule
+    underconfident: UnderconfidenceRule
+
+
+class TimeRules(BaseModel):
+    default_limit: int
+    min_seconds: int
+    over_limit: RuleOutcome
+    too_fast: RuleOutcome
+    ok: RuleOutcome
+
+
+class CoverageTier(RuleOutcome):
+    min_coverage: float
+
+
+class SimilarityRule(RuleOutcome):
+    min_similarity: float
+
+
+class ReferenceRules(BaseModel):
+    """Applied by the server only; reference answers and key points never reach clients"""
+    coverage_tiers: List[CoverageTier]  # highest min_coverage first
+    similar: SimilarityRule
+    missing_prefix: str
+    max_missing_listed: int
+
+
+class SuggestionRules(BaseModel):
+    star: str
+    general: List[str]
+
+
+class AssessmentRule(BaseModel):
+    min_score: int
+    text: str
+
+
+class FeedbackRules(BaseModel):
+    """Heuristic scoring rules shared by the Python and TypeScript feedback generators"""
+    version: int
+    base_score: int
+    length: LengthRules
+    keywords: KeywordRules
+    star: StarRules
+    confidence: ConfidenceRules
+    time: TimeRules
+    references: ReferenceRules
+    suggestions: SuggestionRules
+    assessments: List[AssessmentRule]  # highest min_score first
+
+
+def load_feedback_rules(path: str = RULES_PATH) -> FeedbackRules:
+    with open(path) as f:
+        return FeedbackRules.model_validate(json.load(f))
+
+
+FEEDBACK_RULES = load_feedback_rules()
+
+# Compact form served to the frontend, and its content hash
+FEEDBACK_RULES_DATA = FEEDBACK_RULES.model_dump(by_alias=True, exclude_none=True)
+FEEDBACK_RULES_VERSION: str = hashlib.sha256(
+    json.dumps(FEEDBACK_RULES_DATA, sort_keys=True, separators=(",", ":")).encode()
+).hexdigest()[:16]
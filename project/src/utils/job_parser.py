@@ -1,7 +1,53 @@
+import hashlib
+import os
 import re
-from typing import List, Dict
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List
 from src.models.interview_models import JobDescription
 
+class ParseCache:
+    """Thread-safe bounded LRU with hit-rate stats"""
+    
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._misses += 1
+        
+        # Computed outside the lock; a concurrent miss on the same key just recomputes
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries
+            }
+
 class JobDescriptionParser:
     """Parse job descriptions and extract relevant information"""
     
@@ -26,8 +72,24 @@ class JobDescriptionParser:
         'Marketing': ['marketing', 'advertising', 'digital marketing', 'seo', 'sem']
     }
     
+    # Shared by the API and the workflow, so each unique posting is parsed once
+    _parse_cache = ParseCache(int(os.getenv("JOB_PARSE_CACHE_SIZE", "512")))
+    _tips_cache = ParseCache(int(os.getenv("JOB_PARSE_CACHE_SIZE", "512")))
+    
     @classmethod
     def parse(cls, description: str) -> JobDescription:
+        """Parse a job description, reusing the result for identical content"""
+        key = hashlib.sha256(description.encode("utf-8")).digest()
+        job = cls._parse_cache.get_or_compute(key, lambda: cls._parse(description))
+        # Callers get their own copy so the cached result cannot be mutated
+        return job.model_copy(deep=True)
+    
+    @classmethod
+    def cache_stats(cls) -> Dict[str, Any]:
+        return {"parse": cls._parse_cache.stats(), "research_tips": cls._tips_cache.stats()}
+    
+    @classmethod
+    def _parse(cls, description: str) -> JobDescription:
         """Parse a job description and extract structured information"""
         text_lower = description.lower()
         
@@ -103,6 +165,12 @@ class JobDescriptionParser:
     
     @classmethod
     def generate_research_tips(cls, job: JobDescription) -> List[str]:
+        """Generate research tips, reusing the result for jobs with the same inputs"""
+        key = (job.company, job.industry, tuple(job.skills[:5]))
+        return list(cls._tips_cache.get_or_compute(key, lambda: tuple(cls._generate_research_tips(job))))
+    
+    @classmethod
+    def _generate_research_tips(cls, job: JobDescription) -> List[str]:
         """Generate research tips based on job description"""
         tips = [
             f"Research {job.company}'s recent news, product launches, and company culture",
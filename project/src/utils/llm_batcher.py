@@ -0,0 +1,149 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import HumanMessage
+
+from src.utils.llm_scheduler import LLMPriority, LLMScheduler, llm_scheduler
+
+_PRIORITY_RANK = {priority: rank for rank, priority in enumerate(LLMPriority)}
+
+
+class _PendingPrompt:
+    """A prompt waiting for the next batch flush"""
+    __slots__ = ("future", "priority", "session_id")
+
+    def __init__(self, future: Future, priority: LLMPriority, session_id: Optional[str]):
+        self.future = future
+        self.priority = priority
+        # Fairness is charged to the session that asked first
+        self.session_id = session_id
+
+
+class LLMBatcher:
+    """Coalesce prompts that arrive close together into chat model batch calls.
+
+    Prompts submitted within ``window`` seconds of the first one are flushed
+    together. Identical prompts, whether still waiting or already in flight,
+    share one call and one result. A flush is sent from one sender thread
+    through ``llm.batch``, holding one scheduler slot per prompt (each with
+    its own priority and session), so the scheduler's in-flight cap counts
+    real requests; when fewer slots are free than prompts, the most urgent
+    prompts go first and the rest follow in further batch calls.
+    """
+
+    def __init__(self, llm: Any, window: float = 0.02, max_batch_size: int = 16,
+                 scheduler: LLMScheduler = llm_scheduler):
+        self.llm = llm
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.scheduler = scheduler
+        self._lock = threading.Lock()
+        self._pending: Dict[str, _PendingPrompt] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._stats = {"submitted": 0, "deduplicated": 0, "batches": 0, "batched_prompts": 0}
+
+    def invoke(self, prompt: str, priority: LLMPriority = LLMPriority.INTERACTIVE,
+               session_id: Optional[str] = None) -> str:
+        """Submit a prompt and block until its response is available"""
+        return self.submit(prompt, priority, session_id).result()
+
+    def submit(self, prompt: str, priority: LLMPriority = LLMPriority.INTERACTIVE,
+               session_id: Optional[str] = None) -> Future:
+        """Queue a prompt for the next batch and return a future for its response"""
+        priority = LLMPriority(priority)
+        batch = None
+
+        with self._lock:
+            self._stats["submitted"] += 1
+
+            if prompt in self._in_flight:
+                self._stats["deduplicated"] += 1
+                return self._in_flight[prompt]
+
+            pending = self._pending.get(prompt)
+            if pending:
+                self._stats["deduplicated"] += 1
+                if _PRIORITY_RANK[priority] < _PRIORITY_RANK[pending.priority]:
+                    pending.priority = priority  # A more urgent caller is now waiting on it
+                if pending.session_id is None:
+                    pending.session_id = session_id
+                return pending.future
+
+            future: Future = Future()
+            self._pending[prompt] = _PendingPrompt(future, priority, session_id)
+
+            if len(self._pending) >= self.max_batch_size:
+                batch = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self._flush_pending)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if batch:
+            self._send_batch(batch)  # Only starts the sender thread; the caller does not wait here
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters describing how much work batching and deduplication saved"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+            stats["in_flight"] = len(self._in_flight)
+        stats["avg_batch_size"] = (
+            stats["batched_prompts"] / stats["batches"] if stats["batches"] else 0.0
+        )
+        return stats
+
+    def _take_pending(self) -> Dict[str, _PendingPrompt]:
+        """Move pending prompts to in-flight (lock must be held)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = self._pending
+        self._pending = {}
+        for prompt, pending in batch.items():
+            self._in_flight[prompt] = pending.future
+        return batch
+
+    def _flush_pending(self) -> None:
+        with self._lock:
+            self._timer = None
+            batch = self._take_pending()
+        if batch:
+            self._send_batch(batch)
+
+    def _send_batch(self, batch: Dict[str, _PendingPrompt]) -> None:
+        # One sender per flush; the submitting caller does not wait on the round trip
+        threading.Thread(target=self._send, args=(list(batch.items()),), daemon=True).start()
+
+    def _send(self, entries: List[Tuple[str, _PendingPrompt]]) -> None:
+        # Most urgent first, so they are the ones sent when only some slots are free
+        entries.sort(key=lambda item: _PRIORITY_RANK[item[1].priority])
+        while entries:
+            with self.scheduler.slots([(entry.priority, entry.session_id) for _, entry in entries]) as granted:
+                chunk, entries = entries[:granted], entries[granted:]
+                try:
+                    responses = self.llm.batch(
+                        [[HumanMessage(content=prompt)] for prompt, _ in chunk],
+                        config={"max_concurrency": len(chunk)}, return_exceptions=True
+                    )
+                except Exception as e:
+                    responses = [e] * len(chunk)
+            self._resolve(chunk, responses)
+
+    def _resolve(self, chunk: List[Tuple[str, _PendingPrompt]], responses: List[Any]) -> None:
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["batched_prompts"] += len(chunk)
+            for prompt, _ in chunk:
+                self._in_flight.pop(prompt, None)
+
+        # Every caller waiting on a prompt shares its future
+        for (_, entry), response in zip(chunk, responses):
+            if isinstance(response, Exception):
+                entry.future.set_exception(response)
+            else:
+                entry.future.set_result(response.content)
@@ -0,0 +1,185 @@
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Sequence, Tuple
+
+
+class LLMPriority(str, Enum):
+    """Priority classes for LLM calls, highest first"""
+    INTERACTIVE = "interactive"
+    FEEDBACK = "feedback"
+    BACKGROUND = "background"
+
+
+class _Ticket:
+    """A single queued LLM call waiting for a slot"""
+    __slots__ = ("priority", "session_id", "enqueued_at", "granted")
+
+    def __init__(self, priority: LLMPriority, session_id: str):
+        self.priority = priority
+        self.session_id = session_id
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+
+
+class LLMScheduler:
+    """Process-wide gate that every LLM call passes through.
+
+    Calls are admitted strictly by priority class. Within a class, sessions
+    are served round-robin so one session with many queued calls cannot
+    starve the others. At most ``max_in_flight`` calls run at once.
+    """
+
+    def __init__(self, max_in_flight: int = 8):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self._max_in_flight = max_in_flight
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        # priority -> session_id -> queued tickets, in round-robin order
+        self._queues: Dict[LLMPriority, "OrderedDict[str, Deque[_Ticket]]"] = {
+            priority: OrderedDict() for priority in LLMPriority
+        }
+        self._queue_depth = {priority: 0 for priority in LLMPriority}
+        self._completed = {priority: 0 for priority in LLMPriority}
+        self._total_wait = {priority: 0.0 for priority in LLMPriority}
+        self._max_wait = {priority: 0.0 for priority in LLMPriority}
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    def set_max_in_flight(self, max_in_flight: int) -> None:
+        """Change the concurrency cap; waiting calls are admitted immediately if it grows"""
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        with self._cond:
+            self._max_in_flight = max_in_flight
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, priority: LLMPriority = LLMPriority.FEEDBACK,
+             session_id: Optional[str] = None) -> Iterator[None]:
+        """Block until a slot is granted, hold it for the duration of the block"""
+        self._acquire(LLMPriority(priority), session_id or "_anonymous")
+        try:
+            yield
+        finally:
+            self._release()
+
+    @contextmanager
+    def slots(self, requests: Sequence[Tuple[LLMPriority, Optional[str]]]) -> Iterator[int]:
+        """Hold slots for a run of calls sent together, most urgent first.
+
+        Blocks until the first request is granted, then takes slots for as many
+        of the following requests as are free right away and not wanted by a
+        queued call of the same or higher priority. Yields the number granted
+        (at least one); the caller sends that many and asks again for the rest.
+        """
+        priority, session_id = requests[0]
+        self._acquire(LLMPriority(priority), session_id or "_anonymous")
+        granted = 1
+        try:
+            with self._cond:
+                for priority, _ in requests[1:]:
+                    priority = LLMPriority(priority)
+                    if self._in_flight >= self._max_in_flight or self._waiting_at_or_above(priority):
+                        break
+                    self._in_flight += 1
+                    self._completed[priority] += 1
+                    granted += 1
+            yield granted
+        finally:
+            self._release(granted)
+
+    def run(self, fn: Callable[[], Any], priority: LLMPriority = LLMPriority.FEEDBACK,
+            session_id: Optional[str] = None) -> Any:
+        """Run ``fn`` once a slot is available"""
+        with self.slot(priority, session_id):
+            return fn()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue depths, concurrency and wait times"""
+        with self._cond:
+            return {
+                "in_flight": self._in_flight,
+                "max_in_flight": self._max_in_flight,
+                "queue_depth": {p.value: self._queue_depth[p] for p in LLMPriority},
+                "waiting_sessions": {p.value: len(self._queues[p]) for p in LLMPriority},
+                "completed": {p.value: self._completed[p] for p in LLMPriority},
+                "avg_wait_ms": {
+                    p.value: (self._total_wait[p] / self._completed[p] * 1000) if self._completed[p] else 0.0
+                    for p in LLMPriority
+                },
+                "max_wait_ms": {p.value: self._max_wait[p] * 1000 for p in LLMPriority},
+            }
+
+    def _acquire(self, priority: LLMPriority, session_id: str) -> None:
+        ticket = _Ticket(priority, session_id)
+        with self._cond:
+            sessions = self._queues[priority]
+            if session_id not in sessions:
+                sessions[session_id] = deque()
+            sessions[session_id].append(ticket)
+            self._queue_depth[priority] += 1
+            self._dispatch()
+            while not ticket.granted:
+                self._cond.wait()
+
+            waited = time.monotonic() - ticket.enqueued_at
+            self._completed[priority] += 1
+            self._total_wait[priority] += waited
+            self._max_wait[priority] = max(self._max_wait[priority], waited)
+
+    def _release(self, count: int = 1) -> None:
+        with self._cond:
+            self._in_flight -= count
+            self._dispatch()
+
+    def _waiting_at_or_above(self, priority: LLMPriority) -> bool:
+        """Whether a queued call outranks or ties ``priority`` (lock must be held)"""
+        for queued in LLMPriority:
+            if self._queue_depth[queued]:
+                return True
+            if queued == priority:
+                return False
+        return False
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the next tickets in line (lock must be held)"""
+        granted = False
+        while self._in_flight < self._max_in_flight:
+            ticket = self._next_ticket()
+            if ticket is None:
+                break
+            ticket.granted = True
+            self._in_flight += 1
+            granted = True
+
+        if granted:
+            self._cond.notify_all()
+
+    def _next_ticket(self) -> Optional[_Ticket]:
+        for priority in LLMPriority:
+            sessions = self._queues[priority]
+            if not sessions:
+                continue
+
+            session_id, tickets = next(iter(sessions.items()))
+            ticket = tickets.popleft()
+            if tickets:
+                # Rotate the session to the back so other sessions get a turn
+                sessions.move_to_end(session_id)
+            else:
+                del sessions[session_id]
+            self._queue_depth[priority] -= 1
+            return ticket
+
+        return None
+
+
+# Shared by every workflow instance in this process
+llm_scheduler = LLMScheduler(int(os.getenv("LLM_MAX_IN_FLIGHT", "8")))
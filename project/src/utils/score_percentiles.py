@@ -0,0 +1,164 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Scores are bounded (0-100), so a fixed-bin histogram is an exact, mergeable
+# sketch. Session scores are averages, hence the 0.1 resolution.
+SCORE_RESOLUTION = 10
+MAX_SCORE = 100
+
+
+class ScoreDistribution:
+    """Streaming distribution of 0-100 scores with O(log n) updates and percentile ranks.
+
+    Counts live in a Fenwick tree over fixed bins, so both recording a
+    score and ranking one touch O(log bins) cells, however many scores
+    have been seen. Distributions merge by adding their bin counts.
+    """
+
+    __slots__ = ("_tree", "count")
+
+    BINS = MAX_SCORE * SCORE_RESOLUTION + 1
+
+    def __init__(self):
+        self._tree = [0] * (self.BINS + 1)
+        self.count = 0
+
+    @classmethod
+    def _bin(cls, score: float) -> int:
+        return min(max(int(round(score * SCORE_RESOLUTION)), 0), cls.BINS - 1)
+
+    def add(self, score: float, weight: int = 1) -> None:
+        index = self._bin(score) + 1
+        while index <= self.BINS:
+            self._tree[index] += weight
+            index += index & -index
+        self.count += weight
+
+    def _count_through(self, bin_index: int) -> int:
+        """Number of scores in bins [0, bin_index]"""
+        total = 0
+        index = bin_index + 1
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    def percentile(self, score: float) -> Optional[float]:
+        """Share of scores below ``score`` (ties count half), as 0-100"""
+        if not self.count:
+            return None
+        bin_index = self._bin(score)
+        below = self._count_through(bin_index - 1) if bin_index else 0
+        equal = self._count_through(bin_index) - below
+        return round((below + equal / 2) / self.count * 100, 1)
+
+    def counts(self) -> List[int]:
+        """Per-bin counts (inverse of the Fenwick prefix sums)"""
+        prefix = [self._count_through(i) for i in range(self.BINS)]
+        return [prefix[0]] + [prefix[i] - prefix[i - 1] for i in range(1, self.BINS)]
+
+    def merge(self, other: "ScoreDistribution") -> None:
+        for bin_index, count in enumerate(other.counts()):
+            if count:
+                self.add(bin_index / SCORE_RESOLUTION, count)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Sparse bin -> count mapping for persistence"""
+        return {str(i): count for i, count in enumerate(self.counts()) if count}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, int]) -> "ScoreDistribution":
+        distribution = cls()
+        for bin_index, count in data.items():
+            distribution.add(int(bin_index) / SCORE_RESOLUTION, count)
+        return distribution
+
+
+def cohort_key(job_role: str, type: Any, difficulty: Any) -> str:
+    """Cohort of candidates compared with each other: same role, interview type and difficulty"""
+    return "|".join((
+        " ".join(job_role.lower().split()),
+        getattr(type, "value", type),
+        getattr(difficulty, "value", difficulty),
+    ))
+
+
+class PercentileIndex:
+    """Score distributions per cohort, for both session scores and single answers"""
+
+    SCOPES = ("session", "answer")
+
+    def __init__(self, path: Optional[str] = None, save_interval: float = 60.0):
+        self.path = path
+        self.save_interval = save_interval
+        self._distributions: Dict[Tuple[str, str], ScoreDistribution] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.monotonic()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def record(self, scope: str, cohort: str, score: float) -> None:
+        with self._lock:
+            distribution = self._distributions.get((scope, cohort))
+            if distribution is None:
+                distribution = self._distributions[(scope, cohort)] = ScoreDistribution()
+            distribution.add(score)
+            self._dirty = True
+
+    def percentile(self, scope: str, cohort: str, score: Optional[float]) -> Optional[float]:
+        if score is None:
+            return None
+        with self._lock:
+            distribution = self._distributions.get((scope, cohort))
+            return distribution.percentile(score) if distribution else None
+
+    def merge(self, other: "PercentileIndex") -> None:
+        """Fold in distributions from another process or shard"""
+        with self._lock:
+            for key, distribution in other._distributions.items():
+                self._distributions.setdefault(key, ScoreDistribution()).merge(distribution)
+            self._dirty = True
+
+    def maybe_save(self) -> None:
+        if self.path and self._dirty and time.monotonic() - self._last_save >= self.save_interval:
+            self.save()
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = path or self.path
+        if not path:
+            return
+        with self._lock:
+            data = {
+                scope: {cohort: d.to_dict() for (s, cohort), d in self._distributions.items() if s == scope}
+                for scope in self.SCOPES
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        # Write then rename so a crash never leaves a truncated file
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+
+    def load(self, path: str) -> None:
+        with open(path) as f:
+            data = json.load(f)
+        with self._lock:
+            self._distributions = {
+                (scope, cohort): ScoreDistribution.from_dict(bins)
+                for scope, cohorts in data.items()
+                for cohort, bins in cohorts.items()
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "cohorts": len({cohort for _, cohort in self._distributions}),
+                **{f"{scope}_scores": sum(d.count for (s, _), d in self._distributions.items() if s == scope)
+                   for scope in self.SCOPES}
+            }
@@ -0,0 +1,39 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Hashable, List
+
+
+class StripedLock:
+    """Fixed pool of asyncio locks selected by key hash.
+
+    Work on the same key is serialized, while keys on different stripes
+    never contend. There is no global lock and no per-key lock objects to
+    create or clean up; unrelated keys only wait on each other when they
+    happen to share a stripe.
+    """
+
+    def __init__(self, stripes: int = 256):
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self._locks: List[asyncio.Lock] = [asyncio.Lock() for _ in range(stripes)]
+        self._stats = {"acquired": 0, "contended": 0}
+
+    def lock_for(self, key: Hashable) -> asyncio.Lock:
+        return self._locks[hash(key) % len(self._locks)]
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable) -> AsyncIterator[None]:
+        """Hold the lock for ``key`` for the duration of the block"""
+        lock = self.lock_for(key)
+        if lock.locked():
+            self._stats["contended"] += 1
+        async with lock:
+            self._stats["acquired"] += 1
+            yield
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "stripes": len(self._locks),
+            "held": sum(lock.locked() for lock in self._locks)
+        }
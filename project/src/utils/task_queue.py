@@ -0,0 +1,80 @@
+import asyncio
+from typing import Any, Callable, Dict, Optional
+
+
+class TaskQueue:
+    """Local in-process job queue served by a fixed pool of asyncio workers.
+
+    Jobs are keyed so a second submission for the same key while the first
+    is still queued or running returns the existing job. Job functions are
+    blocking and run in worker threads.
+    """
+
+    def __init__(self, workers: int = 2):
+        self.workers = workers
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks = []
+        self._jobs: Dict[str, asyncio.Future] = {}
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "running": 0}
+
+    def submit(self, key: str, fn: Callable[..., Any], *args: Any) -> asyncio.Future:
+        """Queue ``fn(*args)``; must be called from the event loop"""
+        existing = self._jobs.get(key)
+        if existing and not existing.done():
+            return existing
+
+        self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        self._jobs[key] = future
+        self._stats["submitted"] += 1
+        self._queue.put_nowait((key, fn, args, future))
+        return future
+
+    def is_pending(self, key: str) -> bool:
+        job = self._jobs.get(key)
+        return job is not None and not job.done()
+
+    async def wait(self, key: str, timeout: Optional[float] = None) -> bool:
+        """Wait for a job to finish; returns False if it is still running after ``timeout``"""
+        job = self._jobs.get(key)
+        if job is None or job.done():
+            return True
+
+        try:
+            await asyncio.wait_for(asyncio.shield(job), timeout)
+        except asyncio.TimeoutError:
+            return False
+        except Exception:
+            pass  # Failures are recorded by the job itself
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize() if self._queue else 0
+        return stats
+
+    def _ensure_workers(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if not self._worker_tasks:
+            self._worker_tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+
+    async def _worker(self) -> None:
+        while True:
+            key, fn, args, future = await self._queue.get()
+            self._stats["running"] += 1
+            try:
+                result = await asyncio.to_thread(fn, *args)
+                self._stats["completed"] += 1
+                future.set_result(result)
+            except Exception as e:
+                self._stats["failed"] += 1
+                future.set_exception(e)
+                future.exception()  # Mark as retrieved; callers check job state instead
+            finally:
+                self._stats["running"] -= 1
+                if self._jobs.get(key) is future:
+                    del self._jobs[key]
+                self._queue.task_done()
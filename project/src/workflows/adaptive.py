@@ -0,0 +1,126 @@
+import math
+import random
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.data.question_bank import current_snapshot
+from src.models.interview_models import DifficultyLevel, InterviewType, Question
+
+# Item difficulty of each level on the skill (logit) scale
+LEVEL_DIFFICULTY: Dict[DifficultyLevel, float] = {
+    DifficultyLevel.BEGINNER: -1.0,
+    DifficultyLevel.INTERMEDIATE: 0.0,
+    DifficultyLevel.ADVANCED: 1.0,
+}
+# Logistic scaling so the model roughly matches a normal ogive
+DISCRIMINATION = 1.7
+PRIOR_SD = 1.0
+# Stop once the skill estimate's standard deviation is below this (logits)
+TARGET_SD = 0.6
+MIN_QUESTIONS = 3
+
+_GRID = [x / 10 for x in range(-40, 41)]
+
+
+def _p_correct(theta: float, difficulty: float) -> float:
+    return 1.0 / (1.0 + math.exp(-DISCRIMINATION * (theta - difficulty)))
+
+
+class SkillEstimate:
+    """Posterior over a candidate's skill from their answer scores so far.
+
+    Each answer is treated as partial credit (score / 100) on a one
+    parameter logistic item whose difficulty is its question's level.
+    The posterior is evaluated on a fixed grid, which is exact enough
+    for a handful of answers and cheap to recompute after each one.
+    """
+
+    __slots__ = ("mean", "sd", "answered", "_weights")
+
+    def __init__(self, history: Iterable[Tuple[DifficultyLevel, int]], prior: DifficultyLevel):
+        prior_mean = LEVEL_DIFFICULTY[DifficultyLevel(prior)]
+        log_post = [-((theta - prior_mean) ** 2) / (2 * PRIOR_SD ** 2) for theta in _GRID]
+
+        self.answered = 0
+        for difficulty, score in history:
+            credit = min(max(score / 100, 0.001), 0.999)
+            b = LEVEL_DIFFICULTY[DifficultyLevel(difficulty)]
+            for i, theta in enumerate(_GRID):
+                p = _p_correct(theta, b)
+                log_post[i] += credit * math.log(p) + (1 - credit) * math.log(1 - p)
+            self.answered += 1
+
+        peak = max(log_post)
+        weights = [math.exp(value - peak) for value in log_post]
+        total = sum(weights)
+        self._weights = [w / total for w in weights]
+        self.mean = sum(w * theta for w, theta in zip(self._weights, _GRID))
+        self.sd = math.sqrt(sum(w * (theta - self.mean) ** 2 for w, theta in zip(self._weights, _GRID)))
+
+    def information(self, level: DifficultyLevel) -> float:
+        """Expected Fisher information of a question at ``level`` under the posterior"""
+        b = LEVEL_DIFFICULTY[level]
+        return sum(
+            w * DISCRIMINATION ** 2 * _p_correct(theta, b) * (1 - _p_correct(theta, b))
+            for w, theta in zip(self._weights, _GRID)
+        )
+
+    def is_confident(self, min_questions: int = MIN_QUESTIONS, target_sd: float = TARGET_SD) -> bool:
+        return self.answered >= min_questions and self.sd <= target_sd
+
+    def level(self) -> DifficultyLevel:
+        """Difficulty level closest to the estimated skill"""
+        return min(LEVEL_DIFFICULTY, key=lambda level: abs(LEVEL_DIFFICULTY[level] - self.mean))
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "skill": round(self.mean, 2),
+            "sd": round(self.sd, 2),
+            "interval": [round(self.mean - 1.96 * self.sd, 2), round(self.mean + 1.96 * self.sd, 2)],
+            "level": self.level(),
+            # Expected score on an intermediate question at this skill
+            "expected_score": round(100 * _p_correct(self.mean, 0.0), 1),
+            "answered": self.answered,
+        }
+
+
+def difficulty_buckets(interview_type: InterviewType) -> Dict[DifficultyLevel, Tuple[Question, ...]]:
+    """Questions of a type grouped by difficulty, precomputed by the current bank snapshot"""
+    return current_snapshot().difficulty_buckets(interview_type)
+
+
+def next_question(estimate: SkillEstimate, interview_type: InterviewType,
+                  asked: Sequence[str]) -> Optional[Question]:
+    """Pick an unasked question from the difficulty bucket with the highest expected information"""
+    asked_ids = set(asked)
+    best_level, best_remaining, best_information = None, None, -1.0
+    for level, questions in difficulty_buckets(InterviewType(interview_type)).items():
+        remaining = [q for q in questions if q.id not in asked_ids]
+        if not remaining:
+            continue
+        information = estimate.information(level)
+        if information > best_information:
+            best_level, best_remaining, best_information = level, remaining, information
+    return random.choice(best_remaining) if best_remaining else None
+
+
+def first_question(session) -> Optional[Question]:
+    """Opening question of an adaptive session, at the most informative level for the prior"""
+    return next_question(SkillEstimate([], session.difficulty), session.type, [])
+
+
+def advance(session) -> Optional[Question]:
+    """After an answer, queue the next adaptive question unless the estimate is confident.
+
+    Works with both InterviewSession and CompactSession. Returns the added
+    question, or None when the session should end.
+    """
+    estimate = SkillEstimate(session.score_history(), session.difficulty)
+    if estimate.is_confident() or len(session.answers) >= (session.max_questions or MIN_QUESTIONS):
+        return None
+    if session.current_question_index < len(session.question_ids):
+        return None  # A question is already queued
+
+    question = next_question(estimate, session.type, session.question_ids)
+    if question is not None:
+        session.add_question(question)
+    return question
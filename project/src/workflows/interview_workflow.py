@@ -1,32 +1,106 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_openai import ChatOpenAI
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+import hashlib
+import json
+import os
 import random
+import uuid
 from datetime import datetime
 
 from src.models.interview_models import (
-    InterviewState, InterviewSession, Question, Answer, 
-    InterviewType, DifficultyLevel
+    InterviewState, InterviewGraphState, InterviewSession, Question, Answer, Feedback,
+    InterviewType, DifficultyLevel, EnrichmentStatus, AnswerFormat, JobDescription
 )
 from src.data.question_bank import get_questions_by_type, get_questions_by_skills
+from src.data.question_store import GeneratedQuestionStore, normalize_skill
+from src.data.reference_index import LOCAL_CONFIDENCE, reference_confidence
+from src.data.review_scheduler import ReviewScheduler
+from src.workflows import adaptive
+from src.utils.answer_index import AnswerIndex
 from src.utils.feedback_generator import FeedbackGenerator
 from src.utils.job_parser import JobDescriptionParser
+from src.utils.llm_batcher import LLMBatcher
+from src.utils.llm_scheduler import LLMPriority, llm_scheduler
+from src.workflows.checkpointing import SQLiteCheckpointSaver
+
+def _session_id(state: InterviewGraphState) -> Optional[str]:
+    session = state.get("session")
+    return session.id if session else None
+
+# Model types that may be restored from checkpoints
+CHECKPOINT_TYPES = [
+    (cls.__module__, cls.__name__) for cls in (
+        InterviewSession, Question, Answer, Feedback, JobDescription,
+        InterviewType, DifficultyLevel, AnswerFormat, EnrichmentStatus
+    )
+]
+
+# Estimated Jaccard similarity above which an answer is flagged as a near-duplicate,
+# and above which an earlier answer's LLM enhancement is reused instead of a new call
+DUPLICATE_SIMILARITY = float(os.getenv("ANSWER_DUPLICATE_SIMILARITY", "0.8"))
+REUSE_SIMILARITY = float(os.getenv("ANSWER_REUSE_SIMILARITY", "0.95"))
+
+def _answer_key(session_id: Optional[str], question_id: str, text: str) -> str:
+    """Index key of an answer; without a session the answer text identifies it"""
+    if session_id is None:
+        session_id = "text-" + hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+    return f"{session_id}:{question_id}"
+
+# Skills with fewer matching questions than this get generated ones
+QUESTIONS_PER_SKILL = int(os.getenv("GENERATED_QUESTIONS_PER_SKILL", "3"))
+
+# Interactive sessions stop here; answers are then collected by the API or CLI
+INTERACTIVE_INTERRUPT = ["collect_answer"]
+
+def _new_session_id() -> str:
+    return f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+def _thread_config(session_id: str) -> Dict[str, Any]:
+    """Checkpoints are keyed by session id so sessions can be resumed after a restart"""
+    return {"configurable": {"thread_id": session_id}}
+
+def _to_interview_state(values: Dict[str, Any]) -> InterviewState:
+    """Wrap final graph values in the public InterviewState without re-validating them"""
+    fields = {key: value for key, value in values.items() if key in InterviewState.model_fields}
+    return InterviewState.model_construct(**fields)
 
 class InterviewWorkflow:
     """LangGraph-based interview workflow"""
     
-    def __init__(self, openai_api_key: str):
+    def __init__(self, openai_api_key: str, checkpoint_path: Optional[str] = None,
+                 review_scheduler: Optional[ReviewScheduler] = None,
+                 question_store: Optional[GeneratedQuestionStore] = None):
         self.llm = ChatOpenAI(
             api_key=openai_api_key,
             model="gpt-4",
             temperature=0.7
         )
+        # Question presentations are coalesced across sessions that start together
+        self.batcher = LLMBatcher(
+            self.llm,
+            window=float(os.getenv("LLM_BATCH_WINDOW_MS", "20")) / 1000
+        )
+        # Without a checkpoint path, interviews only live for one run_interview call
+        self.checkpointer = None
+        if checkpoint_path:
+            self.checkpointer = SQLiteCheckpointSaver(
+                checkpoint_path,
+                serde=JsonPlusSerializer(allowed_msgpack_modules=CHECKPOINT_TYPES)
+            )
+        # Spaced-repetition schedules pick questions for identified users
+        self.review_scheduler = review_scheduler
+        # Generated questions for job skills the bank does not cover
+        self.question_store = question_store
+        # Near-duplicate answers across sessions, keyed by session and question
+        self.answer_index = AnswerIndex()
         self.workflow = self._build_workflow()
     
     def _build_workflow(self) -> StateGraph:
         """Build the LangGraph workflow"""
-        workflow = StateGraph(InterviewState)
+        workflow = StateGraph(InterviewGraphState)
         
         # Add nodes
         workflow.add_node("parse_job_description", self._parse_job_description)
@@ -62,215 +136,444 @@ class InterviewWorkflow:
         # Set entry point
         workflow.set_entry_point("parse_job_description")
         
-        return workflow.compile()
+        return workflow.compile(checkpointer=self.checkpointer)
     
-    def _parse_job_description(self, state: InterviewState) -> InterviewState:
+    def _invoke_llm(self, prompt: str, priority: LLMPriority, session_id: Optional[str] = None) -> str:
+        """Send a prompt to the LLM through the process-wide scheduler"""
+        with llm_scheduler.slot(priority, session_id):
+            response = self.llm.invoke([HumanMessage(content=prompt)])
+        return response.content
+    
+    def _stream_llm(self, prompt: str, priority: LLMPriority, session_id: Optional[str] = None) -> Iterator[str]:
+        """Stream response tokens; the scheduler slot is held until the stream is exhausted or closed"""
+        with llm_scheduler.slot(priority, session_id):
+            for chunk in self.llm.stream([HumanMessage(content=prompt)]):
+                if chunk.content:
+                    yield chunk.content
+    
+    def _parse_job_description(self, state: InterviewGraphState) -> Dict[str, Any]:
         """Parse job description if provided"""
-        if "job_description_text" in state.context:
-            job_desc = JobDescriptionParser.parse(state.context["job_description_text"])
-            state.job_description = job_desc
-            state.context["research_tips"] = JobDescriptionParser.generate_research_tips(job_desc)
-        
-        state.workflow_step = "job_parsed"
-        return state
+        context = state.get("context", {})
+        if not context.get("job_description_text"):
+            return {"workflow_step": "job_parsed"}
+        
+        job_desc = JobDescriptionParser.parse(context["job_description_text"])
+        return {
+            "job_description": job_desc,
+            "context": {"research_tips": JobDescriptionParser.generate_research_tips(job_desc)},
+            "workflow_step": "job_parsed"
+        }
     
-    def _initialize_session(self, state: InterviewState) -> InterviewState:
+    def _initialize_session(self, state: InterviewGraphState) -> Dict[str, Any]:
         """Initialize interview session"""
-        session_config = state.context.get("session_config", {})
+        session_config = state.get("context", {}).get("session_config", {})
         
         session = InterviewSession(
-            id=f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            id=state.get("context", {}).get("session_id") or _new_session_id(),
+            user_id=session_config.get("user_id"),
             job_role=session_config.get("job_role", "Software Engineer"),
             difficulty=DifficultyLevel(session_config.get("difficulty", "intermediate")),
             type=InterviewType(session_config.get("type", "mixed")),
-            questions=[]
+            questions=[],
+            adaptive=bool(session_config.get("adaptive")),
+            max_questions=session_config.get("question_count", 5)
         )
         
+        if session.adaptive:
+            # Questions are picked one at a time from the running skill estimate
+            first = adaptive.first_question(session)
+            session.questions = [first] if first else []
+            return {"session": session, "workflow_step": "session_initialized"}
+        
         # Select questions based on job description or session config
-        if state.job_description and state.job_description.skills:
-            questions = get_questions_by_skills(state.job_description.skills)
-        else:
+        job_description = state.get("job_description")
+        questions = []
+        if job_description and job_description.skills:
+            questions = get_questions_by_skills(job_description.skills)
+            if self.question_store is not None:
+                # Callers that defer expansion run it in the background; this session uses what is stored now
+                if not state.get("context", {}).get("defer_question_expansion"):
+                    self.expand_questions(job_description.skills, session.difficulty, session.id)
+                questions += self.question_store.by_skills(job_description.skills)
+        if not questions:
+            # No job description, or none of its skills are covered yet
             questions = get_questions_by_type(session.type, session.difficulty)
         
-        # Shuffle and limit questions
-        random.shuffle(questions)
-        session.questions = questions[:session_config.get("question_count", 5)]
+        # Due reviews first for known users; otherwise shuffle and limit questions
+        question_count = session_config.get("question_count", 5)
+        if session.user_id and self.review_scheduler:
+            session.questions = self.review_scheduler.select(session.user_id, questions, question_count)
+        else:
+            random.shuffle(questions)
+            session.questions = questions[:question_count]
         
-        state.session = session
-        state.workflow_step = "session_initialized"
-        return state
+        return {"session": session, "workflow_step": "session_initialized"}
+    
+    def uncovered_skills(self, skills: List[str]) -> List[str]:
+        """Skills with fewer than QUESTIONS_PER_SKILL bank or generated questions"""
+        missing = []
+        for skill in dict.fromkeys(normalize_skill(skill) for skill in skills):
+            covered = len(get_questions_by_skills([skill]))
+            if self.question_store is not None:
+                covered += self.question_store.count(skill)
+            if covered < QUESTIONS_PER_SKILL:
+                missing.append(skill)
+        return missing
     
-    def _select_question(self, state: InterviewState) -> InterviewState:
+    @staticmethod
+    def _expansion_prompt(skills: List[str], difficulty: DifficultyLevel) -> str:
+        return f"""
+        Write {QUESTIONS_PER_SKILL} distinct interview questions for each of these skills: {', '.join(skills)}.
+        Aim for {DifficultyLevel(difficulty).value} difficulty unless a skill calls for another level.
+        
+        Respond with JSON only, in this shape:
+        {{"questions": [{{"skill": "<one of the skills above>", "text": "<question>",
+          "type": "technical|behavioral|design", "difficulty": "beginner|intermediate|advanced",
+          "time_limit": <seconds to answer, 60-900>, "expected_answer_format": "technical|star|general",
+          "key_points": ["<3-5 short points a strong answer covers>"]}}]}}
+        """
+    
+    def expand_questions(self, skills: List[str], difficulty: DifficultyLevel = DifficultyLevel.INTERMEDIATE,
+                         session_id: Optional[str] = None,
+                         priority: LLMPriority = LLMPriority.INTERACTIVE) -> List[Question]:
+        """Generate questions for uncovered skills in one LLM call and keep them in the question store.
+        
+        Returns the newly stored questions. Generation failures are not fatal: the
+        session simply goes ahead with the questions that already exist.
+        """
+        if self.question_store is None:
+            return []
+        # Claimed skills are held back briefly so concurrent sessions do not generate them twice;
+        # the long cooldown only starts once the LLM has returned usable output
+        missing = sorted(self.question_store.claim(self.uncovered_skills(skills)))
+        if not missing:
+            return []
+        
+        try:
+            response = self.batcher.invoke(self._expansion_prompt(missing, difficulty), priority, session_id)
+            items = json.loads(response[response.index("{"):response.rindex("}") + 1])["questions"]
+        except Exception:
+            # Unparseable output or an LLM outage; go ahead with the existing questions and
+            # let the skills be retried after the short failure backoff
+            return []
+        
+        self.question_store.settle(missing)
+        added = []
+        allowed = set(missing)
+        for item in items if isinstance(items, list) else []:
+            if isinstance(item, dict) and normalize_skill(str(item.get("skill", ""))) in allowed:
+                defaults = {"type": InterviewType.TECHNICAL, "difficulty": difficulty}
+                question = self.question_store.add(item["skill"], {**defaults, **item})
+                if question is not None:
+                    added.append(question)
+        self.question_store.maybe_save()
+        return added
+    
+    def _select_question(self, state: InterviewGraphState) -> Dict[str, Any]:
         """Select the next question"""
-        if not state.session:
+        session = state.get("session")
+        if not session:
             raise ValueError("Session not initialized")
         
-        if state.session.current_question_index < len(state.session.questions):
-            state.current_question = state.session.questions[state.session.current_question_index]
-            state.workflow_step = "question_selected"
-        else:
-            state.workflow_step = "interview_complete"
-        
-        return state
+        if session.current_question_index < len(session.questions):
+            return {
+                "current_question": session.questions[session.current_question_index],
+                "workflow_step": "question_selected"
+            }
+        return {"workflow_step": "interview_complete"}
     
-    def _present_question(self, state: InterviewState) -> InterviewState:
+    def _present_question(self, state: InterviewGraphState) -> Dict[str, Any]:
         """Present question to user with context"""
-        if not state.current_question:
-            return state
+        question = state.get("current_question")
+        if not question:
+            return {}
         
         # Generate contextual question presentation using LLM
-        prompt = f"""
-        Present this interview question in a professional and engaging way:
-        
-        Question: {state.current_question.text}
-        Type: {state.current_question.type}
-        Difficulty: {state.current_question.difficulty}
-        Category: {state.current_question.category}
-        
-        Provide any helpful context or tips for answering this question.
-        If this is a behavioral question, remind about the STAR method.
-        """
-        
-        response = self.llm.invoke([HumanMessage(content=prompt)])
-        state.context["question_presentation"] = response.content
-        state.workflow_step = "question_presented"
-        
-        return state
+        presentation = self.present_question(question, _session_id(state))
+        return {
+            "context": {"question_presentation": presentation},
+            "workflow_step": "question_presented"
+        }
     
-    def _collect_answer(self, state: InterviewState) -> InterviewState:
+    def _collect_answer(self, state: InterviewGraphState) -> Dict[str, Any]:
         """Collect user's answer"""
         # In a real implementation, this would collect user input
         # For now, we'll use the user_input from state
-        if not state.current_question:
-            return state
+        question = state.get("current_question")
+        if not question:
+            return {}
         
+        context = state.get("context", {})
         answer = Answer(
-            question_id=state.current_question.id,
-            text=state.user_input,
-            time_spent=state.context.get("time_spent", 120),
-            confidence=state.context.get("confidence", 70)
+            question_id=question.id,
+            text=state.get("user_input", ""),
+            time_spent=context.get("time_spent", 120),
+            confidence=context.get("confidence", 70)
         )
         
-        state.current_answer = answer
-        state.workflow_step = "answer_collected"
-        
-        return state
+        return {"current_answer": answer, "workflow_step": "answer_collected"}
     
-    def _generate_feedback(self, state: InterviewState) -> InterviewState:
+    def _generate_feedback(self, state: InterviewGraphState) -> Dict[str, Any]:
         """Generate AI-powered feedback"""
-        if not state.current_answer or not state.current_question:
-            return state
+        question = state.get("current_question")
+        answer = state.get("current_answer")
+        if not answer or not question:
+            return {}
         
         # Generate feedback using our feedback generator
-        feedback = FeedbackGenerator.generate_feedback(
-            state.current_answer, 
-            state.current_question
-        )
+        feedback = FeedbackGenerator.generate_feedback(answer, question)
+        self.flag_duplicate(question, answer, feedback, _session_id(state))
+        
+        # Enhance feedback with LLM unless local scoring is confident
+        if self.needs_enhancement(feedback):
+            feedback.overall_assessment = self.enhance_feedback(
+                question, answer, feedback, _session_id(state)
+            )
+        
+        answer.feedback = feedback
+        return {
+            "current_answer": answer,
+            "feedback": feedback,
+            "workflow_step": "feedback_generated"
+        }
+    
+    @staticmethod
+    def _presentation_prompt(question: Question) -> str:
+        return f"""
+        Present this interview question in a professional and engaging way:
         
-        # Enhance feedback with LLM
-        prompt = f"""
+        Question: {question.text}
+        Type: {question.type}
+        Difficulty: {question.difficulty}
+        Category: {question.category}
+        
+        Provide any helpful context or tips for answering this question.
+        If this is a behavioral question, remind about the STAR method.
+        """
+    
+    def present_question(self, question: Question, session_id: Optional[str] = None) -> str:
+        """Generate the presentation for a question (batched with other sessions)"""
+        return self.batcher.invoke(self._presentation_prompt(question), LLMPriority.INTERACTIVE, session_id)
+    
+    def stream_question_presentation(self, question: Question, session_id: Optional[str] = None) -> Iterator[str]:
+        """Stream the presentation for a question token by token"""
+        return self._stream_llm(self._presentation_prompt(question), LLMPriority.INTERACTIVE, session_id)
+    
+    @staticmethod
+    def _feedback_prompt(question: Question, answer: Answer, feedback: Feedback) -> str:
+        return f"""
         Enhance this interview feedback with more personalized insights:
         
-        Question: {state.current_question.text}
-        Answer: {state.current_answer.text}
+        Question: {question.text}
+        Answer: {answer.text}
         Current Score: {feedback.score}
         Current Strengths: {', '.join(feedback.strengths)}
         Current Improvements: {', '.join(feedback.improvements)}
         
         Provide additional specific, actionable feedback that would help this candidate improve.
         """
-        
-        response = self.llm.invoke([HumanMessage(content=prompt)])
-        feedback.overall_assessment = response.content
-        
-        state.current_answer.feedback = feedback
-        state.feedback = feedback
-        state.workflow_step = "feedback_generated"
-        
-        return state
     
-    def _generate_followup(self, state: InterviewState) -> InterviewState:
-        """Generate contextual follow-up questions"""
-        if not state.current_question or not state.current_answer:
-            return state
-        
-        # Use LLM to generate intelligent follow-ups
-        prompt = f"""
+    def flag_duplicate(self, question: Question, answer: Answer, feedback: Feedback,
+                       session_id: Optional[str] = None) -> None:
+        """Index the answer and flag the feedback if it nearly repeats an earlier answer to the question"""
+        match = self.answer_index.add(
+            _answer_key(session_id, question.id, answer.text), question.id, answer.text, DUPLICATE_SIMILARITY
+        )
+        if match:
+            feedback.duplicate_similarity = round(match.similarity, 2)
+            feedback.improvements.append(
+                "This answer closely matches an earlier submission - make it your own with personal examples"
+            )
+    
+    @staticmethod
+    def needs_enhancement(feedback: Feedback) -> bool:
+        """Whether to ask the LLM; confident reference-based feedback is kept as is"""
+        return reference_confidence(feedback.reference_similarity, feedback.key_point_coverage) < LOCAL_CONFIDENCE
+    
+    def enhance_feedback(self, question: Question, answer: Answer, feedback: Feedback,
+                         session_id: Optional[str] = None) -> str:
+        """Ask the LLM for a personalized assessment on top of heuristic feedback"""
+        reused = self.answer_index.enhancement_for(question.id, answer.text, REUSE_SIMILARITY)
+        if reused is not None:
+            return reused
+        assessment = self._invoke_llm(self._feedback_prompt(question, answer, feedback), LLMPriority.FEEDBACK, session_id)
+        self.answer_index.set_enhancement(_answer_key(session_id, question.id, answer.text), assessment)
+        return assessment
+    
+    def stream_feedback(self, question: Question, answer: Answer, feedback: Feedback,
+                        session_id: Optional[str] = None) -> Iterator[str]:
+        """Stream the personalized assessment token by token"""
+        reused = self.answer_index.enhancement_for(question.id, answer.text, REUSE_SIMILARITY)
+        if reused is not None:
+            return iter([reused])
+        return self._stream_and_index(
+            self._stream_llm(self._feedback_prompt(question, answer, feedback), LLMPriority.FEEDBACK, session_id),
+            _answer_key(session_id, question.id, answer.text)
+        )
+    
+    def _stream_and_index(self, tokens: Iterator[str], key: str) -> Iterator[str]:
+        """Pass tokens through, storing the full assessment for reuse once the stream completes"""
+        parts = []
+        for token in tokens:
+            parts.append(token)
+            yield token
+        self.answer_index.set_enhancement(key, "".join(parts))
+    
+    @staticmethod
+    def _followup_prompt(question: Question, answer: Answer) -> str:
+        return f"""
         Based on this interview answer, generate 2-3 relevant follow-up questions:
         
-        Original Question: {state.current_question.text}
-        Candidate's Answer: {state.current_answer.text}
+        Original Question: {question.text}
+        Candidate's Answer: {answer.text}
         
         Generate follow-up questions that would help assess the candidate's depth of knowledge
         and experience related to their answer.
         """
+    
+    def generate_followups(self, question: Question, answer: Answer, session_id: Optional[str] = None) -> str:
+        """Ask the LLM for follow-up questions on an answer"""
+        return self._invoke_llm(self._followup_prompt(question, answer), LLMPriority.FEEDBACK, session_id)
+    
+    def _generate_followup(self, state: InterviewGraphState) -> Dict[str, Any]:
+        """Generate contextual follow-up questions"""
+        question = state.get("current_question")
+        answer = state.get("current_answer")
+        if not question or not answer:
+            return {}
         
-        response = self.llm.invoke([HumanMessage(content=prompt)])
-        state.context["followup_questions"] = response.content
-        
-        # Add answer to session
-        if state.session:
-            state.session.answers.append(state.current_answer)
-            state.session.current_question_index += 1
-        
-        state.workflow_step = "followup_generated"
-        return state
+        # Use LLM to generate intelligent follow-ups
+        update = {
+            "context": {
+                "followup_questions": self.generate_followups(question, answer, _session_id(state))
+            },
+            "workflow_step": "followup_generated"
+        }
+        
+        # Add answer to session; the session is shared by reference, so
+        # returning it only marks the channel as changed
+        session = state.get("session")
+        if session:
+            session.record_answer(answer, question)
+            update["session"] = session
+            if session.user_id and self.review_scheduler and answer.feedback:
+                self.review_scheduler.review(session.user_id, question.id, answer.feedback.score)
+        
+        return update
     
-    def _check_completion(self, state: InterviewState) -> InterviewState:
+    def _check_completion(self, state: InterviewGraphState) -> Dict[str, Any]:
         """Check if interview should continue"""
-        if not state.session:
-            state.workflow_step = "interview_complete"
-            return state
-        
-        if state.session.current_question_index >= len(state.session.questions):
-            state.workflow_step = "interview_complete"
-        else:
-            state.workflow_step = "continue_interview"
-        
-        return state
+        session = state.get("session")
+        if session and session.adaptive:
+            adaptive.advance(session)
+        if not session or session.current_question_index >= len(session.questions):
+            return {"workflow_step": "interview_complete"}
+        return {"workflow_step": "continue_interview"}
     
-    def _should_continue(self, state: InterviewState) -> str:
+    def _should_continue(self, state: InterviewGraphState) -> str:
         """Determine if interview should continue"""
-        return "continue" if state.workflow_step == "continue_interview" else "end"
+        return "continue" if state.get("workflow_step") == "continue_interview" else "end"
     
-    def _finalize_session(self, state: InterviewState) -> InterviewState:
+    def _finalize_session(self, state: InterviewGraphState) -> Dict[str, Any]:
         """Finalize interview session with overall assessment"""
-        if not state.session:
-            return state
+        session = state.get("session")
+        if not session:
+            return {}
         
-        state.session.end_time = datetime.now()
+        session.end_time = datetime.now()
         
-        # Calculate overall score
-        if state.session.answers:
-            total_score = sum(answer.feedback.score for answer in state.session.answers)
-            state.session.score = total_score / len(state.session.answers)
+        # Overall score is maintained incrementally as answers are recorded
+        session.score = session.aggregates.average
         
         # Generate overall session feedback using LLM
-        prompt = f"""
+        session.assessment = self.assess_session(session)
+        session.assessment_status = EnrichmentStatus.COMPLETE
+        
+        return {
+            "session": session,
+            "context": {"overall_assessment": session.assessment},
+            "workflow_step": "session_finalized"
+        }
+    
+    @staticmethod
+    def _assessment_prompt(session: InterviewSession) -> str:
+        return f"""
         Generate an overall interview assessment based on these answers:
         
-        Job Role: {state.session.job_role}
-        Number of Questions: {len(state.session.questions)}
-        Average Score: {state.session.score:.1f}
+        Job Role: {session.job_role}
+        Number of Questions: {len(session.questions)}
+        Average Score: {session.score or 0:.1f}
         
-        Individual Scores: {[answer.feedback.score for answer in state.session.answers]}
+        Individual Scores: {[answer.feedback.score for answer in session.answers]}
         
         Provide a comprehensive assessment of the candidate's performance,
         highlighting key strengths and areas for improvement.
         """
-        
-        response = self.llm.invoke([HumanMessage(content=prompt)])
-        state.context["overall_assessment"] = response.content
-        
-        state.workflow_step = "session_finalized"
-        return state
+    
+    def assess_session(self, session: InterviewSession) -> str:
+        """Generate the overall LLM assessment for a finished session"""
+        return self._invoke_llm(self._assessment_prompt(session), LLMPriority.BACKGROUND, session.id)
+    
+    def stream_session_assessment(self, session: InterviewSession) -> Iterator[str]:
+        """Stream the overall assessment token by token"""
+        return self._stream_llm(self._assessment_prompt(session), LLMPriority.BACKGROUND, session.id)
     
     def run_interview(self, config: Dict[str, Any]) -> InterviewState:
         """Run the complete interview workflow"""
-        initial_state = InterviewState(
-            context=config,
-            workflow_step="start"
-        )
+        config = {**config, "session_id": config.get("session_id") or _new_session_id()}
+        initial_state: InterviewGraphState = {
+            "context": config,
+            "workflow_step": "start"
+        }
+        
+        final_state = self.workflow.invoke(initial_state, _thread_config(config["session_id"]))
+        return _to_interview_state(final_state)
+    
+    def start_session(self, config: Dict[str, Any],
+                      interrupt_before: Optional[List[str]] = None) -> InterviewState:
+        """Run the workflow up to the first answer and return the initialized session.
         
-        final_state = self.workflow.invoke(initial_state)
-        return final_state
\ No newline at end of file
+        The remaining steps are driven by the caller (API or CLI), one answer at a time.
+        Pass ``interrupt_before=["present_question"]`` to present questions yourself.
+        """
+        config = {**config, "session_id": config.get("session_id") or _new_session_id(), "interactive": True}
+        initial_state: InterviewGraphState = {
+            "context": config,
+            "workflow_step": "start"
+        }
+        
+        state = self.workflow.invoke(
+            initial_state, _thread_config(config["session_id"]),
+            interrupt_before=interrupt_before or INTERACTIVE_INTERRUPT
+        )
+        return _to_interview_state(state)
+    
+    def resume_interview(self, session_id: str, finish_interrupted: bool = False) -> Optional[InterviewState]:
+        """Restore an interview from its last checkpoint.
+        
+        A non-interactive run that was cut off is only finished when
+        ``finish_interrupted`` is set, since that runs the rest of the graph
+        (LLM calls included); otherwise its state comes back as checkpointed
+        with ``context["run_interrupted"]`` set so the caller can finish it
+        in the background.
+        """
+        if not self.checkpointer:
+            return None
+        
+        thread_config = _thread_config(session_id)
+        snapshot = self.workflow.get_state(thread_config)
+        if not snapshot.values:
+            return None
+        
+        # Interactive sessions are paused on purpose; only runs that were cut off need finishing
+        context = snapshot.values.get("context", {})
+        if snapshot.next and not context.get("interactive"):
+            if finish_interrupted:
+                return _to_interview_state(self.workflow.invoke(None, thread_config))
+            return _to_interview_state({**snapshot.values, "context": {**context, "run_interrupted": True}})
+        return _to_interview_state(snapshot.values)
+    
+    def save_session(self, session: InterviewSession) -> None:
+        """Checkpoint session progress made outside the graph (only the session channel is written)"""
+        if self.checkpointer:
+            self.workflow.update_state(_thread_config(session.id), {"session": session})
\ No newline at end of file
@@ -0,0 +1,11 @@
+import pytest
+
+from scripts.check_feedback_parity import build_cases, compare, typescript_unavailable
+
+
+@pytest.mark.skipif(typescript_unavailable() is not None, reason=typescript_unavailable() or "")
+def test_python_and_typescript_feedback_agree():
+    mismatches, adjusted, bank_cases = compare(build_cases(300))
+    assert not mismatches, mismatches[:3]
+    # Bank questions with references are covered, and the server-only adjustment really fires on them
+    assert bank_cases and adjusted
@@ -0,0 +1,51 @@
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from src.data.question_bank import current_snapshot
+from src.models.compact_session import CompactSession
+from src.models.interview_models import Answer, InterviewSession, Question
+from src.utils.feedback_generator import FeedbackGenerator
+from src.workflows.interview_workflow import CHECKPOINT_TYPES
+
+
+def _checkpoint_round_trip(session: InterviewSession) -> InterviewSession:
+    """Serialize a session the way the checkpointer does, as after a restart"""
+    serde = JsonPlusSerializer(allowed_msgpack_modules=CHECKPOINT_TYPES)
+    return serde.loads_typed(serde.dumps_typed(session))
+
+
+def _referenced_question() -> Question:
+    return next(q for q in current_snapshot().questions if q.key_points)
+
+
+def _score(session: CompactSession, question_id: str):
+    question = session.get_question(question_id)
+    answer = Answer(question_id=question_id, text=" ".join(question.key_points), time_spent=120, confidence=70)
+    return FeedbackGenerator.generate_feedback(answer, question)
+
+
+def test_restored_session_keeps_reference_scoring():
+    question = _referenced_question()
+    session = InterviewSession(id="restore", job_role="Dev", difficulty="intermediate", type="mixed",
+                               questions=[question])
+    restored = _checkpoint_round_trip(session)
+    assert restored.questions[0].key_points == []  # dropped by serialization
+
+    fresh = _score(CompactSession.from_session(session), question.id)
+    resumed = _score(CompactSession.from_session(restored), question.id)
+    assert resumed.key_point_coverage is not None
+    assert resumed.score == fresh.score
+    assert resumed.key_point_coverage == fresh.key_point_coverage
+
+
+def test_restored_generated_question_comes_from_store():
+    generated = Question(id="gen-terraform-1", text="How do you manage Terraform state across teams?",
+                         type="technical", difficulty="intermediate", category="Terraform",
+                         key_points=["remote state backend", "state locking"])
+    session = InterviewSession(id="restore-gen", job_role="Dev", difficulty="intermediate", type="mixed",
+                               questions=[generated])
+    restored = _checkpoint_round_trip(session)
+
+    compact = CompactSession.from_session(restored, restore_from={generated.id: generated})
+    assert compact.get_question(generated.id) is generated
+    # Without a source it stays a (reference-less) extra question rather than failing
+    assert CompactSession.from_session(restored).get_question(generated.id).key_points == []